@@ -5,13 +5,25 @@ Provides a wrapper around the GitLab v4 API with error handling and pagination s
 """
 from __future__ import annotations
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from urllib.parse import quote
+import threading
+import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
+# Maximum number of keep-alive connections held open to the GitLab host.
+# Must be at least the number of threads sharing one client (for example
+# CommitFinder workers), otherwise surplus connections are discarded and
+# every request pays a fresh TCP + TLS handshake.
+DEFAULT_POOL_MAXSIZE = 32
+
+# Default client-side cap on requests per second (0 disables throttling)
+DEFAULT_RATE_LIMIT = 10.0
+
+
 class GitLabAPIError(Exception):
     """Base exception for GitLab API errors."""
     def __init__(self, message: str, status_code: Optional[int] = None):
@@ -34,6 +46,42 @@ class GitLabForbidden(GitLabAPIError):
     pass
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Allows bursts of up to ``burst`` requests, then spaces requests out to
+    ``rate`` per second. Callers that find the bucket empty reserve a token
+    and sleep until it is due, so concurrent callers queue fairly.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (default: one second's worth of tokens)
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
 class GitLabClient:
     """
     Client for interacting with GitLab API v4.
@@ -49,6 +97,8 @@ class GitLabClient:
         api_version: str = "v4",
         verify_ssl: bool = True,
         timeout_seconds: int = 15,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
     ):
         """
         Initialize GitLab API client.
@@ -59,24 +109,34 @@ class GitLabClient:
             api_version: API version (default: v4)
             verify_ssl: Whether to verify SSL certificates
             timeout_seconds: Request timeout in seconds
+            pool_maxsize: Maximum number of pooled keep-alive connections
+            rate_limit: Maximum requests per second (0 disables throttling)
         """
         self.base_url = base_url.rstrip("/")
         self.api_base = f"{self.base_url}/api/{api_version}"
         self.private_token = private_token
         self.verify_ssl = verify_ssl
         self.timeout = timeout_seconds
+        
+        # Throttle proactively so bursts of concurrent requests stay under
+        # the server's rate limit instead of tripping 429s
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit > 0 else None
 
         # Create session with retry logic
         self.session = requests.Session()
         
-        # Configure retries for connection errors and specific HTTP codes
+        # Configure retries for connection errors and specific HTTP codes.
+        # Retry honours the Retry-After header GitLab sends with 429s.
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=pool_maxsize,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -86,6 +146,16 @@ class GitLabClient:
             "Content-Type": "application/json",
         })
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "GitLabClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _make_request(
         self,
         method: str,
@@ -110,6 +180,9 @@ class GitLabClient:
         """
         url = f"{self.api_base}/{endpoint.lstrip('/')}"
         
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        
         try:
             response = self.session.request(
                 method=method,
@@ -176,14 +249,33 @@ class GitLabClient:
         Returns:
             List of all items across all pages
         """
+        return list(self._iter_paginated(endpoint, params=params, per_page=per_page))
+
+    def _iter_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the items of a paginated API endpoint, one page at a time.
+
+        The next page is only requested once the current one is consumed.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Items per page (max 100)
+
+        Yields:
+            Items across all pages
+        """
         if params is None:
             params = {}
         
         params["per_page"] = min(per_page, 100)
         params["page"] = 1
         
-        all_items = []
-        
         while True:
             response = self._make_request("GET", endpoint, params=params)
             items = response.json()
@@ -191,15 +283,13 @@ class GitLabClient:
             if not items:
                 break
             
-            all_items.extend(items)
+            yield from items
             
             # Check if there are more pages
             if "x-next-page" in response.headers and response.headers["x-next-page"]:
                 params["page"] = int(response.headers["x-next-page"])
             else:
                 break
-        
-        return all_items
 
     def get_project_by_id(self, project_id: int) -> Dict[str, Any]:
         """
@@ -370,6 +460,39 @@ class GitLabClient:
         
         return self._get_paginated(endpoint, params=params, per_page=per_page)
 
+    def iter_commit_shas(
+        self,
+        project_id: int,
+        ref_name: str,
+        per_page: int = 100
+    ) -> Iterator[str]:
+        """
+        Iterate over the SHAs of all commits reachable from a ref.
+
+        Like list_commits_from_ref, but only the SHA of each commit is kept,
+        so callers that just need SHAs (e.g. the base side of a delta) don't
+        hold every commit's full metadata in memory.
+
+        Args:
+            project_id: GitLab project ID
+            ref_name: Branch name, tag name, or commit SHA to list commits from
+            per_page: Items per page (max 100)
+
+        Yields:
+            Full commit SHAs
+
+        Raises:
+            GitLabNotFound: If project or ref doesn't exist
+            GitLabAPIError: For other API errors
+        """
+        endpoint = f"projects/{project_id}/repository/commits"
+        params = {
+            "ref_name": ref_name,
+        }
+        
+        for commit in self._iter_paginated(endpoint, params=params, per_page=per_page):
+            yield commit["id"]
+
     def compare_refs(
         self,
         project_id: int,
@@ -0,0 +1,120 @@
+"""
+Local response cache for GitDoctor.
+
+Persists GitLab commit metadata and commit refs between runs so that
+repeated searches over the same commit list don't hit the API again.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".gitdoctor-cache"
+
+# Commits are addressed by SHA and never change, so they are kept forever.
+# Branches and tags move (and commits get pushed to new projects), so refs
+# and "commit not found" results are only trusted for a short while.
+REFS_TTL_SECONDS = 15 * 60
+
+
+class CommitCache:
+    """
+    SQLite-backed cache of commit and ref lookups keyed by (project_id, sha).
+
+    Safe to share between the worker threads of a CommitFinder.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        refs_ttl_seconds: float = REFS_TTL_SECONDS
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            refs_ttl_seconds: How long cached commit refs stay valid
+        """
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.path = cache_dir / "commits.sqlite3"
+        self.refs_ttl_seconds = refs_ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " kind TEXT NOT NULL,"
+                " project_id INTEGER NOT NULL,"
+                " sha TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " ttl REAL,"
+                " PRIMARY KEY (kind, project_id, sha))"
+            )
+
+    def get_commit(self, project_id: int, sha: str) -> Optional[Dict[str, Any]]:
+        """Return cached commit data, or None on a miss."""
+        return self._get("commit", project_id, sha)
+
+    def set_commit(self, project_id: int, sha: str, data: Dict[str, Any]) -> None:
+        """Store commit data. Commit entries never expire."""
+        self._set("commit", project_id, sha, data, ttl=None)
+
+    def get_refs(self, project_id: int, sha: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached refs containing a commit, or None on a miss or expiry."""
+        return self._get("refs", project_id, sha)
+
+    def set_refs(self, project_id: int, sha: str, refs: List[Dict[str, Any]]) -> None:
+        """Store the refs containing a commit."""
+        self._set("refs", project_id, sha, refs, ttl=self.refs_ttl_seconds)
+
+    def is_missing(self, project_id: int, sha: str) -> bool:
+        """Whether a commit was recently found not to exist in a project."""
+        return self._get("missing", project_id, sha) is not None
+
+    def set_missing(self, project_id: int, sha: str) -> None:
+        """
+        Record that a commit does not exist in a project.
+
+        Uses the refs TTL, since the commit may be pushed there later.
+        """
+        self._set("missing", project_id, sha, True, ttl=self.refs_ttl_seconds)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, kind: str, project_id: int, sha: str) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, stored_at, ttl FROM entries "
+                "WHERE kind = ? AND project_id = ? AND sha = ?",
+                (kind, project_id, sha)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        data, stored_at, ttl = row
+        if ttl is not None and time.time() - stored_at > ttl:
+            return None
+        return json.loads(data)
+
+    def _set(self, kind: str, project_id: int, sha: str, data: Any, ttl: Optional[float]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(kind, project_id, sha, data, stored_at, ttl) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, project_id, sha, json.dumps(data), time.time(), ttl)
+            )
@@ -3,26 +3,39 @@ Command-line interface for GitDoctor.
 """
 
 import argparse
+import contextlib
 import csv
+import heapq
 import logging
 import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from . import __version__
 from .config import load_config, ConfigError
-from .api_client import GitLabClient, GitLabAPIError
-from .project_resolver import resolve_projects
-from .commit_finder import CommitFinder, CommitSearchResult, load_commit_shas_from_file
-from .delta_finder import DeltaFinder
-from .delta_exporter import get_exporter, get_mr_exporter
-from .mr_finder import MRFinder
-from .mr_changes_finder import MRChangesFinder
-from .mr_changes_exporter import get_mr_changes_exporter
-from .models import DeltaSummary, MRSummary, MRChangesResult
-from .jira_integration import create_jira_linker
-from .notifications import create_slack_notifier, create_teams_notifier
+
+# Command-specific modules (and the requests stack behind api_client) are
+# imported inside the handlers that use them, so `--help`, `--version` and
+# argument errors don't pay for importing every subcommand.
+if TYPE_CHECKING:
+    from .commit_finder import CommitSearchResult
+
+
+class CLIError(Exception):
+    """
+    Raised by command handlers to abort with a logged message.
+
+    Handlers raise this instead of calling ``sys.exit`` directly so that
+    resources registered for cleanup (e.g. the GitLab HTTP session) are
+    released before the process exits. It is caught once in ``main()``,
+    which logs the message at ``level``.
+    """
+    def __init__(self, message: str, exit_code: int = 1, level: int = logging.ERROR):
+        super().__init__(message)
+        self.exit_code = exit_code
+        self.level = level
 
 
 # Configure logging
@@ -148,13 +161,19 @@ def validate_date_range(after_date: Optional[str], before_date: Optional[str]) -
     return after_date_iso, before_date_iso
 
 
-def write_results_to_csv(results: List[CommitSearchResult], output_path: str):
+def write_results_to_csv(results: Iterable["CommitSearchResult"], output_path: str) -> int:
     """
     Write search results to a CSV file.
 
+    Rows are written as results arrive, so a lazy iterable (e.g. from
+    CommitFinder.iter_search_commits) is streamed without being buffered.
+
     Args:
-        results: List of CommitSearchResult objects
+        results: Iterable of CommitSearchResult objects
         output_path: Path to output CSV file
+
+    Returns:
+        Number of rows written
     """
     logger = logging.getLogger(__name__)
     
@@ -177,28 +196,31 @@ def write_results_to_csv(results: List[CommitSearchResult], output_path: str):
 
     try:
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             
+            rows_written = 0
             for result in results:
-                writer.writerow({
-                    "commit_sha": result.commit_sha,
-                    "project_id": result.project_id,
-                    "project_name": result.project_name,
-                    "project_path": result.project_path,
-                    "project_web_url": result.project_web_url,
-                    "commit_web_url": result.commit_web_url,
-                    "author_name": result.author_name,
-                    "author_email": result.author_email,
-                    "title": result.title,
-                    "created_at": result.created_at,
-                    "branches": result.branches,
-                    "tags": result.tags,
-                    "found": result.found,
-                    "error": result.error,
-                })
+                writer.writerow((
+                    result.commit_sha,
+                    result.project_id,
+                    result.project_name,
+                    result.project_path,
+                    result.project_web_url,
+                    result.commit_web_url,
+                    result.author_name,
+                    result.author_email,
+                    result.title,
+                    result.created_at,
+                    result.branches,
+                    result.tags,
+                    result.found,
+                    result.error,
+                ))
+                rows_written += 1
         
         logger.info(f"Results written to {output_path}")
+        return rows_written
     except Exception as e:
         logger.error(f"Failed to write CSV output: {e}")
         raise
@@ -206,7 +228,13 @@ def write_results_to_csv(results: List[CommitSearchResult], output_path: str):
 
 def handle_search_command(args):
     """Handle the search subcommand (original functionality)."""
+    import sqlite3
+    from .api_client import GitLabClient, GitLabAPIError
+    from .project_resolver import resolve_projects
+    from .commit_finder import CommitFinder, load_commit_shas_from_file
+    from .cache import CommitCache, DEFAULT_CACHE_DIR
     logger = logging.getLogger(__name__)
+    resources = contextlib.ExitStack()
     
     try:
         # Step 1: Load configuration
@@ -214,12 +242,12 @@ def handle_search_command(args):
         try:
             config = load_config(args.config)
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {args.config}")
-            logger.error("Please create a config.yaml file. See config.example.yaml for reference.")
-            sys.exit(1)
+            raise CLIError(
+                f"Configuration file not found: {args.config}\n"
+                "Please create a config.yaml file. See config.example.yaml for reference."
+            )
         except ConfigError as e:
-            logger.error(f"Configuration error: {e}")
-            sys.exit(1)
+            raise CLIError(f"Configuration error: {e}")
 
         logger.info(f"  Mode: {config.scan.mode}")
         logger.info(f"  GitLab: {config.gitlab.base_url}")
@@ -232,7 +260,9 @@ def handle_search_command(args):
             api_version=config.gitlab.api_version,
             verify_ssl=config.gitlab.verify_ssl,
             timeout_seconds=config.gitlab.timeout_seconds,
+            rate_limit=config.gitlab.rate_limit,
         )
+        resources.callback(client.close)
 
         # Test connection
         try:
@@ -240,20 +270,17 @@ def handle_search_command(args):
             client.test_connection()
             logger.info("  Connection successful")
         except GitLabAPIError as e:
-            logger.error(f"Failed to connect to GitLab: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to connect to GitLab: {e}")
 
         # Step 3: Resolve projects to search
         logger.info("Resolving projects to search...")
         try:
             projects = resolve_projects(config, client)
         except GitLabAPIError as e:
-            logger.error(f"Failed to resolve projects: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to resolve projects: {e}")
 
         if not projects:
-            logger.error("No projects found to search. Check your configuration.")
-            sys.exit(1)
+            raise CLIError("No projects found to search. Check your configuration.")
 
         logger.info(f"  Will search across {len(projects)} projects")
         if args.verbose:
@@ -267,15 +294,12 @@ def handle_search_command(args):
         try:
             commit_shas = load_commit_shas_from_file(args.commits_file)
         except FileNotFoundError:
-            logger.error(f"Commits file not found: {args.commits_file}")
-            sys.exit(1)
+            raise CLIError(f"Commits file not found: {args.commits_file}")
         except IOError as e:
-            logger.error(f"Failed to read commits file: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to read commits file: {e}")
 
         if not commit_shas:
-            logger.error("No commit SHAs found in input file")
-            sys.exit(1)
+            raise CLIError("No commit SHAs found in input file")
 
         logger.info(f"  Loaded {len(commit_shas)} commit SHAs")
 
@@ -283,20 +307,40 @@ def handle_search_command(args):
         logger.info("Searching for commits across projects...")
         logger.info("(This may take a while depending on the number of projects and commits)")
         
-        finder = CommitFinder(client, projects)
-        results = finder.search_commits(commit_shas)
+        cache = None
+        if not args.no_cache:
+            try:
+                cache = CommitCache(args.cache_dir or DEFAULT_CACHE_DIR)
+                resources.callback(cache.close)
+                logger.info(f"  Using response cache at {cache.path}")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"  Response cache unavailable, continuing without it: {e}")
+        
+        finder = CommitFinder(
+            client, projects, cache=cache, first_match=args.first_match
+        )
+        found_shas = set()
 
-        # Step 6: Write results to CSV
+        def track_found(results):
+            for result in results:
+                if result.found:
+                    found_shas.add(result.commit_sha)
+                yield result
+
+        # Step 6: Stream results to CSV as each commit is resolved
         logger.info(f"Writing results to {args.output}")
-        write_results_to_csv(results, args.output)
+        match_count = write_results_to_csv(
+            track_found(finder.iter_search_commits(commit_shas)),
+            args.output
+        )
 
         # Summary
         logger.info("=" * 60)
         logger.info("Summary:")
         logger.info(f"  Total commits searched: {len(commit_shas)}")
         logger.info(f"  Total projects searched: {len(projects)}")
-        logger.info(f"  Commit-project matches found: {len(results)}")
-        found_commits = len(set(r.commit_sha for r in results if r.found))
+        logger.info(f"  Commit-project matches found: {match_count}")
+        found_commits = len(found_shas)
         logger.info(f"  Unique commits found: {found_commits}")
         not_found = len(commit_shas) - found_commits
         if not_found > 0:
@@ -305,17 +349,26 @@ def handle_search_command(args):
         logger.info("=" * 60)
         logger.info("Done!")
 
+    except CLIError:
+        raise
     except KeyboardInterrupt:
-        logger.warning("\nInterrupted by user")
-        sys.exit(130)
+        raise CLIError("\nInterrupted by user", exit_code=130, level=logging.WARNING)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=args.verbose)
-        sys.exit(1)
+        raise CLIError(f"Unexpected error: {e}") from e
+    finally:
+        resources.close()
 
 
 def handle_delta_command(args):
     """Handle the delta subcommand (new functionality)."""
+    from .api_client import GitLabClient, GitLabAPIError
+    from .project_resolver import resolve_projects
+    from .delta_finder import DeltaFinder
+    from .delta_exporter import get_exporter
+    from .jira_integration import create_jira_linker
+    from .notifications import create_slack_notifier, create_teams_notifier
     logger = logging.getLogger(__name__)
+    resources = contextlib.ExitStack()
     
     try:
         # Step 1: Load configuration
@@ -323,12 +376,12 @@ def handle_delta_command(args):
         try:
             config = load_config(args.config)
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {args.config}")
-            logger.error("Please create a config.yaml file. See config.example.yaml for reference.")
-            sys.exit(1)
+            raise CLIError(
+                f"Configuration file not found: {args.config}\n"
+                "Please create a config.yaml file. See config.example.yaml for reference."
+            )
         except ConfigError as e:
-            logger.error(f"Configuration error: {e}")
-            sys.exit(1)
+            raise CLIError(f"Configuration error: {e}")
 
         logger.info(f"  Mode: {config.scan.mode}")
         logger.info(f"  GitLab: {config.gitlab.base_url}")
@@ -341,7 +394,9 @@ def handle_delta_command(args):
             api_version=config.gitlab.api_version,
             verify_ssl=config.gitlab.verify_ssl,
             timeout_seconds=config.gitlab.timeout_seconds,
+            rate_limit=config.gitlab.rate_limit,
         )
+        resources.callback(client.close)
 
         # Test connection
         try:
@@ -349,20 +404,17 @@ def handle_delta_command(args):
             client.test_connection()
             logger.info("  Connection successful")
         except GitLabAPIError as e:
-            logger.error(f"Failed to connect to GitLab: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to connect to GitLab: {e}")
 
         # Step 3: Resolve projects to compare
         logger.info("Resolving projects to compare...")
         try:
             projects = resolve_projects(config, client)
         except GitLabAPIError as e:
-            logger.error(f"Failed to resolve projects: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to resolve projects: {e}")
 
         if not projects:
-            logger.error("No projects found to compare. Check your configuration.")
-            sys.exit(1)
+            raise CLIError("No projects found to compare. Check your configuration.")
 
         # Step 3a: Filter or fetch projects if CLI arguments provided
         cli_project_paths = getattr(args, 'projects', None)
@@ -403,8 +455,7 @@ def handle_delta_command(args):
                     projects = [p for p in projects if p.id in id_set]
                     logger.info(f"Filtered to {len(projects)} project(s) by ID: {', '.join(map(str, ids))}")
                 except ValueError as e:
-                    logger.error(f"Invalid project IDs format: {e}. Expected comma-separated numbers.")
-                    sys.exit(1)
+                    raise CLIError(f"Invalid project IDs format: {e}. Expected comma-separated numbers.")
             
             # If project paths are specified, filter from existing projects
             elif cli_project_paths:
@@ -415,10 +466,10 @@ def handle_delta_command(args):
                 )
         
         if not projects:
-            logger.error("No projects found. Check your --projects or --project-ids arguments.")
+            message = "No projects found. Check your --projects or --project-ids arguments."
             if cli_project_ids:
-                logger.error(f"Project ID(s) {cli_project_ids} may not exist or you may not have access.")
-            sys.exit(1)
+                message += f"\nProject ID(s) {cli_project_ids} may not exist or you may not have access."
+            raise CLIError(message)
 
         logger.info(f"  Will compare across {len(projects)} project(s)")
         if args.verbose:
@@ -441,13 +492,14 @@ def handle_delta_command(args):
                 if before_date_iso:
                     logger.info(f"  Filtering commits before: {getattr(args, 'before')}")
             except ValueError as e:
-                logger.error(f"Date validation error: {e}")
-                logger.error("\nDate range format:")
-                logger.error("  --after YYYY-MM-DD (optional, filter commits after this date)")
-                logger.error("  --before YYYY-MM-DD (optional, filter commits before this date)")
-                logger.error("\nExample:")
-                logger.error("  gitdoctor delta --base TAG1 --target TAG2 --after 2025-09-01 --before 2025-11-01")
-                sys.exit(1)
+                raise CLIError(
+                    f"Date validation error: {e}\n"
+                    "\nDate range format:\n"
+                    "  --after YYYY-MM-DD (optional, filter commits after this date)\n"
+                    "  --before YYYY-MM-DD (optional, filter commits before this date)\n"
+                    "\nExample:\n"
+                    "  gitdoctor delta --base TAG1 --target TAG2 --after 2025-09-01 --before 2025-11-01"
+                )
         else:
             logger.info("No date filter specified - fetching all commits between refs")
 
@@ -468,8 +520,8 @@ def handle_delta_command(args):
         
         # Step 7: Create JIRA linker if configured (config file or command line)
         jira_linker = None
-        jira_url = getattr(args, 'jira_url', None) or config.jira.base_url
-        jira_project = getattr(args, 'jira_project', None) or config.jira.project_key
+        jira_url = getattr(args, 'jira_url', None) or (config.jira.base_url if config.jira else None)
+        jira_project = getattr(args, 'jira_project', None) or (config.jira.project_key if config.jira else None)
         
         if jira_url:
             jira_linker = create_jira_linker(
@@ -478,9 +530,9 @@ def handle_delta_command(args):
             )
             if jira_linker:
                 logger.info("JIRA integration enabled - extracting ticket references")
-                if config.jira.base_url:
+                if config.jira and config.jira.base_url:
                     logger.info(f"  Using JIRA URL from config: {config.jira.base_url}")
-                if config.jira.project_key:
+                if config.jira and config.jira.project_key:
                     logger.info(f"  Using JIRA project key from config: {config.jira.project_key}")
         
         # Step 8: Export results
@@ -497,12 +549,12 @@ def handle_delta_command(args):
             exporter.export(deltas, args.output)
 
         # Step 9: Send notifications if configured (config file or command line)
-        slack_webhook = getattr(args, 'slack_webhook', None) or config.notifications.slack_webhook
+        slack_webhook = getattr(args, 'slack_webhook', None) or (config.notifications.slack_webhook if config.notifications else None)
         if slack_webhook:
             slack_notifier = create_slack_notifier(slack_webhook)
             if slack_notifier:
                 logger.info("Sending Slack notification...")
-                if config.notifications.slack_webhook:
+                if config.notifications and config.notifications.slack_webhook:
                     logger.info("  Using Slack webhook from config")
                 slack_notifier.send_delta_notification(
                     summary=summary,
@@ -511,12 +563,12 @@ def handle_delta_command(args):
                     target_ref=args.target
                 )
         
-        teams_webhook = getattr(args, 'teams_webhook', None) or config.notifications.teams_webhook
+        teams_webhook = getattr(args, 'teams_webhook', None) or (config.notifications.teams_webhook if config.notifications else None)
         if teams_webhook:
             teams_notifier = create_teams_notifier(teams_webhook)
             if teams_notifier:
                 logger.info("Sending Teams notification...")
-                if config.notifications.teams_webhook:
+                if config.notifications and config.notifications.teams_webhook:
                     logger.info("  Using Teams webhook from config")
                 teams_notifier.send_delta_notification(
                     summary=summary,
@@ -542,17 +594,25 @@ def handle_delta_command(args):
                     print(f"  URL: {ticket_data['url']}")
                 print("=" * 60)
 
+    except CLIError:
+        raise
     except KeyboardInterrupt:
-        logger.warning("\nInterrupted by user")
-        sys.exit(130)
+        raise CLIError("\nInterrupted by user", exit_code=130, level=logging.WARNING)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=args.verbose)
-        sys.exit(1)
+        raise CLIError(f"Unexpected error: {e}") from e
+    finally:
+        resources.close()
 
 
 def handle_mr_command(args):
     """Handle the mr subcommand (merge request tracking)."""
+    from .api_client import GitLabClient, GitLabAPIError
+    from .project_resolver import resolve_projects
+    from .mr_finder import MRFinder
+    from .delta_exporter import get_mr_exporter
+    from .jira_integration import create_jira_linker
     logger = logging.getLogger(__name__)
+    resources = contextlib.ExitStack()
     
     try:
         # Step 1: Load configuration
@@ -560,12 +620,12 @@ def handle_mr_command(args):
         try:
             config = load_config(args.config)
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {args.config}")
-            logger.error("Please create a config.yaml file. See config.example.yaml for reference.")
-            sys.exit(1)
+            raise CLIError(
+                f"Configuration file not found: {args.config}\n"
+                "Please create a config.yaml file. See config.example.yaml for reference."
+            )
         except ConfigError as e:
-            logger.error(f"Configuration error: {e}")
-            sys.exit(1)
+            raise CLIError(f"Configuration error: {e}")
 
         logger.info(f"  Mode: {config.scan.mode}")
         logger.info(f"  GitLab: {config.gitlab.base_url}")
@@ -578,7 +638,9 @@ def handle_mr_command(args):
             api_version=config.gitlab.api_version,
             verify_ssl=config.gitlab.verify_ssl,
             timeout_seconds=config.gitlab.timeout_seconds,
+            rate_limit=config.gitlab.rate_limit,
         )
+        resources.callback(client.close)
 
         # Test connection
         try:
@@ -586,20 +648,17 @@ def handle_mr_command(args):
             client.test_connection()
             logger.info("  Connection successful")
         except GitLabAPIError as e:
-            logger.error(f"Failed to connect to GitLab: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to connect to GitLab: {e}")
 
         # Step 3: Resolve projects
         logger.info("Resolving projects to search...")
         try:
             projects = resolve_projects(config, client)
         except GitLabAPIError as e:
-            logger.error(f"Failed to resolve projects: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to resolve projects: {e}")
 
         if not projects:
-            logger.error("No projects found. Check your configuration.")
-            sys.exit(1)
+            raise CLIError("No projects found. Check your configuration.")
 
         # Step 3a: Filter projects if CLI arguments provided
         cli_project_paths = getattr(args, 'projects', None)
@@ -635,8 +694,7 @@ def handle_mr_command(args):
                     projects = [p for p in projects if p.id in id_set]
                     logger.info(f"Filtered to {len(projects)} project(s) by ID")
                 except ValueError as e:
-                    logger.error(f"Invalid project IDs format: {e}")
-                    sys.exit(1)
+                    raise CLIError(f"Invalid project IDs format: {e}")
             
             elif cli_project_paths:
                 projects = filter_projects_by_cli_args(
@@ -646,8 +704,7 @@ def handle_mr_command(args):
                 )
         
         if not projects:
-            logger.error("No projects found. Check your --projects or --project-ids arguments.")
-            sys.exit(1)
+            raise CLIError("No projects found. Check your --projects or --project-ids arguments.")
 
         logger.info(f"  Will search across {len(projects)} project(s)")
 
@@ -667,8 +724,7 @@ def handle_mr_command(args):
                 if merged_before_iso:
                     logger.info(f"  MRs merged before: {getattr(args, 'before')}")
             except ValueError as e:
-                logger.error(f"Date validation error: {e}")
-                sys.exit(1)
+                raise CLIError(f"Date validation error: {e}")
 
         # Step 5: Find merge requests
         logger.info(f"Fetching merge requests...")
@@ -695,8 +751,8 @@ def handle_mr_command(args):
         
         # Step 7: Create JIRA linker if configured
         jira_linker = None
-        jira_url = getattr(args, 'jira_url', None) or config.jira.base_url
-        jira_project = getattr(args, 'jira_project', None) or config.jira.project_key
+        jira_url = getattr(args, 'jira_url', None) or (config.jira.base_url if config.jira else None)
+        jira_project = getattr(args, 'jira_project', None) or (config.jira.project_key if config.jira else None)
         
         if jira_url:
             jira_linker = create_jira_linker(
@@ -721,17 +777,24 @@ def handle_mr_command(args):
         print()
         print(summary)
 
+    except CLIError:
+        raise
     except KeyboardInterrupt:
-        logger.warning("\nInterrupted by user")
-        sys.exit(130)
+        raise CLIError("\nInterrupted by user", exit_code=130, level=logging.WARNING)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=args.verbose)
-        sys.exit(1)
+        raise CLIError(f"Unexpected error: {e}") from e
+    finally:
+        resources.close()
 
 
 def handle_mr_changes_command(args):
     """Handle the mr-changes subcommand (MR changeset for test selection)."""
+    from .api_client import GitLabClient, GitLabAPIError
+    from .mr_changes_finder import MRChangesFinder
+    from .mr_changes_exporter import get_mr_changes_exporter
+    from .jira_integration import create_jira_linker
     logger = logging.getLogger(__name__)
+    resources = contextlib.ExitStack()
     
     try:
         # Step 1: Load configuration
@@ -739,12 +802,12 @@ def handle_mr_changes_command(args):
         try:
             config = load_config(args.config)
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {args.config}")
-            logger.error("Please create a config.yaml file. See config.example.yaml for reference.")
-            sys.exit(1)
+            raise CLIError(
+                f"Configuration file not found: {args.config}\n"
+                "Please create a config.yaml file. See config.example.yaml for reference."
+            )
         except ConfigError as e:
-            logger.error(f"Configuration error: {e}")
-            sys.exit(1)
+            raise CLIError(f"Configuration error: {e}")
 
         logger.info(f"  GitLab: {config.gitlab.base_url}")
 
@@ -756,7 +819,9 @@ def handle_mr_changes_command(args):
             api_version=config.gitlab.api_version,
             verify_ssl=config.gitlab.verify_ssl,
             timeout_seconds=config.gitlab.timeout_seconds,
+            rate_limit=config.gitlab.rate_limit,
         )
+        resources.callback(client.close)
 
         # Test connection
         try:
@@ -764,13 +829,12 @@ def handle_mr_changes_command(args):
             client.test_connection()
             logger.info("  Connection successful")
         except GitLabAPIError as e:
-            logger.error(f"Failed to connect to GitLab: {e}")
-            sys.exit(1)
+            raise CLIError(f"Failed to connect to GitLab: {e}")
 
         # Step 3: Create JIRA linker if configured
         jira_linker = None
-        jira_url = getattr(args, 'jira_url', None) or config.jira.base_url
-        jira_project = getattr(args, 'jira_project', None) or config.jira.project_key
+        jira_url = getattr(args, 'jira_url', None) or (config.jira.base_url if config.jira else None)
+        jira_project = getattr(args, 'jira_project', None) or (config.jira.project_key if config.jira else None)
         
         if jira_url:
             jira_linker = create_jira_linker(
@@ -793,8 +857,7 @@ def handle_mr_changes_command(args):
 
         # Check for errors
         if result.error:
-            logger.error(f"Failed to fetch MR changes: {result.error}")
-            sys.exit(1)
+            raise CLIError(f"Failed to fetch MR changes: {result.error}")
 
         # Step 5: Export results
         logger.info(f"Exporting results to {args.output}")
@@ -802,64 +865,82 @@ def handle_mr_changes_command(args):
         exporter.export(result, args.output)
 
         # Step 6: Display summary
-        print()
-        print("=" * 60)
-        print("MR Changes Summary")
-        print("=" * 60)
-        print(f"MR:                      !{result.mr_iid} - {result.title}")
-        print(f"Project:                 {result.project_path}")
-        print(f"Source → Target:         {result.source_branch} → {result.target_branch}")
-        print(f"State:                   {result.state}")
-        print(f"Author:                  {result.author_name}")
+        # The result properties below are recomputed on every access, so
+        # read each once; the summary is then emitted in a single write.
+        files_by_extension = result.files_by_extension
+        changed_directories = result.changed_directories
+        jira_tickets = result.unique_jira_tickets
+
+        lines = [
+            "",
+            "=" * 60,
+            "MR Changes Summary",
+            "=" * 60,
+            f"MR:                      !{result.mr_iid} - {result.title}",
+            f"Project:                 {result.project_path}",
+            f"Source → Target:         {result.source_branch} → {result.target_branch}",
+            f"State:                   {result.state}",
+            f"Author:                  {result.author_name}",
+        ]
         if result.merged_at:
-            print(f"Merged At:               {result.merged_at}")
-        print()
-        print(f"Total Commits:           {result.total_commits}")
-        print(f"Total Files Changed:     {result.total_files_changed}")
-        print(f"  Source Files:          {len(result.get_non_test_files())}")
-        print(f"  Test Files:            {len(result.get_test_files())}")
-        print()
+            lines.append(f"Merged At:               {result.merged_at}")
+        lines += [
+            "",
+            f"Total Commits:           {result.total_commits}",
+            f"Total Files Changed:     {result.total_files_changed}",
+            f"  Source Files:          {len(result.get_non_test_files())}",
+            f"  Test Files:            {len(result.get_test_files())}",
+            "",
+        ]
         
-        if result.files_by_extension:
-            print("Files by Extension:")
-            for ext, count in sorted(result.files_by_extension.items(), key=lambda x: x[1], reverse=True)[:5]:
-                print(f"  {ext}: {count}")
+        if files_by_extension:
+            lines.append("Files by Extension:")
+            for ext, count in heapq.nlargest(5, files_by_extension.items(), key=itemgetter(1)):
+                lines.append(f"  {ext}: {count}")
         
-        if result.changed_directories:
-            print()
-            print(f"Changed Directories ({len(result.changed_directories)}):")
-            for directory in result.changed_directories[:10]:
-                print(f"  - {directory}")
-            if len(result.changed_directories) > 10:
-                print(f"  ... and {len(result.changed_directories) - 10} more")
+        if changed_directories:
+            lines.append("")
+            lines.append(f"Changed Directories ({len(changed_directories)}):")
+            for directory in changed_directories[:10]:
+                lines.append(f"  - {directory}")
+            if len(changed_directories) > 10:
+                lines.append(f"  ... and {len(changed_directories) - 10} more")
         
-        if result.unique_jira_tickets:
-            print()
-            print(f"JIRA Tickets ({len(result.unique_jira_tickets)}):")
-            for ticket in result.unique_jira_tickets:
-                print(f"  - {ticket}")
+        if jira_tickets:
+            lines.append("")
+            lines.append(f"JIRA Tickets ({len(jira_tickets)}):")
+            for ticket in jira_tickets:
+                lines.append(f"  - {ticket}")
                 if jira_linker:
-                    print(f"    {jira_linker.get_ticket_url(ticket)}")
+                    lines.append(f"    {jira_linker.get_ticket_url(ticket)}")
         
-        print("=" * 60)
-        print(f"✓ Results exported to: {args.output}")
-        print("=" * 60)
+        lines += [
+            "=" * 60,
+            f"✓ Results exported to: {args.output}",
+            "=" * 60,
+        ]
         
         # Display usage hint for test selection
         if args.format == 'test-selection' or args.format == 'test-selection-detailed':
-            print()
-            print("💡 This file is ready for intelligent test selection!")
-            print("   Use it with your test automation framework to:")
-            print("   - Map changed files to test suites")
-            print("   - Filter tests by JIRA tickets")
-            print("   - Run tests for affected directories")
-
+            lines += [
+                "",
+                "💡 This file is ready for intelligent test selection!",
+                "   Use it with your test automation framework to:",
+                "   - Map changed files to test suites",
+                "   - Filter tests by JIRA tickets",
+                "   - Run tests for affected directories",
+            ]
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    except CLIError:
+        raise
     except KeyboardInterrupt:
-        logger.warning("\nInterrupted by user")
-        sys.exit(130)
+        raise CLIError("\nInterrupted by user", exit_code=130, level=logging.WARNING)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=args.verbose)
-        sys.exit(1)
+        raise CLIError(f"Unexpected error: {e}") from e
+    finally:
+        resources.close()
 
 
 def main():
@@ -921,6 +1002,24 @@ Examples:
         help="Enable verbose logging"
     )
 
+    search_parser.add_argument(
+        "--first-match",
+        action="store_true",
+        help="Stop searching other projects once a commit is found in one"
+    )
+
+    search_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query GitLab instead of reusing cached commit lookups"
+    )
+
+    search_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the commit lookup cache (default: ~/.gitdoctor-cache)"
+    )
+
     # ===== DELTA COMMAND (new functionality) =====
     delta_parser = subparsers.add_parser(
         "delta",
@@ -1268,17 +1367,22 @@ Note: This command provides all data needed for intelligent test selection:
     logger.info("=" * 60)
 
     # Route to appropriate command handler
-    if args.command == "search":
-        handle_search_command(args)
-    elif args.command == "delta":
-        handle_delta_command(args)
-    elif args.command == "mr":
-        handle_mr_command(args)
-    elif args.command == "mr-changes":
-        handle_mr_changes_command(args)
-    else:
-        parser.print_help()
-        sys.exit(1)
+    try:
+        if args.command == "search":
+            handle_search_command(args)
+        elif args.command == "delta":
+            handle_delta_command(args)
+        elif args.command == "mr":
+            handle_mr_command(args)
+        elif args.command == "mr-changes":
+            handle_mr_changes_command(args)
+        else:
+            parser.print_help()
+            sys.exit(1)
+    except CLIError as e:
+        # Include the traceback of unexpected errors in verbose mode
+        logger.log(e.level, str(e), exc_info=e.__cause__ if args.verbose else None)
+        sys.exit(e.exit_code)
 
 
 if __name__ == "__main__":
@@ -4,20 +4,34 @@ Commit finder module.
 Searches for commits across GitLab projects and collects metadata.
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Iterable, Optional
+from typing import Any, Dict, List, Iterable, Iterator, Optional, Set, Tuple
 import logging
 
 from .api_client import GitLabClient, GitLabNotFound, GitLabAPIError
+from .cache import CommitCache
 from .project_resolver import ProjectInfo
 
 
 logger = logging.getLogger(__name__)
 
+# Number of (commit, project) probes issued to GitLab concurrently.
+# Kept within GitLabClient's connection pool so every worker reuses a
+# keep-alive connection.
+DEFAULT_MAX_WORKERS = 16
 
-@dataclass
+# Read buffer for commits files; large SHA lists are read in few syscalls.
+COMMITS_FILE_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass(slots=True)
 class CommitSearchResult:
-    """Result of searching for a commit in a project."""
+    """
+    Result of searching for a commit in a project.
+
+    Slotted to keep per-instance memory low for large searches.
+    """
     commit_sha: str
     project_id: int
     project_name: str
@@ -44,16 +58,35 @@ class CommitFinder:
     - All tags that contain the commit
     """
 
-    def __init__(self, client: GitLabClient, projects: List[ProjectInfo]):
+    def __init__(
+        self,
+        client: GitLabClient,
+        projects: List[ProjectInfo],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: Optional[CommitCache] = None,
+        first_match: bool = False
+    ):
         """
         Initialize commit finder.
 
         Args:
             client: GitLab API client
             projects: List of projects to search
+            max_workers: Maximum number of projects probed concurrently
+            cache: Optional cache consulted before calling the API
+            first_match: Stop searching other projects once a commit is found
         """
         self.client = client
         self.projects = projects
+        self.max_workers = max_workers
+        self.cache = cache
+        self.first_match = first_match
+        # Fallback commit URLs are built from these, once per project
+        self._project_base_urls: Dict[int, str] = {
+            project.id: project.web_url.rstrip("/") for project in projects
+        }
+        # (project_id, sha) pairs that returned 404 during this run
+        self._negative_cache: Set[Tuple[int, str]] = set()
 
     def search_commits(self, commit_shas: Iterable[str]) -> List[CommitSearchResult]:
         """
@@ -66,51 +99,97 @@ class CommitFinder:
             List of CommitSearchResult objects. One result per (commit, project) pair.
             If a commit is not found in any project, no results are returned for it.
         """
-        results = []
-        commit_list = list(commit_shas)
+        return list(self.iter_search_commits(commit_shas))
+
+    def iter_search_commits(self, commit_shas: Iterable[str]) -> Iterator[CommitSearchResult]:
+        """
+        Search for commits across all configured projects, yielding results
+        as soon as each commit has been probed in every project.
+
+        Results are not accumulated, so callers can stream them to disk
+        with constant memory regardless of the input size.
+
+        Args:
+            commit_shas: Iterable of commit SHAs to search for
+
+        Yields:
+            CommitSearchResult objects, one per (commit, project) pair where the
+            commit was found or the lookup failed
+        """
+        commit_list = normalize_commit_shas(commit_shas)
+        match_count = 0
         
         logger.info(
             f"Searching for {len(commit_list)} commits across {len(self.projects)} projects"
         )
         
-        for i, commit_sha in enumerate(commit_list, 1):
-            commit_sha = commit_sha.strip()
-            if not commit_sha:
-                continue
-            
-            logger.info(f"[{i}/{len(commit_list)}] Searching for commit {commit_sha}")
-            commit_results = self._search_commit_in_projects(commit_sha)
-            results.extend(commit_results)
-            
-            if commit_results:
-                logger.info(
-                    f"  Found in {len(commit_results)} project(s)"
-                )
-            else:
-                logger.warning(f"  Commit {commit_sha} not found in any project")
+        # Probes are pure network latency, so fan each commit out across
+        # projects on a shared thread pool.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i, commit_sha in enumerate(commit_list, 1):
+                logger.info(f"[{i}/{len(commit_list)}] Searching for commit {commit_sha}")
+                commit_results = self._search_commit_in_projects(commit_sha, executor)
+                match_count += len(commit_results)
+                
+                if commit_results:
+                    logger.info(
+                        f"  Found in {len(commit_results)} project(s)"
+                    )
+                else:
+                    logger.warning(f"  Commit {commit_sha} not found in any project")
+                
+                yield from commit_results
         
-        logger.info(f"Search complete. Found {len(results)} commit-project matches.")
-        return results
+        logger.info(f"Search complete. Found {match_count} commit-project matches.")
 
-    def _search_commit_in_projects(self, commit_sha: str) -> List[CommitSearchResult]:
+    def _search_commit_in_projects(
+        self,
+        commit_sha: str,
+        executor: Executor
+    ) -> List[CommitSearchResult]:
         """
-        Search for a single commit across all projects.
+        Search for a single commit across all projects concurrently.
+
+        Projects already known not to contain the commit are skipped. With
+        first_match enabled, probes that haven't started yet are cancelled
+        as soon as the commit is found.
 
         Args:
             commit_sha: Commit SHA to search for
+            executor: Executor used to probe the projects in parallel
 
         Returns:
-            List of CommitSearchResult objects for projects where commit was found
+            List of CommitSearchResult objects for projects where commit was found,
+            in the same order as the configured projects
         """
         results = []
+        futures = [
+            executor.submit(self._search_commit_in_project, commit_sha, project)
+            for project in self.projects
+            if not self._is_known_missing(project.id, commit_sha)
+        ]
         
-        for project in self.projects:
-            result = self._search_commit_in_project(commit_sha, project)
+        for future in futures:
+            result = future.result()
             if result.found or result.error:
                 results.append(result)
+            if result.found and self.first_match:
+                for pending in futures:
+                    pending.cancel()
+                break
         
         return results
 
+    def _is_known_missing(self, project_id: int, commit_sha: str) -> bool:
+        """Whether a previous lookup found that the commit isn't in the project."""
+        key = (project_id, commit_sha)
+        if key in self._negative_cache:
+            return True
+        if self.cache is not None and self.cache.is_missing(project_id, commit_sha):
+            self._negative_cache.add(key)
+            return True
+        return False
+
     def _search_commit_in_project(
         self,
         commit_sha: str,
@@ -136,7 +215,7 @@ class CommitFinder:
 
         try:
             # Fetch commit details
-            commit_data = self.client.get_commit(project.id, commit_sha)
+            commit_data = self._get_commit(project.id, commit_sha)
             
             # Populate commit metadata
             result.found = True
@@ -153,7 +232,7 @@ class CommitFinder:
             
             # If still empty, build manually from project.web_url
             if not normalized_web_url:
-                base = project.web_url.rstrip("/")
+                base = self._project_base_urls[project.id]
                 # Normalized format: <project.web_url>/commit/<sha> (no '/-/')
                 normalized_web_url = f"{base}/commit/{commit_sha}"
             
@@ -166,21 +245,17 @@ class CommitFinder:
             
             # Fetch branches and tags that contain this commit
             try:
-                refs = self.client.list_commit_refs(project.id, commit_sha)
-                branches = []
-                tags = []
+                refs = self._list_commit_refs(project.id, commit_sha)
                 
+                # Single pass: route each ref name to its type's bucket
+                names_by_type: Dict[str, List[str]] = {"branch": [], "tag": []}
                 for ref in refs:
-                    ref_type = ref.get("type", "")
-                    ref_name = ref.get("name", "")
-                    
-                    if ref_type == "branch":
-                        branches.append(ref_name)
-                    elif ref_type == "tag":
-                        tags.append(ref_name)
+                    names = names_by_type.get(ref.get("type"))
+                    if names is not None:
+                        names.append(ref.get("name", ""))
                 
-                result.branches = "|".join(branches) if branches else ""
-                result.tags = "|".join(tags) if tags else ""
+                result.branches = "|".join(names_by_type["branch"])
+                result.tags = "|".join(names_by_type["tag"])
                 
             except GitLabAPIError as e:
                 # If we can't fetch refs, still return the commit info
@@ -193,6 +268,9 @@ class CommitFinder:
         except GitLabNotFound:
             # Commit not found in this project - this is expected and normal
             result.found = False
+            self._negative_cache.add((project.id, commit_sha))
+            if self.cache is not None:
+                self.cache.set_missing(project.id, commit_sha)
             return result
         except GitLabAPIError as e:
             # Other API errors
@@ -205,6 +283,48 @@ class CommitFinder:
 
         return result
 
+    def _get_commit(self, project_id: int, commit_sha: str) -> Dict[str, Any]:
+        """Fetch commit details, using the cache when available."""
+        if self.cache is not None:
+            commit_data = self.cache.get_commit(project_id, commit_sha)
+            if commit_data is not None:
+                return commit_data
+        
+        commit_data = self.client.get_commit(project_id, commit_sha)
+        if self.cache is not None:
+            self.cache.set_commit(project_id, commit_sha, commit_data)
+        return commit_data
+
+    def _list_commit_refs(self, project_id: int, commit_sha: str) -> List[Dict[str, Any]]:
+        """Fetch the refs containing a commit, using the cache when available."""
+        if self.cache is not None:
+            refs = self.cache.get_refs(project_id, commit_sha)
+            if refs is not None:
+                return refs
+        
+        refs = self.client.list_commit_refs(project_id, commit_sha)
+        if self.cache is not None:
+            self.cache.set_refs(project_id, commit_sha, refs)
+        return refs
+
+
+def normalize_commit_shas(commit_shas: Iterable[str]) -> List[str]:
+    """
+    Normalize a sequence of commit SHAs for searching.
+
+    Strips whitespace, lowercases (SHAs are hex), drops empty entries and
+    removes duplicates while preserving first-seen order.
+
+    Args:
+        commit_shas: Raw commit SHAs
+
+    Returns:
+        List of unique, normalized commit SHAs
+    """
+    return list(dict.fromkeys(
+        sha for sha in (raw.strip().lower() for raw in commit_shas) if sha
+    ))
+
 
 def load_commit_shas_from_file(file_path: str) -> List[str]:
     """
@@ -214,20 +334,32 @@ def load_commit_shas_from_file(file_path: str) -> List[str]:
         file_path: Path to file containing commit SHAs (one per line)
 
     Returns:
-        List of commit SHAs (stripped of whitespace, empty lines removed)
+        List of unique commit SHAs in file order (stripped, lowercased,
+        empty lines and duplicates removed)
 
     Raises:
         FileNotFoundError: If file doesn't exist
         IOError: If file can't be read
     """
     try:
-        with open(file_path, 'r') as f:
-            commits = [line.strip() for line in f if line.strip()]
+        # Single pass over the file: each line is stripped once, and the
+        # file is streamed rather than materialized with readlines().
+        seen: Dict[str, None] = {}
+        non_empty = 0
+        with open(file_path, 'r', buffering=COMMITS_FILE_BUFFER_SIZE) as f:
+            for line in f:
+                sha = line.strip().lower()
+                if sha:
+                    non_empty += 1
+                    seen[sha] = None
+        commits = list(seen)
         
         logger.info(f"Loaded {len(commits)} commit SHAs from {file_path}")
+        duplicates = non_empty - len(commits)
+        if duplicates:
+            logger.info(f"  Skipped {duplicates} duplicate commit SHA(s)")
         return commits
     except FileNotFoundError:
         raise FileNotFoundError(f"Commits file not found: {file_path}")
     except Exception as e:
         raise IOError(f"Failed to read commits file {file_path}: {e}")
-
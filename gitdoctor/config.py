@@ -5,18 +5,43 @@ Handles loading and validating YAML configuration files.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import codecs
+import functools
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; it is a
+# drop-in, much faster replacement for the pure-Python SafeLoader.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_VALID_SCAN_MODES = frozenset(("auto_discover", "explicit"))
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid or missing required fields."""
     pass
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def _normalize_url(url: str) -> str:
+    """Strip trailing slashes from a base URL (cached; configs repeat URLs)."""
+    return url.rstrip("/")
+
+
+def _unique(items: Optional[Iterable]) -> Tuple:
+    """
+    Drop repeated entries from a config list, keeping first-seen order.
+
+    Each project/group entry costs one or more API calls, so a path listed
+    twice would otherwise be fetched twice. The result is an immutable
+    tuple; the empty case is the shared () singleton.
+    """
+    return tuple(dict.fromkeys(items)) if items else ()
+
+
+@dataclass(slots=True, frozen=True)
 class GitLabConfig:
     """GitLab connection configuration."""
     base_url: str
@@ -24,39 +49,54 @@ class GitLabConfig:
     api_version: str = "v4"
     verify_ssl: bool = True
     timeout_seconds: int = 15
+    rate_limit: float = 10.0  # Max requests per second, 0 disables throttling
 
     def __post_init__(self):
-        if not self.base_url:
-            raise ConfigError("gitlab.base_url is required")
-        if not self.private_token:
-            raise ConfigError("gitlab.private_token is required")
-        # Remove trailing slash from base_url if present
-        self.base_url = self.base_url.rstrip("/")
+        object.__setattr__(self, "base_url", _normalize_url(self.base_url))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectsConfig:
     """Configuration for explicitly specified projects."""
-    by_id: List[int] = field(default_factory=list)
-    by_path: List[str] = field(default_factory=list)
+    by_id: Tuple[int, ...] = ()
+    by_path: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "by_id", _unique(self.by_id))
+        object.__setattr__(self, "by_path", _unique(self.by_path))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroupsConfig:
     """Configuration for GitLab groups to discover projects from."""
     include_subgroups: bool = True
-    by_id: List[int] = field(default_factory=list)
-    by_path: List[str] = field(default_factory=list)
+    by_id: Tuple[int, ...] = ()
+    by_path: Tuple[str, ...] = ()
 
+    def __post_init__(self):
+        object.__setattr__(self, "by_id", _unique(self.by_id))
+        object.__setattr__(self, "by_path", _unique(self.by_path))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FiltersConfig:
     """Configuration for filtering which projects to search."""
-    include_project_paths: List[str] = field(default_factory=list)
-    exclude_project_paths: List[str] = field(default_factory=list)
+    include_project_paths: Tuple[str, ...] = ()
+    exclude_project_paths: Tuple[str, ...] = ()
+    # Hashed views of the lists above, built once for per-project lookups
+    include_path_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    exclude_path_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        include = tuple(self.include_project_paths or ())
+        exclude = tuple(self.exclude_project_paths or ())
+        object.__setattr__(self, "include_project_paths", include)
+        object.__setattr__(self, "exclude_project_paths", exclude)
+        object.__setattr__(self, "include_path_set", frozenset(include))
+        object.__setattr__(self, "exclude_path_set", frozenset(exclude))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JIRAConfig:
     """Configuration for JIRA integration."""
     base_url: Optional[str] = None
@@ -64,31 +104,23 @@ class JIRAConfig:
 
     def __post_init__(self):
         if self.base_url:
-            # Remove trailing slash if present
-            self.base_url = self.base_url.rstrip("/")
+            object.__setattr__(self, "base_url", _normalize_url(self.base_url))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotificationsConfig:
     """Configuration for notifications."""
     slack_webhook: Optional[str] = None
     teams_webhook: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScanConfig:
     """Configuration for scan mode."""
     mode: str = "auto_discover"  # "auto_discover" or "explicit"
 
-    def __post_init__(self):
-        valid_modes = ["auto_discover", "explicit"]
-        if self.mode not in valid_modes:
-            raise ConfigError(
-                f"scan.mode must be one of {valid_modes}, got: {self.mode}"
-            )
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Main application configuration."""
     gitlab: GitLabConfig
@@ -96,29 +128,142 @@ class AppConfig:
     projects: ProjectsConfig = field(default_factory=ProjectsConfig)
     groups: GroupsConfig = field(default_factory=GroupsConfig)
     filters: FiltersConfig = field(default_factory=FiltersConfig)
-    jira: JIRAConfig = field(default_factory=JIRAConfig)
-    notifications: NotificationsConfig = field(default_factory=NotificationsConfig)
-
-    def __post_init__(self):
-        # Validate that at least one source is configured
-        if self.scan.mode == "auto_discover":
-            if not self.groups.by_id and not self.groups.by_path:
-                raise ConfigError(
-                    "In auto_discover mode, at least one group must be configured "
-                    "in groups.by_id or groups.by_path"
-                )
-        elif self.scan.mode == "explicit":
-            if not self.projects.by_id and not self.projects.by_path:
+    # Optional sections stay None unless present in the YAML
+    jira: Optional[JIRAConfig] = None
+    notifications: Optional[NotificationsConfig] = None
+
+# Constructor arguments accepted by each section dataclass; other YAML keys
+# are ignored.
+_SECTION_FIELDS = {
+    cls: frozenset(f.name for f in fields(cls) if f.init)
+    for cls in (
+        GitLabConfig, ScanConfig, ProjectsConfig, GroupsConfig,
+        FiltersConfig, JIRAConfig, NotificationsConfig,
+    )
+}
+
+
+# Expected YAML shape: section -> field -> accepted type(s). Checked once
+# per load by _check_types; null values are always accepted and mean
+# "use the default".
+_CONFIG_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "gitlab": {
+        "base_url": str,
+        "private_token": str,
+        "api_version": str,
+        "verify_ssl": bool,
+        "timeout_seconds": (int, float),
+        "rate_limit": (int, float),
+    },
+    "scan": {"mode": str},
+    "projects": {"by_id": list, "by_path": list},
+    "groups": {"include_subgroups": bool, "by_id": list, "by_path": list},
+    "filters": {"include_project_paths": list, "exclude_project_paths": list},
+    "jira": {"base_url": str, "project_key": str},
+    "notifications": {"slack_webhook": str, "teams_webhook": str},
+}
+
+
+def _check_types(raw_config: Any) -> None:
+    """Check section and field types against _CONFIG_SCHEMA."""
+    if not isinstance(raw_config, dict):
+        raise ConfigError("Configuration must be a YAML mapping")
+    for section, field_types in _CONFIG_SCHEMA.items():
+        data = raw_config.get(section)
+        if data is None:
+            continue
+        if not isinstance(data, dict):
+            raise ConfigError(f"{section} must be a mapping")
+        for name, expected in field_types.items():
+            value = data.get(name)
+            if value is None:
+                continue
+            # bool is a subclass of int, so only accept it where bool is expected
+            if not isinstance(value, expected) or (
+                isinstance(value, bool) and expected is not bool
+            ):
                 raise ConfigError(
-                    "In explicit mode, at least one project must be configured "
-                    "in projects.by_id or projects.by_path"
+                    f"{section}.{name} has invalid type {type(value).__name__}"
                 )
 
 
+def _validate_raw(raw_config: Dict[str, Any]) -> None:
+    """
+    Validate a parsed configuration in a single pass.
+
+    All policy checks live here rather than in the dataclasses, which only
+    hold (and normalize) values.
+
+    Raises:
+        ConfigError: On the first problem found
+    """
+    _check_types(raw_config)
+
+    gitlab_data = raw_config.get("gitlab")
+    if not gitlab_data:
+        raise ConfigError("gitlab section is required in configuration")
+    if not gitlab_data.get("base_url"):
+        raise ConfigError("gitlab.base_url is required")
+    if not gitlab_data.get("private_token"):
+        raise ConfigError("gitlab.private_token is required")
+    rate_limit = gitlab_data.get("rate_limit")
+    if rate_limit is not None and rate_limit < 0:
+        raise ConfigError("gitlab.rate_limit must be zero or positive")
+
+    mode = (raw_config.get("scan") or {}).get("mode") or "auto_discover"
+    if mode not in _VALID_SCAN_MODES:
+        raise ConfigError(
+            f"scan.mode must be one of {sorted(_VALID_SCAN_MODES)}, got: {mode}"
+        )
+
+    # At least one source must be configured for the chosen mode
+    if mode == "auto_discover":
+        groups_data = raw_config.get("groups") or {}
+        if not groups_data.get("by_id") and not groups_data.get("by_path"):
+            raise ConfigError(
+                "In auto_discover mode, at least one group must be configured "
+                "in groups.by_id or groups.by_path"
+            )
+    else:
+        projects_data = raw_config.get("projects") or {}
+        if not projects_data.get("by_id") and not projects_data.get("by_path"):
+            raise ConfigError(
+                "In explicit mode, at least one project must be configured "
+                "in projects.by_id or projects.by_path"
+            )
+
+
+def _build_section(cls, data: Optional[Dict[str, Any]]):
+    """
+    Build a config dataclass from a YAML section, ignoring unknown keys.
+
+    Null values are dropped so the dataclass defaults apply.
+    """
+    known = _SECTION_FIELDS[cls]
+    return cls(**{
+        key: value for key, value in (data or {}).items()
+        if key in known and value is not None
+    })
+
+
+# Parsed configurations keyed by (resolved path, mtime in ns, size), so an
+# unchanged file is only parsed and validated once per process. Editing the
+# file changes its key and forces a fresh load.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], AppConfig] = {}
+
+
+def clear_config_cache() -> None:
+    """Forget all configurations cached by load_config."""
+    _CONFIG_CACHE.clear()
+
+
 def load_config(config_path: str | Path) -> AppConfig:
     """
     Load and validate configuration from a YAML file.
 
+    Results are cached per file until the file changes; the returned
+    AppConfig is shared between callers, so it is frozen.
+
     Args:
         config_path: Path to the YAML configuration file
 
@@ -135,9 +280,30 @@ def load_config(config_path: str | Path) -> AppConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    stat = config_path.stat()
+    cache_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Read raw bytes in one call: the YAML loader detects the encoding and
+    # decodes itself, so there is no separate text-mode decoding pass.
+    content = config_path.read_bytes()
+
+    # Cheap pre-check before parsing: a file that never mentions "gitlab"
+    # (e.g. a wrong file passed to --config) cannot define the required
+    # section, so fail fast instead of tokenizing the whole document. Only
+    # valid for UTF-8 input; UTF-16 files (which the loader detects by
+    # their BOM) are left to the validation after parsing.
+    if (
+        not content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE))
+        and content.strip()
+        and b"gitlab" not in content
+    ):
+        raise ConfigError("gitlab section is required in configuration")
+
     try:
-        with open(config_path, 'r') as f:
-            raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Failed to parse YAML configuration: {e}")
 
@@ -145,63 +311,25 @@ def load_config(config_path: str | Path) -> AppConfig:
         raise ConfigError("Configuration file is empty")
 
     try:
-        # Parse GitLab config
-        gitlab_data = raw_config.get("gitlab", {})
-        if not gitlab_data:
-            raise ConfigError("gitlab section is required in configuration")
-        
-        gitlab_config = GitLabConfig(
-            base_url=gitlab_data.get("base_url", ""),
-            private_token=gitlab_data.get("private_token", ""),
-            api_version=gitlab_data.get("api_version", "v4"),
-            verify_ssl=gitlab_data.get("verify_ssl", True),
-            timeout_seconds=gitlab_data.get("timeout_seconds", 15),
-        )
-
-        # Parse scan config
-        scan_data = raw_config.get("scan", {})
-        scan_config = ScanConfig(
-            mode=scan_data.get("mode", "auto_discover")
-        )
-
-        # Parse projects config
-        projects_data = raw_config.get("projects", {})
-        projects_config = ProjectsConfig(
-            by_id=projects_data.get("by_id", []),
-            by_path=projects_data.get("by_path", []),
+        _validate_raw(raw_config)
+
+        gitlab_config = _build_section(GitLabConfig, raw_config["gitlab"])
+        scan_config = _build_section(ScanConfig, raw_config.get("scan"))
+        projects_config = _build_section(ProjectsConfig, raw_config.get("projects"))
+        groups_config = _build_section(GroupsConfig, raw_config.get("groups"))
+        filters_config = _build_section(FiltersConfig, raw_config.get("filters"))
+        # Optional sections, only built when present
+        jira_config = (
+            _build_section(JIRAConfig, raw_config["jira"])
+            if "jira" in raw_config else None
         )
-
-        # Parse groups config
-        groups_data = raw_config.get("groups", {})
-        groups_config = GroupsConfig(
-            include_subgroups=groups_data.get("include_subgroups", True),
-            by_id=groups_data.get("by_id", []),
-            by_path=groups_data.get("by_path", []),
-        )
-
-        # Parse filters config
-        filters_data = raw_config.get("filters", {})
-        filters_config = FiltersConfig(
-            include_project_paths=filters_data.get("include_project_paths", []),
-            exclude_project_paths=filters_data.get("exclude_project_paths", []),
-        )
-
-        # Parse JIRA config (optional)
-        jira_data = raw_config.get("jira", {})
-        jira_config = JIRAConfig(
-            base_url=jira_data.get("base_url"),
-            project_key=jira_data.get("project_key"),
-        )
-
-        # Parse notifications config (optional)
-        notifications_data = raw_config.get("notifications", {})
-        notifications_config = NotificationsConfig(
-            slack_webhook=notifications_data.get("slack_webhook"),
-            teams_webhook=notifications_data.get("teams_webhook"),
+        notifications_config = (
+            _build_section(NotificationsConfig, raw_config["notifications"])
+            if "notifications" in raw_config else None
         )
 
-        # Create and return main config
-        return AppConfig(
+        # Create main config
+        app_config = AppConfig(
             gitlab=gitlab_config,
             scan=scan_config,
             projects=projects_config,
@@ -216,3 +344,5 @@ def load_config(config_path: str | Path) -> AppConfig:
     except Exception as e:
         raise ConfigError(f"Failed to parse configuration: {e}")
 
+    _CONFIG_CACHE[cache_key] = app_config
+    return app_config
@@ -5,18 +5,62 @@ Handles exporting delta comparison results to various formats (CSV, JSON, HTML,
 """
 
 import csv
+import gzip
+import heapq
 import json
 import logging
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import itemgetter
+from html import escape as _html_escape
 
 from .models import DeltaResult, DeltaSummary, MRResult, MRSummary, MergeRequest
 
 
 logger = logging.getLogger(__name__)
 
+# Output files are written through a 1 MiB buffer so large reports are
+# flushed in a few big writes instead of thousands of 8 KiB ones.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Data embedded in HTML reports is only read by the report's JavaScript,
+# so it is serialized without the default spaces after "," and ":".
+COMPACT_JSON_SEPARATORS = (',', ':')
+
+
+def _open_output(output_file: Path, newline: Optional[str] = None) -> TextIO:
+    """
+    Open an export file for writing text.
+    
+    A ".gz" suffix (e.g. delta.html.gz) writes the file gzip-compressed;
+    reports are mostly repeated markup and shrink several times over.
+    """
+    if output_file.suffix == '.gz':
+        return gzip.open(output_file, 'wt', encoding='utf-8', newline=newline)
+    return output_file.open('w', newline=newline, encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+
+def _write_json_array(jsonfile, items: Iterable[Dict[str, Any]]) -> None:
+    """
+    Write items as a JSON array, serializing one item at a time.
+    
+    Only one item's dictionaries are alive at a time, and the output is
+    byte-for-byte what json.dump(list, indent=2) would produce.
+    """
+    jsonfile.write("[")
+    empty = True
+    for item in items:
+        chunk = json.dumps(item, indent=2, ensure_ascii=False)
+        # json.dumps escapes newlines inside strings, so every raw
+        # newline is indentation that needs one more level
+        jsonfile.write("\n  " if empty else ",\n  ")
+        jsonfile.write(chunk.replace("\n", "\n  "))
+        empty = False
+    jsonfile.write("]" if empty else "\n]")
+
 
 class DeltaCSVExporter:
     """
@@ -27,7 +71,7 @@ class DeltaCSVExporter:
     """
     
     # CSV column headers
-    HEADERS = [
+    HEADERS = (
         "project_path",
         "project_name",
         "project_id",
@@ -53,7 +97,7 @@ class DeltaCSVExporter:
         "compare_timeout",
         "compare_same_ref",
         "error"
-    ]
+    )
     
     def export(self, deltas: List[DeltaResult], output_path: str, jira_linker=None) -> None:
         """
@@ -72,25 +116,13 @@ class DeltaCSVExporter:
         logger.info(f"Exporting delta results to {output_path}")
         
         try:
-            with output_file.open('w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.HEADERS)
-                writer.writeheader()
+            with _open_output(output_file, newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.HEADERS)
                 
-                rows_written = 0
-                
-                for delta in deltas:
-                    if delta.commits:
-                        # Write one row per commit
-                        for commit in delta.commits:
-                            row = self._create_row(delta, commit, jira_linker)
-                            writer.writerow(row)
-                            rows_written += 1
-                    else:
-                        # Write one row for the project even if no commits
-                        # This helps identify projects where refs don't exist or comparison failed
-                        row = self._create_empty_row(delta)
-                        writer.writerow(row)
-                        rows_written += 1
+                writer.writerows(self._iter_rows(deltas, jira_linker))
+                # One row per commit, or a single row for a delta without any
+                rows_written = sum(len(delta.commits) or 1 for delta in deltas)
                 
             logger.info(f"Successfully exported {rows_written} rows to {output_path}")
             
@@ -98,6 +130,40 @@ class DeltaCSVExporter:
             logger.error(f"Failed to write CSV file: {e}")
             raise
     
+    def _iter_rows(self, deltas: List[DeltaResult], jira_linker=None) -> Iterator[tuple]:
+        """
+        Yield CSV rows as tuples in HEADERS order.
+        
+        The project and comparison columns are the same for every commit of
+        a delta, so they are built once per delta and joined with each
+        commit's columns.
+        """
+        for delta in deltas:
+            project_fields = (
+                delta.project_path,
+                delta.project_name,
+                delta.project_id,
+                delta.project_web_url,
+                delta.base_ref,
+                delta.target_ref,
+                delta.base_exists,
+                delta.target_exists,
+            )
+            status_fields = (
+                delta.compare_timeout,
+                delta.compare_same_ref,
+                self._sanitize_text(delta.error) if delta.error else "",
+            )
+            
+            if delta.commits:
+                # Write one row per commit
+                for commit in delta.commits:
+                    yield project_fields + self._commit_fields(commit, jira_linker) + status_fields
+            else:
+                # Write one row for the project even if no commits
+                # This helps identify projects where refs don't exist or comparison failed
+                yield project_fields + self._EMPTY_COMMIT_FIELDS + status_fields
+    
     @staticmethod
     def _sanitize_text(text: str) -> str:
         """
@@ -115,73 +181,37 @@ class DeltaCSVExporter:
         # Also strip multiple consecutive spaces
         return ' '.join(text.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ').split())
     
-    def _create_row(self, delta: DeltaResult, commit, jira_linker=None) -> dict:
-        """Create a CSV row for a commit."""
+    # Commit columns (commit_sha .. jira_ticket_urls) for projects without commits
+    _EMPTY_COMMIT_FIELDS = ("",) * 14
+    
+    def _commit_fields(self, commit, jira_linker=None) -> tuple:
+        """Build the per-commit CSV columns, commit_sha through jira_ticket_urls."""
         # Extract JIRA tickets if linker is provided
         jira_tickets = ""
         jira_ticket_urls = ""
         
         if jira_linker:
-            tickets = jira_linker.extract_tickets_from_text(commit.title + " " + commit.message)
+            tickets = jira_linker.get_commit_tickets(commit)
             if tickets:
-                jira_tickets = "|".join(sorted(tickets))
-                jira_ticket_urls = "|".join([jira_linker.get_ticket_url(t) for t in sorted(tickets)])
-        
-        return {
-            "project_path": delta.project_path,
-            "project_name": delta.project_name,
-            "project_id": delta.project_id,
-            "project_web_url": delta.project_web_url,
-            "base_ref": delta.base_ref,
-            "target_ref": delta.target_ref,
-            "base_exists": delta.base_exists,
-            "target_exists": delta.target_exists,
-            "commit_sha": commit.commit_sha,
-            "short_id": commit.short_id,
-            "title": self._sanitize_text(commit.title),
-            "message": self._sanitize_text(commit.message),
-            "author_name": self._sanitize_text(commit.author_name),
-            "author_email": commit.author_email,
-            "authored_date": commit.authored_date,
-            "committed_date": commit.committed_date,
-            "committer_name": self._sanitize_text(commit.committer_name),
-            "committer_email": commit.committer_email,
-            "commit_web_url": commit.web_url,
-            "parent_shas": "|".join(commit.parent_ids) if commit.parent_ids else "",
-            "jira_tickets": jira_tickets,
-            "jira_ticket_urls": jira_ticket_urls,
-            "compare_timeout": delta.compare_timeout,
-            "compare_same_ref": delta.compare_same_ref,
-            "error": self._sanitize_text(delta.error) if delta.error else ""
-        }
-    
-    def _create_empty_row(self, delta: DeltaResult) -> dict:
-        """Create a CSV row for a project with no commits (error or no changes)."""
-        return {
-            "project_path": delta.project_path,
-            "project_name": delta.project_name,
-            "project_id": delta.project_id,
-            "project_web_url": delta.project_web_url,
-            "base_ref": delta.base_ref,
-            "target_ref": delta.target_ref,
-            "base_exists": delta.base_exists,
-            "target_exists": delta.target_exists,
-            "commit_sha": "",
-            "short_id": "",
-            "title": "",
-            "message": "",
-            "author_name": "",
-            "author_email": "",
-            "authored_date": "",
-            "committed_date": "",
-            "committer_name": "",
-            "committer_email": "",
-            "commit_web_url": "",
-            "parent_shas": "",
-            "compare_timeout": delta.compare_timeout,
-            "compare_same_ref": delta.compare_same_ref,
-            "error": self._sanitize_text(delta.error) if delta.error else ""
-        }
+                jira_tickets = "|".join(tickets)
+                jira_ticket_urls = "|".join([jira_linker.get_ticket_url(t) for t in tickets])
+        
+        return (
+            commit.commit_sha,
+            commit.short_id,
+            self._sanitize_text(commit.title),
+            self._sanitize_text(commit.message),
+            self._sanitize_text(commit.author_name),
+            commit.author_email,
+            commit.authored_date,
+            commit.committed_date,
+            self._sanitize_text(commit.committer_name),
+            commit.committer_email,
+            commit.web_url,
+            "|".join(commit.parent_ids) if commit.parent_ids else "",
+            jira_tickets,
+            jira_ticket_urls,
+        )
 
 
 class DeltaJSONExporter:
@@ -207,698 +237,192 @@ class DeltaJSONExporter:
         logger.info(f"Exporting delta results to {output_path}")
         
         try:
-            # Convert dataclasses to dictionaries
-            data = []
-            for delta in deltas:
-                delta_dict = {
-                    "project": {
-                        "id": delta.project_id,
-                        "name": delta.project_name,
-                        "path": delta.project_path,
-                        "web_url": delta.project_web_url
-                    },
-                    "comparison": {
-                        "base_ref": delta.base_ref,
-                        "target_ref": delta.target_ref,
-                        "base_exists": delta.base_exists,
-                        "target_exists": delta.target_exists,
-                        "compare_timeout": delta.compare_timeout,
-                        "compare_same_ref": delta.compare_same_ref
-                    },
-                    "statistics": {
-                        "total_commits": delta.total_commits,
-                        "filtered_commits": len(delta.commits),
-                        "files_changed": delta.files_changed,
-                        "total_additions": delta.total_additions,
-                        "total_deletions": delta.total_deletions
-                    },
-                    "commits": [
-                        {
-                            "sha": commit.commit_sha,
-                            "short_id": commit.short_id,
-                            "title": commit.title,
-                            "message": commit.message,
-                            "author": {
-                                "name": commit.author_name,
-                                "email": commit.author_email,
-                                "date": commit.authored_date
-                            },
-                            "committer": {
-                                "name": commit.committer_name,
-                                "email": commit.committer_email,
-                                "date": commit.committed_date
-                            },
-                            "web_url": commit.web_url,
-                            "parent_ids": commit.parent_ids
-                        }
-                        for commit in delta.commits
-                    ],
-                    "error": delta.error
-                }
-                data.append(delta_dict)
-            
-            with output_file.open('w', encoding='utf-8') as jsonfile:
-                json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+            with _open_output(output_file) as jsonfile:
+                _write_json_array(jsonfile, map(self._delta_to_dict, deltas))
             
             logger.info(f"Successfully exported {len(deltas)} delta results to {output_path}")
             
         except IOError as e:
             logger.error(f"Failed to write JSON file: {e}")
             raise
+    
+    @staticmethod
+    def _delta_to_dict(delta: DeltaResult) -> Dict[str, Any]:
+        """Convert a DeltaResult to its JSON representation."""
+        return {
+            "project": {
+                "id": delta.project_id,
+                "name": delta.project_name,
+                "path": delta.project_path,
+                "web_url": delta.project_web_url
+            },
+            "comparison": {
+                "base_ref": delta.base_ref,
+                "target_ref": delta.target_ref,
+                "base_exists": delta.base_exists,
+                "target_exists": delta.target_exists,
+                "compare_timeout": delta.compare_timeout,
+                "compare_same_ref": delta.compare_same_ref
+            },
+            "statistics": {
+                "total_commits": delta.total_commits,
+                "filtered_commits": len(delta.commits),
+                "files_changed": delta.files_changed,
+                "total_additions": delta.total_additions,
+                "total_deletions": delta.total_deletions
+            },
+            "commits": [
+                {
+                    "sha": commit.commit_sha,
+                    "short_id": commit.short_id,
+                    "title": commit.title,
+                    "message": commit.message,
+                    "author": {
+                        "name": commit.author_name,
+                        "email": commit.author_email,
+                        "date": commit.authored_date
+                    },
+                    "committer": {
+                        "name": commit.committer_name,
+                        "email": commit.committer_email,
+                        "date": commit.committed_date
+                    },
+                    "web_url": commit.web_url,
+                    "parent_ids": commit.parent_ids
+                }
+                for commit in delta.commits
+            ],
+            "error": delta.error
+        }
 
 
-class DeltaHTMLExporter:
+def _minify_css(css: str) -> str:
     """
-    Exports delta results to a modern, interactive HTML report.
+    Strip comments and insignificant whitespace from a report stylesheet.
     
-    Creates a self-contained HTML file with:
-    - Tabbed navigation (Overview, By Project, By Author, Timeline)
-    - Interactive search and filters
-    - Visual charts for project and author breakdown
-    - Collapsible project sections
-    - JIRA ticket integration
-    - Dark mode support
-    - Export to CSV/JSON from within the report
-    - Print-optimized stylesheet
+    Only whitespace runs and the spaces around braces and semicolons are
+    touched, which is safe as long as no quoted value contains them.
     """
-    
-    def export(self, deltas: List[DeltaResult], output_path: str, summary: DeltaSummary = None, jira_linker=None) -> None:
-        """
-        Export delta results to HTML file.
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r" ?([{};]) ?", r"\1", css).strip()
+
+
+# Stylesheet and script embedded in every delta HTML report. They are
+# static, so they are defined once at import instead of per export. The
+# stylesheet is minified; the script is kept as written because its line
+# comments depend on the newlines.
+_DELTA_REPORT_CSS = _minify_css("""
+        :root {
+            --bg-primary: #f8fafc;
+            --bg-secondary: #ffffff;
+            --bg-tertiary: #f1f5f9;
+            --text-primary: #1e293b;
+            --text-secondary: #64748b;
+            --text-muted: #94a3b8;
+            --border-color: #e2e8f0;
+            --accent-primary: #6366f1;
+            --accent-secondary: #8b5cf6;
+            --accent-gradient: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
+            --success: #10b981;
+            --error: #ef4444;
+            --warning: #f59e0b;
+            --shadow-sm: 0 1px 2px rgba(0,0,0,0.05);
+            --shadow-md: 0 4px 6px rgba(0,0,0,0.07);
+            --shadow-lg: 0 10px 25px rgba(0,0,0,0.1);
+            --radius-sm: 6px;
+            --radius-md: 10px;
+            --radius-lg: 16px;
+        }
         
-        Args:
-            deltas: List of DeltaResult objects
-            output_path: Path to output HTML file
-            summary: Optional DeltaSummary for enhanced reporting
-            jira_linker: Optional JIRALinker for ticket extraction
-        """
-        output_file = Path(output_path)
+        [data-theme="dark"] {
+            --bg-primary: #0f172a;
+            --bg-secondary: #1e293b;
+            --bg-tertiary: #334155;
+            --text-primary: #f1f5f9;
+            --text-secondary: #94a3b8;
+            --text-muted: #64748b;
+            --border-color: #334155;
+            --shadow-sm: 0 1px 2px rgba(0,0,0,0.3);
+            --shadow-md: 0 4px 6px rgba(0,0,0,0.4);
+            --shadow-lg: 0 10px 25px rgba(0,0,0,0.5);
+        }
         
-        logger.info(f"Exporting delta results to {output_path}")
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
         
-        try:
-            html_content = self._generate_html(deltas, summary, jira_linker)
-            
-            with output_file.open('w', encoding='utf-8') as htmlfile:
-                htmlfile.write(html_content)
-            
-            logger.info(f"Successfully exported HTML report to {output_path}")
-            
-        except IOError as e:
-            logger.error(f"Failed to write HTML file: {e}")
-            raise
-    
-    def _collect_statistics(self, deltas: List[DeltaResult], jira_linker=None) -> Dict[str, Any]:
-        """Collect all statistics needed for the report."""
-        stats = {
-            'total_commits': 0,
-            'projects_searched': len(deltas),
-            'projects_with_changes': 0,
-            'projects_with_errors': 0,
-            'unique_authors': set(),
-            'jira_tickets': set(),
-            'commits_by_project': defaultdict(int),
-            'commits_by_author': defaultdict(int),
-            'commits_by_date': defaultdict(int),
-            'all_commits': [],
-            'ticket_summary': defaultdict(lambda: {'count': 0, 'projects': set(), 'commits': []})
+        body {
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: var(--bg-primary);
+            color: var(--text-primary);
+            line-height: 1.6;
+            min-height: 100vh;
         }
         
-        for delta in deltas:
-            if delta.has_changes:
-                stats['projects_with_changes'] += 1
-            if delta.error:
-                stats['projects_with_errors'] += 1
-            
-            stats['commits_by_project'][delta.project_name] = len(delta.commits)
-            stats['total_commits'] += len(delta.commits)
-            
-            for commit in delta.commits:
-                stats['unique_authors'].add(commit.author_name)
-                stats['commits_by_author'][commit.author_name] += 1
-                
-                # Extract date for timeline
-                if commit.committed_date:
-                    date_str = commit.committed_date[:10]
-                    stats['commits_by_date'][date_str] += 1
-                
-                # Extract JIRA tickets
-                if jira_linker:
-                    tickets = jira_linker.extract_tickets_from_text(
-                        commit.title + " " + commit.message
-                    )
-                    for ticket in tickets:
-                        stats['jira_tickets'].add(ticket)
-                        stats['ticket_summary'][ticket]['count'] += 1
-                        stats['ticket_summary'][ticket]['projects'].add(delta.project_name)
-                        stats['ticket_summary'][ticket]['commits'].append(commit.short_id)
-                        stats['ticket_summary'][ticket]['url'] = jira_linker.get_ticket_url(ticket)
-                
-                # Store commit with project info
-                stats['all_commits'].append({
-                    'project_name': delta.project_name,
-                    'project_path': delta.project_path,
-                    'project_url': delta.project_web_url,
-                    'sha': commit.commit_sha,
-                    'short_id': commit.short_id,
-                    'title': commit.title,
-                    'message': commit.message,
-                    'author': commit.author_name,
-                    'email': commit.author_email,
-                    'date': commit.committed_date,
-                    'url': commit.web_url,
-                    'tickets': list(jira_linker.extract_tickets_from_text(
-                        commit.title + " " + commit.message
-                    )) if jira_linker else []
-                })
+        .app-container {
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 20px;
+        }
         
-        # Sort commits by date (newest first)
-        stats['all_commits'].sort(key=lambda x: x['date'] or '', reverse=True)
+        /* Header */
+        .header {
+            background: var(--accent-gradient);
+            border-radius: var(--radius-lg);
+            padding: 30px;
+            margin-bottom: 24px;
+            color: white;
+            box-shadow: var(--shadow-lg);
+        }
         
-        # Convert sets to lists for JSON serialization
-        stats['unique_authors'] = list(stats['unique_authors'])
-        stats['jira_tickets'] = list(stats['jira_tickets'])
+        .header-content {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 20px;
+        }
         
-        # Convert ticket summary projects to lists
-        for ticket_id in stats['ticket_summary']:
-            stats['ticket_summary'][ticket_id]['projects'] = list(
-                stats['ticket_summary'][ticket_id]['projects']
-            )
+        .header-left {
+            display: flex;
+            align-items: baseline;
+            gap: 12px;
+        }
         
-        return stats
-    
-    def _generate_html(self, deltas: List[DeltaResult], summary: DeltaSummary = None, jira_linker=None) -> str:
-        """Generate the complete HTML content."""
+        .header h1 {
+            font-size: 2rem;
+            font-weight: 700;
+        }
         
-        # Get base and target refs
-        base_ref = deltas[0].base_ref if deltas else "N/A"
-        target_ref = deltas[0].target_ref if deltas else "N/A"
+        .header-subtitle {
+            font-size: 1.1rem;
+            opacity: 0.9;
+        }
         
-        # Collect statistics
-        stats = self._collect_statistics(deltas, jira_linker)
+        .theme-toggle {
+            background: rgba(255,255,255,0.2);
+            border: none;
+            border-radius: 50%;
+            width: 44px;
+            height: 44px;
+            cursor: pointer;
+            font-size: 1.3rem;
+            transition: all 0.2s;
+        }
         
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        .theme-toggle:hover {
+            background: rgba(255,255,255,0.3);
+            transform: scale(1.1);
+        }
         
-        # Prepare data for JavaScript
-        commits_json = json.dumps(stats['all_commits'], ensure_ascii=False)
-        projects_data = json.dumps(dict(stats['commits_by_project']), ensure_ascii=False)
-        authors_data = json.dumps(dict(stats['commits_by_author']), ensure_ascii=False)
-        ticket_data = json.dumps(dict(stats['ticket_summary']), ensure_ascii=False)
-        
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitDoctor Delta Report</title>
-    <style>
-{self._get_css()}
-    </style>
-</head>
-<body>
-    <div class="app-container">
-        <!-- Header -->
-        <header class="header">
-            <div class="header-content">
-                <div class="header-left">
-                    <h1>🔍 GitDoctor</h1>
-                    <span class="header-subtitle">Delta Report</span>
-                </div>
-                <div class="header-right">
-                    <button class="theme-toggle" onclick="toggleTheme()" title="Toggle dark mode">
-                        <span class="theme-icon">🌙</span>
-                    </button>
-                </div>
-            </div>
-            <div class="ref-badge-container">
-                <div class="ref-badge base">
-                    <span class="ref-label">BASE</span>
-                    <span class="ref-value" title="{self._escape_html(base_ref)}">{self._escape_html(self._truncate(base_ref, 40))}</span>
-                </div>
-                <span class="ref-arrow">→</span>
-                <div class="ref-badge target">
-                    <span class="ref-label">TARGET</span>
-                    <span class="ref-value" title="{self._escape_html(target_ref)}">{self._escape_html(self._truncate(target_ref, 40))}</span>
-                </div>
-            </div>
-        </header>
-        
-        <!-- Summary Cards -->
-        <section class="summary-cards">
-            <div class="stat-card">
-                <div class="stat-icon">📝</div>
-                <div class="stat-info">
-                    <div class="stat-value">{stats['total_commits']}</div>
-                    <div class="stat-label">Total Commits</div>
-                </div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-icon">📁</div>
-                <div class="stat-info">
-                    <div class="stat-value">{stats['projects_with_changes']}</div>
-                    <div class="stat-label">Projects Changed</div>
-                </div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-icon">👥</div>
-                <div class="stat-info">
-                    <div class="stat-value">{len(stats['unique_authors'])}</div>
-                    <div class="stat-label">Contributors</div>
-                </div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-icon">🎫</div>
-                <div class="stat-info">
-                    <div class="stat-value">{len(stats['jira_tickets'])}</div>
-                    <div class="stat-label">JIRA Tickets</div>
-                </div>
-            </div>
-        </section>
-        
-        <!-- Tabs Navigation -->
-        <nav class="tabs-nav">
-            <button class="tab-btn active" data-tab="overview">📊 Overview</button>
-            <button class="tab-btn" data-tab="projects">📁 By Project</button>
-            <button class="tab-btn" data-tab="authors">👥 By Author</button>
-            <button class="tab-btn" data-tab="timeline">📅 Timeline</button>
-            {f'<button class="tab-btn" data-tab="jira">🎫 JIRA Tickets</button>' if jira_linker and stats['jira_tickets'] else ''}
-        </nav>
-        
-        <!-- Search Bar -->
-        <div class="search-container">
-            <input type="text" id="searchInput" class="search-input" placeholder="🔍 Search commits by SHA, message, author...">
-            <select id="projectFilter" class="filter-select">
-                <option value="">All Projects</option>
-                {self._generate_project_options(deltas)}
-            </select>
-        </div>
-        
-        <!-- Tab Content -->
-        <main class="tab-content">
-            <!-- Overview Tab -->
-            <div id="overview" class="tab-pane active">
-                <div class="charts-grid">
-                    <div class="chart-card">
-                        <h3>📁 Commits by Project</h3>
-                        <div class="chart-container" id="projectChart"></div>
-                    </div>
-                    <div class="chart-card">
-                        <h3>👥 Top Contributors</h3>
-                        <div class="chart-container" id="authorChart"></div>
-                    </div>
-                </div>
-                
-                {self._generate_quick_stats(stats)}
-            </div>
-            
-            <!-- Projects Tab -->
-            <div id="projects" class="tab-pane">
-                <div class="projects-list">
-                    {self._generate_projects_section(deltas, jira_linker)}
-                </div>
-            </div>
-            
-            <!-- Authors Tab -->
-            <div id="authors" class="tab-pane">
-                <div class="authors-list">
-                    {self._generate_authors_section(deltas, stats)}
-                </div>
-            </div>
-            
-            <!-- Timeline Tab -->
-            <div id="timeline" class="tab-pane">
-                <div class="timeline-container" id="timelineContainer">
-                    <!-- Populated by JavaScript -->
-                </div>
-                <div class="load-more" id="loadMore">
-                    <button onclick="loadMoreCommits()">Load More Commits</button>
-                </div>
-            </div>
-            
-            <!-- JIRA Tab -->
-            {self._generate_jira_tab(stats, jira_linker) if jira_linker and stats['jira_tickets'] else ''}
-        </main>
-        
-        <!-- Footer -->
-        <footer class="footer">
-            <div class="footer-left">
-                <span>Generated by GitDoctor on {timestamp}</span>
-            </div>
-            <div class="footer-right">
-                <button class="export-btn" onclick="exportCSV()">📥 Export CSV</button>
-                <button class="export-btn" onclick="exportJSON()">📥 Export JSON</button>
-                <button class="export-btn" onclick="window.print()">🖨️ Print</button>
-            </div>
-        </footer>
-    </div>
-    
-    <script>
-        // Data
-        const allCommits = {commits_json};
-        const projectsData = {projects_data};
-        const authorsData = {authors_data};
-        const ticketData = {ticket_data};
-        const baseRef = {json.dumps(base_ref)};
-        const targetRef = {json.dumps(target_ref)};
-        
-        {self._get_javascript()}
-    </script>
-</body>
-</html>"""
-        
-        return html
-    
-    def _generate_project_options(self, deltas: List[DeltaResult]) -> str:
-        """Generate project dropdown options."""
-        options = ""
-        for delta in sorted(deltas, key=lambda d: d.project_name):
-            options += f'<option value="{self._escape_html(delta.project_name)}">{self._escape_html(delta.project_name)}</option>\n'
-        return options
-    
-    def _generate_quick_stats(self, stats: Dict[str, Any]) -> str:
-        """Generate quick stats section for overview."""
-        # Top 5 projects
-        top_projects = sorted(stats['commits_by_project'].items(), key=lambda x: x[1], reverse=True)[:5]
-        # Top 5 authors
-        top_authors = sorted(stats['commits_by_author'].items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        html = '<div class="quick-stats">'
-        
-        # Top Projects
-        html += '<div class="quick-stat-card"><h4>🏆 Top Projects</h4><ol class="ranked-list">'
-        for project, count in top_projects:
-            html += f'<li><span class="rank-name">{self._escape_html(project)}</span><span class="rank-count">{count}</span></li>'
-        html += '</ol></div>'
-        
-        # Top Authors
-        html += '<div class="quick-stat-card"><h4>🏆 Top Contributors</h4><ol class="ranked-list">'
-        for author, count in top_authors:
-            html += f'<li><span class="rank-name">{self._escape_html(author)}</span><span class="rank-count">{count}</span></li>'
-        html += '</ol></div>'
-        
-        html += '</div>'
-        return html
-    
-    def _generate_projects_section(self, deltas: List[DeltaResult], jira_linker=None) -> str:
-        """Generate collapsible projects section."""
-        html = ""
-        
-        # Sort by commit count descending
-        sorted_deltas = sorted(deltas, key=lambda d: len(d.commits), reverse=True)
-        
-        for delta in sorted_deltas:
-            commit_count = len(delta.commits)
-            status_class = "success" if delta.has_changes else ("error" if delta.error else "neutral")
-            status_icon = "✅" if delta.has_changes else ("❌" if delta.error else "⚪")
-            
-            html += f'''
-            <div class="project-card {status_class}">
-                <div class="project-header" onclick="toggleProject(this)">
-                    <div class="project-title">
-                        <span class="collapse-icon">▶</span>
-                        <span class="status-icon">{status_icon}</span>
-                        <h3>{self._escape_html(delta.project_name)}</h3>
-                        <span class="commit-badge">{commit_count} commits</span>
-                    </div>
-                    <a href="{delta.project_web_url}" target="_blank" class="project-link" onclick="event.stopPropagation()">View in GitLab →</a>
-                </div>
-                <div class="project-path">{self._escape_html(delta.project_path)}</div>
-                {f'<div class="error-msg">⚠️ {self._escape_html(delta.error)}</div>' if delta.error else ''}
-                <div class="project-commits" style="display: none;">'''
-            
-            if delta.commits:
-                html += '<table class="commits-mini-table"><thead><tr><th>SHA</th><th>Message</th><th>Author</th><th>Date</th></tr></thead><tbody>'
-                for commit in delta.commits[:50]:  # Limit per project
-                    date_str = commit.committed_date[:10] if commit.committed_date else "N/A"
-                    
-                    # Extract tickets
-                    tickets_html = ""
-                    if jira_linker:
-                        tickets = jira_linker.extract_tickets_from_text(commit.title + " " + commit.message)
-                        if tickets:
-                            tickets_html = " ".join([
-                                f'<a href="{jira_linker.get_ticket_url(t)}" class="ticket-badge" target="_blank">{t}</a>'
-                                for t in sorted(tickets)
-                            ])
-                    
-                    html += f'''<tr>
-                        <td><a href="{commit.web_url}" target="_blank" class="sha-link">{commit.short_id}</a></td>
-                        <td class="commit-msg">{self._escape_html(self._truncate(commit.title, 60))} {tickets_html}</td>
-                        <td>{self._escape_html(commit.author_name)}</td>
-                        <td>{date_str}</td>
-                    </tr>'''
-                
-                if len(delta.commits) > 50:
-                    html += f'<tr><td colspan="4" class="more-indicator">... and {len(delta.commits) - 50} more commits</td></tr>'
-                
-                html += '</tbody></table>'
-            else:
-                html += '<p class="no-commits">No commits in this project for the selected range.</p>'
-            
-            html += '</div></div>'
-        
-        return html
-    
-    def _generate_authors_section(self, deltas: List[DeltaResult], stats: Dict[str, Any]) -> str:
-        """Generate authors breakdown section."""
-        # Group commits by author
-        author_commits = defaultdict(list)
-        
-        for delta in deltas:
-            for commit in delta.commits:
-                author_commits[commit.author_name].append({
-                    'project': delta.project_name,
-                    'sha': commit.short_id,
-                    'title': commit.title,
-                    'date': commit.committed_date,
-                    'url': commit.web_url
-                })
-        
-        # Sort authors by commit count
-        sorted_authors = sorted(author_commits.items(), key=lambda x: len(x[1]), reverse=True)
-        
-        html = ""
-        for author, commits in sorted_authors:
-            html += f'''
-            <div class="author-card">
-                <div class="author-header" onclick="toggleAuthor(this)">
-                    <div class="author-info">
-                        <span class="collapse-icon">▶</span>
-                        <div class="author-avatar">{self._get_initials(author)}</div>
-                        <h3>{self._escape_html(author)}</h3>
-                        <span class="commit-badge">{len(commits)} commits</span>
-                    </div>
-                </div>
-                <div class="author-commits" style="display: none;">
-                    <table class="commits-mini-table">
-                        <thead><tr><th>Project</th><th>SHA</th><th>Message</th><th>Date</th></tr></thead>
-                        <tbody>'''
-            
-            for c in commits[:30]:
-                date_str = c['date'][:10] if c['date'] else "N/A"
-                html += f'''<tr>
-                    <td><code>{self._escape_html(c['project'])}</code></td>
-                    <td><a href="{c['url']}" target="_blank" class="sha-link">{c['sha']}</a></td>
-                    <td class="commit-msg">{self._escape_html(self._truncate(c['title'], 50))}</td>
-                    <td>{date_str}</td>
-                </tr>'''
-            
-            if len(commits) > 30:
-                html += f'<tr><td colspan="4" class="more-indicator">... and {len(commits) - 30} more commits</td></tr>'
-            
-            html += '</tbody></table></div></div>'
-        
-        return html
-    
-    def _generate_jira_tab(self, stats: Dict[str, Any], jira_linker) -> str:
-        """Generate JIRA tickets tab content."""
-        if not jira_linker or not stats['jira_tickets']:
-            return ''
-        
-        html = '''
-        <div id="jira" class="tab-pane">
-            <div class="jira-summary">
-                <table class="jira-table">
-                    <thead>
-                        <tr>
-                            <th>Ticket</th>
-                            <th>Commits</th>
-                            <th>Projects</th>
-                            <th>Link</th>
-                        </tr>
-                    </thead>
-                    <tbody>'''
-        
-        # Sort tickets by commit count
-        sorted_tickets = sorted(
-            stats['ticket_summary'].items(),
-            key=lambda x: x[1]['count'],
-            reverse=True
-        )
-        
-        for ticket_id, data in sorted_tickets:
-            projects_str = ", ".join(data['projects'][:3])
-            if len(data['projects']) > 3:
-                projects_str += f" +{len(data['projects']) - 3} more"
-            
-            html += f'''
-                <tr>
-                    <td><strong class="ticket-id">{ticket_id}</strong></td>
-                    <td>{data['count']}</td>
-                    <td>{self._escape_html(projects_str)}</td>
-                    <td><a href="{data['url']}" target="_blank" class="jira-link">View in JIRA →</a></td>
-                </tr>'''
-        
-        html += '''
-                    </tbody>
-                </table>
-            </div>
-        </div>'''
-        
-        return html
-    
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters."""
-        if not text:
-            return ""
-        return (str(text)
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;")
-                .replace("'", "&#x27;"))
-    
-    def _truncate(self, text: str, max_len: int) -> str:
-        """Truncate text with ellipsis."""
-        if not text:
-            return ""
-        if len(text) <= max_len:
-            return text
-        return text[:max_len - 3] + "..."
-    
-    def _get_initials(self, name: str) -> str:
-        """Get initials from name."""
-        if not name:
-            return "?"
-        parts = name.split()
-        if len(parts) >= 2:
-            return (parts[0][0] + parts[-1][0]).upper()
-        return name[0].upper()
-    
-    def _get_css(self) -> str:
-        """Get comprehensive CSS styles."""
-        return """
-        :root {
-            --bg-primary: #f8fafc;
-            --bg-secondary: #ffffff;
-            --bg-tertiary: #f1f5f9;
-            --text-primary: #1e293b;
-            --text-secondary: #64748b;
-            --text-muted: #94a3b8;
-            --border-color: #e2e8f0;
-            --accent-primary: #6366f1;
-            --accent-secondary: #8b5cf6;
-            --accent-gradient: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-            --success: #10b981;
-            --error: #ef4444;
-            --warning: #f59e0b;
-            --shadow-sm: 0 1px 2px rgba(0,0,0,0.05);
-            --shadow-md: 0 4px 6px rgba(0,0,0,0.07);
-            --shadow-lg: 0 10px 25px rgba(0,0,0,0.1);
-            --radius-sm: 6px;
-            --radius-md: 10px;
-            --radius-lg: 16px;
-        }
-        
-        [data-theme="dark"] {
-            --bg-primary: #0f172a;
-            --bg-secondary: #1e293b;
-            --bg-tertiary: #334155;
-            --text-primary: #f1f5f9;
-            --text-secondary: #94a3b8;
-            --text-muted: #64748b;
-            --border-color: #334155;
-            --shadow-sm: 0 1px 2px rgba(0,0,0,0.3);
-            --shadow-md: 0 4px 6px rgba(0,0,0,0.4);
-            --shadow-lg: 0 10px 25px rgba(0,0,0,0.5);
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            line-height: 1.6;
-            min-height: 100vh;
-        }
-        
-        .app-container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        /* Header */
-        .header {
-            background: var(--accent-gradient);
-            border-radius: var(--radius-lg);
-            padding: 30px;
-            margin-bottom: 24px;
-            color: white;
-            box-shadow: var(--shadow-lg);
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }
-        
-        .header-left {
-            display: flex;
-            align-items: baseline;
-            gap: 12px;
-        }
-        
-        .header h1 {
-            font-size: 2rem;
-            font-weight: 700;
-        }
-        
-        .header-subtitle {
-            font-size: 1.1rem;
-            opacity: 0.9;
-        }
-        
-        .theme-toggle {
-            background: rgba(255,255,255,0.2);
-            border: none;
-            border-radius: 50%;
-            width: 44px;
-            height: 44px;
-            cursor: pointer;
-            font-size: 1.3rem;
-            transition: all 0.2s;
-        }
-        
-        .theme-toggle:hover {
-            background: rgba(255,255,255,0.3);
-            transform: scale(1.1);
-        }
-        
-        .ref-badge-container {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            flex-wrap: wrap;
-        }
+        .ref-badge-container {
+            display: flex;
+            align-items: center;
+            gap: 16px;
+            flex-wrap: wrap;
+        }
         
         .ref-badge {
             background: rgba(255,255,255,0.15);
@@ -1270,582 +794,1113 @@ class DeltaHTMLExporter:
             font-size: 0.9rem;
         }
         
-        .project-commits {
-            padding: 0 20px 20px;
+        .project-commits {
+            padding: 0 20px 20px;
+        }
+        
+        .commits-mini-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.9rem;
+        }
+        
+        .commits-mini-table th {
+            text-align: left;
+            padding: 12px;
+            background: var(--bg-secondary);
+            color: var(--text-secondary);
+            font-weight: 600;
+            text-transform: uppercase;
+            font-size: 0.75rem;
+            letter-spacing: 0.5px;
+        }
+        
+        .commits-mini-table td {
+            padding: 12px;
+            border-bottom: 1px solid var(--border-color);
+        }
+        
+        .sha-link {
+            font-family: 'JetBrains Mono', monospace;
+            color: var(--accent-primary);
+            text-decoration: none;
+        }
+        
+        .sha-link:hover {
+            text-decoration: underline;
+        }
+        
+        .commit-msg {
+            max-width: 400px;
+        }
+        
+        .ticket-badge {
+            display: inline-block;
+            background: #0052CC;
+            color: white;
+            padding: 2px 8px;
+            border-radius: 4px;
+            font-size: 0.75rem;
+            font-weight: 600;
+            text-decoration: none;
+            margin-left: 8px;
+        }
+        
+        .ticket-badge:hover {
+            background: #0065FF;
+        }
+        
+        .more-indicator {
+            text-align: center;
+            color: var(--text-muted);
+            font-style: italic;
+        }
+        
+        .no-commits {
+            color: var(--text-muted);
+            padding: 20px;
+            text-align: center;
+        }
+        
+        /* Author Cards */
+        .author-card {
+            background: var(--bg-tertiary);
+            border-radius: var(--radius-md);
+            margin-bottom: 12px;
+            overflow: hidden;
+        }
+        
+        .author-header {
+            padding: 16px 20px;
+            cursor: pointer;
+            transition: background 0.2s;
+        }
+        
+        .author-header:hover {
+            background: var(--bg-secondary);
+        }
+        
+        .author-info {
+            display: flex;
+            align-items: center;
+            gap: 12px;
+        }
+        
+        .author-avatar {
+            width: 40px;
+            height: 40px;
+            background: var(--accent-gradient);
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: 600;
+            font-size: 0.9rem;
+        }
+        
+        .author-info h3 {
+            flex: 1;
+            font-size: 1rem;
+        }
+        
+        .author-commits {
+            padding: 0 20px 20px;
+        }
+        
+        /* Timeline */
+        .timeline-container {
+            max-height: 600px;
+            overflow-y: auto;
+        }
+        
+        .timeline-item {
+            display: flex;
+            gap: 16px;
+            padding: 16px 0;
+            border-bottom: 1px solid var(--border-color);
+        }
+        
+        .timeline-date {
+            min-width: 100px;
+            color: var(--text-muted);
+            font-size: 0.85rem;
+        }
+        
+        .timeline-content {
+            flex: 1;
+        }
+        
+        .timeline-header {
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            margin-bottom: 8px;
+        }
+        
+        .timeline-sha {
+            font-family: 'JetBrains Mono', monospace;
+            color: var(--accent-primary);
+            text-decoration: none;
+            font-size: 0.9rem;
+        }
+        
+        .timeline-project {
+            background: var(--bg-tertiary);
+            padding: 2px 10px;
+            border-radius: 4px;
+            font-size: 0.8rem;
+            color: var(--text-secondary);
+        }
+        
+        .timeline-title {
+            font-weight: 500;
+            margin-bottom: 4px;
+        }
+        
+        .timeline-author {
+            font-size: 0.85rem;
+            color: var(--text-muted);
+        }
+        
+        .load-more {
+            text-align: center;
+            padding: 20px;
+        }
+        
+        .load-more button {
+            background: var(--accent-gradient);
+            color: white;
+            border: none;
+            padding: 12px 24px;
+            border-radius: var(--radius-md);
+            cursor: pointer;
+            font-size: 0.95rem;
+            font-weight: 500;
+            transition: transform 0.2s;
+        }
+        
+        .load-more button:hover {
+            transform: scale(1.02);
         }
         
-        .commits-mini-table {
+        /* JIRA Table */
+        .jira-table {
             width: 100%;
             border-collapse: collapse;
-            font-size: 0.9rem;
         }
         
-        .commits-mini-table th {
+        .jira-table th {
             text-align: left;
-            padding: 12px;
-            background: var(--bg-secondary);
+            padding: 16px;
+            background: var(--bg-tertiary);
             color: var(--text-secondary);
             font-weight: 600;
             text-transform: uppercase;
             font-size: 0.75rem;
-            letter-spacing: 0.5px;
         }
         
-        .commits-mini-table td {
-            padding: 12px;
+        .jira-table td {
+            padding: 16px;
             border-bottom: 1px solid var(--border-color);
         }
         
-        .sha-link {
-            font-family: 'JetBrains Mono', monospace;
+        .ticket-id {
+            color: #0052CC;
+        }
+        
+        .jira-link {
             color: var(--accent-primary);
             text-decoration: none;
         }
         
-        .sha-link:hover {
+        .jira-link:hover {
             text-decoration: underline;
         }
         
-        .commit-msg {
-            max-width: 400px;
+        /* Footer */
+        .footer {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 20px 0;
+            margin-top: 24px;
+            border-top: 1px solid var(--border-color);
+            flex-wrap: wrap;
+            gap: 16px;
         }
         
-        .ticket-badge {
-            display: inline-block;
-            background: #0052CC;
+        .footer-left {
+            color: var(--text-muted);
+            font-size: 0.9rem;
+        }
+        
+        .footer-right {
+            display: flex;
+            gap: 12px;
+        }
+        
+        .export-btn {
+            background: var(--bg-tertiary);
+            border: 1px solid var(--border-color);
+            padding: 10px 16px;
+            border-radius: var(--radius-sm);
+            cursor: pointer;
+            font-size: 0.9rem;
+            color: var(--text-primary);
+            transition: all 0.2s;
+        }
+        
+        .export-btn:hover {
+            background: var(--accent-primary);
             color: white;
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-decoration: none;
-            margin-left: 8px;
+            border-color: var(--accent-primary);
         }
         
-        .ticket-badge:hover {
-            background: #0065FF;
+        /* Print Styles */
+        @media print {
+            body {
+                background: white !important;
+            }
+            
+            .header {
+                background: #333 !important;
+                -webkit-print-color-adjust: exact;
+                print-color-adjust: exact;
+            }
+            
+            .theme-toggle,
+            .search-container,
+            .footer-right,
+            .load-more {
+                display: none !important;
+            }
+            
+            .tab-pane {
+                display: block !important;
+                page-break-inside: avoid;
+            }
+            
+            .tabs-nav {
+                display: none;
+            }
+            
+            .project-commits,
+            .author-commits {
+                display: block !important;
+            }
         }
         
-        .more-indicator {
-            text-align: center;
-            color: var(--text-muted);
-            font-style: italic;
+        /* Responsive */
+        @media (max-width: 768px) {
+            .header-content {
+                flex-direction: column;
+                gap: 16px;
+            }
+            
+            .ref-badge-container {
+                flex-direction: column;
+                align-items: stretch;
+            }
+            
+            .ref-arrow {
+                transform: rotate(90deg);
+                text-align: center;
+            }
+            
+            .charts-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            .footer {
+                flex-direction: column;
+                text-align: center;
+            }
         }
+        """)
+
+_DELTA_REPORT_JS = """
+        // State
+        let currentPage = 0;
+        const pageSize = 50;
+        let filteredCommits = [...allCommits];
         
-        .no-commits {
-            color: var(--text-muted);
-            padding: 20px;
-            text-align: center;
+        // Initialize
+        document.addEventListener('DOMContentLoaded', function() {
+            initTabs();
+            initSearch();
+            renderCharts();
+            renderTimeline();
+            
+            // Check for saved theme
+            const savedTheme = localStorage.getItem('gitdoctor-theme');
+            if (savedTheme === 'dark') {
+                document.body.setAttribute('data-theme', 'dark');
+                document.querySelector('.theme-icon').textContent = '☀️';
+            }
+        });
+        
+        // Theme Toggle
+        function toggleTheme() {
+            const body = document.body;
+            const icon = document.querySelector('.theme-icon');
+            
+            if (body.getAttribute('data-theme') === 'dark') {
+                body.removeAttribute('data-theme');
+                icon.textContent = '🌙';
+                localStorage.setItem('gitdoctor-theme', 'light');
+            } else {
+                body.setAttribute('data-theme', 'dark');
+                icon.textContent = '☀️';
+                localStorage.setItem('gitdoctor-theme', 'dark');
+            }
         }
         
-        /* Author Cards */
-        .author-card {
-            background: var(--bg-tertiary);
-            border-radius: var(--radius-md);
-            margin-bottom: 12px;
-            overflow: hidden;
+        // Tabs
+        function initTabs() {
+            document.querySelectorAll('.tab-btn').forEach(btn => {
+                btn.addEventListener('click', () => {
+                    const tabId = btn.dataset.tab;
+                    
+                    // Update buttons
+                    document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
+                    btn.classList.add('active');
+                    
+                    // Update panes
+                    document.querySelectorAll('.tab-pane').forEach(p => p.classList.remove('active'));
+                    document.getElementById(tabId).classList.add('active');
+                });
+            });
         }
         
-        .author-header {
-            padding: 16px 20px;
-            cursor: pointer;
-            transition: background 0.2s;
+        // Search & Filter
+        function initSearch() {
+            const searchInput = document.getElementById('searchInput');
+            const projectFilter = document.getElementById('projectFilter');
+            
+            searchInput.addEventListener('input', debounce(filterCommits, 300));
+            projectFilter.addEventListener('change', filterCommits);
+        }
+        
+        function filterCommits() {
+            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+            const projectName = document.getElementById('projectFilter').value;
+            
+            filteredCommits = allCommits.filter(commit => {
+                const matchesSearch = !searchTerm || 
+                    commit.sha.toLowerCase().includes(searchTerm) ||
+                    commit.short_id.toLowerCase().includes(searchTerm) ||
+                    commit.title.toLowerCase().includes(searchTerm) ||
+                    commit.author.toLowerCase().includes(searchTerm) ||
+                    commit.message.toLowerCase().includes(searchTerm);
+                
+                const matchesProject = !projectName || commit.project_name === projectName;
+                
+                return matchesSearch && matchesProject;
+            });
+            
+            currentPage = 0;
+            renderTimeline();
+        }
+        
+        // Charts
+        function renderCharts() {
+            renderBarChart('projectChart', projectsData, 8);
+            renderBarChart('authorChart', authorsData, 8);
+        }
+        
+        function renderBarChart(containerId, data, limit) {
+            const container = document.getElementById(containerId);
+            if (!container) return;
+            
+            const sorted = Object.entries(data)
+                .sort((a, b) => b[1] - a[1])
+                .slice(0, limit);
+            
+            if (sorted.length === 0) {
+                container.innerHTML = '<p style="color: var(--text-muted); text-align: center; padding: 40px;">No data available</p>';
+                return;
+            }
+            
+            const maxValue = sorted[0][1];
+            
+            let html = '<div class="bar-chart">';
+            sorted.forEach(([label, value]) => {
+                const percentage = (value / maxValue) * 100;
+                html += `
+                    <div class="bar-item">
+                        <div class="bar-label" title="${escapeHtml(label)}">${escapeHtml(truncate(label, 15))}</div>
+                        <div class="bar-track">
+                            <div class="bar-fill" style="width: ${percentage}%"></div>
+                        </div>
+                        <div class="bar-value">${value}</div>
+                    </div>
+                `;
+            });
+            html += '</div>';
+            
+            container.innerHTML = html;
         }
         
-        .author-header:hover {
-            background: var(--bg-secondary);
+        // Timeline
+        function renderTimeline() {
+            const container = document.getElementById('timelineContainer');
+            if (!container) return;
+            
+            const end = (currentPage + 1) * pageSize;
+            const commits = filteredCommits.slice(0, end);
+            
+            if (commits.length === 0) {
+                container.innerHTML = '<p style="color: var(--text-muted); text-align: center; padding: 40px;">No commits found matching your filters.</p>';
+                document.getElementById('loadMore').style.display = 'none';
+                return;
+            }
+            
+            container.innerHTML = renderTimelineItems(commits);
+            updateLoadMore(end);
         }
         
-        .author-info {
-            display: flex;
-            align-items: center;
-            gap: 12px;
+        function renderTimelineItems(commits) {
+            let html = '';
+            commits.forEach(commit => {
+                const date = commit.date ? commit.date.substring(0, 10) : 'N/A';
+                const tickets = commit.tickets.map(t => 
+                    `<a href="${ticketData[t]?.url || '#'}" class="ticket-badge" target="_blank">${t}</a>`
+                ).join('');
+                
+                html += `
+                    <div class="timeline-item">
+                        <div class="timeline-date">${date}</div>
+                        <div class="timeline-content">
+                            <div class="timeline-header">
+                                <a href="${commit.url}" class="timeline-sha" target="_blank">${commit.short_id}</a>
+                                <span class="timeline-project">${escapeHtml(commit.project_name)}</span>
+                                ${tickets}
+                            </div>
+                            <div class="timeline-title">${escapeHtml(commit.title)}</div>
+                            <div class="timeline-author">by ${escapeHtml(commit.author)}</div>
+                        </div>
+                    </div>
+                `;
+            });
+            return html;
         }
         
-        .author-avatar {
-            width: 40px;
-            height: 40px;
-            background: var(--accent-gradient);
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: 600;
-            font-size: 0.9rem;
+        function updateLoadMore(end) {
+            // Show/hide load more
+            const loadMore = document.getElementById('loadMore');
+            loadMore.style.display = end < filteredCommits.length ? 'block' : 'none';
         }
         
-        .author-info h3 {
-            flex: 1;
-            font-size: 1rem;
+        function loadMoreCommits() {
+            // Append only the next page instead of re-rendering every loaded commit
+            const start = (currentPage + 1) * pageSize;
+            const end = start + pageSize;
+            currentPage++;
+            
+            const container = document.getElementById('timelineContainer');
+            container.insertAdjacentHTML('beforeend', renderTimelineItems(filteredCommits.slice(start, end)));
+            updateLoadMore(end);
         }
         
-        .author-commits {
-            padding: 0 20px 20px;
+        // Project/Author Collapse
+        function toggleProject(header) {
+            const card = header.parentElement;
+            const commits = card.querySelector('.project-commits');
+            const isExpanded = card.classList.contains('expanded');
+            
+            card.classList.toggle('expanded');
+            commits.style.display = isExpanded ? 'none' : 'block';
         }
         
-        /* Timeline */
-        .timeline-container {
-            max-height: 600px;
-            overflow-y: auto;
+        function toggleAuthor(header) {
+            const card = header.parentElement;
+            const commits = card.querySelector('.author-commits');
+            const isExpanded = card.classList.contains('expanded');
+            
+            card.classList.toggle('expanded');
+            commits.style.display = isExpanded ? 'none' : 'block';
         }
         
-        .timeline-item {
-            display: flex;
-            gap: 16px;
-            padding: 16px 0;
-            border-bottom: 1px solid var(--border-color);
+        // Export Functions
+        function exportCSV() {
+            const headers = ['Project', 'SHA', 'Title', 'Author', 'Date', 'URL', 'JIRA Tickets'];
+            const rows = filteredCommits.map(c => [
+                c.project_name,
+                c.sha,
+                `"${c.title.replace(/"/g, '""')}"`,
+                c.author,
+                c.date || '',
+                c.url,
+                c.tickets.join('; ')
+            ]);
+            
+            const csv = [headers.join(','), ...rows.map(r => r.join(','))].join('\\n');
+            downloadFile(csv, 'gitdoctor-delta-export.csv', 'text/csv');
         }
         
-        .timeline-date {
-            min-width: 100px;
-            color: var(--text-muted);
-            font-size: 0.85rem;
+        function exportJSON() {
+            const json = JSON.stringify(filteredCommits, null, 2);
+            downloadFile(json, 'gitdoctor-delta-export.json', 'application/json');
         }
         
-        .timeline-content {
-            flex: 1;
+        function downloadFile(content, filename, mimeType) {
+            const blob = new Blob([content], { type: mimeType });
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = filename;
+            a.click();
+            URL.revokeObjectURL(url);
         }
         
-        .timeline-header {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            margin-bottom: 8px;
+        // Utilities
+        function debounce(func, wait) {
+            let timeout;
+            return function executedFunction(...args) {
+                const later = () => {
+                    clearTimeout(timeout);
+                    func(...args);
+                };
+                clearTimeout(timeout);
+                timeout = setTimeout(later, wait);
+            };
         }
         
-        .timeline-sha {
-            font-family: 'JetBrains Mono', monospace;
-            color: var(--accent-primary);
-            text-decoration: none;
-            font-size: 0.9rem;
-        }
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
         
-        .timeline-project {
-            background: var(--bg-tertiary);
-            padding: 2px 10px;
-            border-radius: 4px;
-            font-size: 0.8rem;
-            color: var(--text-secondary);
+        function escapeHtml(text) {
+            if (!text) return '';
+            return String(text).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
         }
         
-        .timeline-title {
-            font-weight: 500;
-            margin-bottom: 4px;
+        function truncate(text, maxLen) {
+            if (!text) return '';
+            return text.length > maxLen ? text.substring(0, maxLen - 3) + '...' : text;
         }
+        """
+
+
+class DeltaHTMLExporter:
+    """
+    Exports delta results to a modern, interactive HTML report.
+    
+    Creates a self-contained HTML file with:
+    - Tabbed navigation (Overview, By Project, By Author, Timeline)
+    - Interactive search and filters
+    - Visual charts for project and author breakdown
+    - Collapsible project sections
+    - JIRA ticket integration
+    - Dark mode support
+    - Export to CSV/JSON from within the report
+    - Print-optimized stylesheet
+    """
+    
+    def export(self, deltas: List[DeltaResult], output_path: str, summary: DeltaSummary = None, jira_linker=None) -> None:
+        """
+        Export delta results to HTML file.
         
-        .timeline-author {
-            font-size: 0.85rem;
-            color: var(--text-muted);
-        }
+        Args:
+            deltas: List of DeltaResult objects
+            output_path: Path to output HTML file
+            summary: Optional DeltaSummary for enhanced reporting
+            jira_linker: Optional JIRALinker for ticket extraction
+        """
+        output_file = Path(output_path)
         
-        .load-more {
-            text-align: center;
-            padding: 20px;
-        }
+        logger.info(f"Exporting delta results to {output_path}")
         
-        .load-more button {
-            background: var(--accent-gradient);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: var(--radius-md);
-            cursor: pointer;
-            font-size: 0.95rem;
-            font-weight: 500;
-            transition: transform 0.2s;
+        try:
+            # Collect statistics before creating the file, so a failure there
+            # does not leave a truncated report behind
+            stats = self._collect_statistics(deltas, jira_linker)
+            
+            with _open_output(output_file) as htmlfile:
+                htmlfile.writelines(self._iter_html(deltas, stats, jira_linker))
+            
+            logger.info(f"Successfully exported HTML report to {output_path}")
+            
+        except IOError as e:
+            logger.error(f"Failed to write HTML file: {e}")
+            raise
+    
+    def _collect_statistics(self, deltas: List[DeltaResult], jira_linker=None) -> Dict[str, Any]:
+        """Collect all statistics needed for the report."""
+        stats = {
+            'total_commits': 0,
+            'projects_searched': len(deltas),
+            'projects_with_changes': 0,
+            'projects_with_errors': 0,
+            'unique_authors': [],
+            'jira_tickets': set(),
+            'commits_by_project': defaultdict(int),
+            'commits_by_author': Counter(),
+            'commits_by_date': Counter(),
+            'all_commits': [],
+            'author_commits': defaultdict(list),
+            'ticket_summary': {}
         }
         
-        .load-more button:hover {
-            transform: scale(1.02);
-        }
+        ticket_summary = stats['ticket_summary']
         
-        /* JIRA Table */
-        .jira-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
+        for delta in deltas:
+            if delta.has_changes:
+                stats['projects_with_changes'] += 1
+            if delta.error:
+                stats['projects_with_errors'] += 1
+            
+            stats['commits_by_project'][delta.project_name] = len(delta.commits)
+            stats['total_commits'] += len(delta.commits)
+            
+            # Counter.update counts a whole delta's commits in C
+            stats['commits_by_author'].update([commit.author_name for commit in delta.commits])
+            # Extract dates for timeline
+            stats['commits_by_date'].update([
+                commit.committed_date[:10] for commit in delta.commits if commit.committed_date
+            ])
+            
+            for commit in delta.commits:
+                # Extract JIRA tickets
+                tickets = jira_linker.get_commit_tickets(commit) if jira_linker else ()
+                if tickets:
+                    for ticket in tickets:
+                        stats['jira_tickets'].add(ticket)
+                        ticket_data = ticket_summary.get(ticket)
+                        if ticket_data is None:
+                            # Projects are dict keys to keep first-seen order
+                            ticket_data = ticket_summary[ticket] = {
+                                'count': 0, 'projects': {}, 'commits': [],
+                                'url': jira_linker.get_ticket_url(ticket)
+                            }
+                        ticket_data['count'] += 1
+                        ticket_data['projects'][delta.project_name] = None
+                        ticket_data['commits'].append(commit.short_id)
+                
+                # Store commit with project info
+                entry = {
+                    'project_name': delta.project_name,
+                    'project_path': delta.project_path,
+                    'project_url': delta.project_web_url,
+                    'sha': commit.commit_sha,
+                    'short_id': commit.short_id,
+                    'title': commit.title,
+                    'message': commit.message,
+                    'author': commit.author_name,
+                    'email': commit.author_email,
+                    'date': commit.committed_date,
+                    'url': commit.web_url,
+                    'tickets': list(tickets)
+                }
+                stats['all_commits'].append(entry)
+                stats['author_commits'][commit.author_name].append(entry)
         
-        .jira-table th {
-            text-align: left;
-            padding: 16px;
-            background: var(--bg-tertiary);
-            color: var(--text-secondary);
-            font-weight: 600;
-            text-transform: uppercase;
-            font-size: 0.75rem;
-        }
+        # Sort commits by date (newest first)
+        stats['all_commits'].sort(key=lambda x: x['date'] or '', reverse=True)
         
-        .jira-table td {
-            padding: 16px;
-            border-bottom: 1px solid var(--border-color);
-        }
+        # Convert sets to lists for JSON serialization
+        stats['unique_authors'] = list(stats['commits_by_author'])
+        stats['jira_tickets'] = list(stats['jira_tickets'])
         
-        .ticket-id {
-            color: #0052CC;
-        }
+        # Convert ticket summary projects to lists
+        for ticket_data in ticket_summary.values():
+            ticket_data['projects'] = list(ticket_data['projects'])
         
-        .jira-link {
-            color: var(--accent-primary);
-            text-decoration: none;
-        }
+        return stats
+    
+    def _iter_html(self, deltas: List[DeltaResult], stats: Dict[str, Any], jira_linker=None) -> Iterator[str]:
+        """
+        Yield the complete HTML content in pieces.
         
-        .jira-link:hover {
-            text-decoration: underline;
-        }
+        The large sections and the embedded commit data are generated and
+        yielded one at a time, so only one of them is held in memory while
+        the report is written.
+        """
         
-        /* Footer */
-        .footer {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 20px 0;
-            margin-top: 24px;
-            border-top: 1px solid var(--border-color);
-            flex-wrap: wrap;
-            gap: 16px;
-        }
+        # Get base and target refs
+        base_ref = deltas[0].base_ref if deltas else "N/A"
+        target_ref = deltas[0].target_ref if deltas else "N/A"
         
-        .footer-left {
-            color: var(--text-muted);
-            font-size: 0.9rem;
-        }
+        # Generate timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        .footer-right {
-            display: flex;
-            gap: 12px;
-        }
+        yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitDoctor Delta Report</title>
+    <style>
+{_DELTA_REPORT_CSS}
+    </style>
+</head>
+<body>
+    <div class="app-container">
+        <!-- Header -->
+        <header class="header">
+            <div class="header-content">
+                <div class="header-left">
+                    <h1>🔍 GitDoctor</h1>
+                    <span class="header-subtitle">Delta Report</span>
+                </div>
+                <div class="header-right">
+                    <button class="theme-toggle" onclick="toggleTheme()" title="Toggle dark mode">
+                        <span class="theme-icon">🌙</span>
+                    </button>
+                </div>
+            </div>
+            <div class="ref-badge-container">
+                <div class="ref-badge base">
+                    <span class="ref-label">BASE</span>
+                    <span class="ref-value" title="{self._escape_html(base_ref)}">{self._escape_html(self._truncate(base_ref, 40))}</span>
+                </div>
+                <span class="ref-arrow">→</span>
+                <div class="ref-badge target">
+                    <span class="ref-label">TARGET</span>
+                    <span class="ref-value" title="{self._escape_html(target_ref)}">{self._escape_html(self._truncate(target_ref, 40))}</span>
+                </div>
+            </div>
+        </header>
         
-        .export-btn {
-            background: var(--bg-tertiary);
-            border: 1px solid var(--border-color);
-            padding: 10px 16px;
-            border-radius: var(--radius-sm);
-            cursor: pointer;
-            font-size: 0.9rem;
-            color: var(--text-primary);
-            transition: all 0.2s;
-        }
+        <!-- Summary Cards -->
+        <section class="summary-cards">
+            <div class="stat-card">
+                <div class="stat-icon">📝</div>
+                <div class="stat-info">
+                    <div class="stat-value">{stats['total_commits']}</div>
+                    <div class="stat-label">Total Commits</div>
+                </div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-icon">📁</div>
+                <div class="stat-info">
+                    <div class="stat-value">{stats['projects_with_changes']}</div>
+                    <div class="stat-label">Projects Changed</div>
+                </div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-icon">👥</div>
+                <div class="stat-info">
+                    <div class="stat-value">{len(stats['unique_authors'])}</div>
+                    <div class="stat-label">Contributors</div>
+                </div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-icon">🎫</div>
+                <div class="stat-info">
+                    <div class="stat-value">{len(stats['jira_tickets'])}</div>
+                    <div class="stat-label">JIRA Tickets</div>
+                </div>
+            </div>
+        </section>
         
-        .export-btn:hover {
-            background: var(--accent-primary);
-            color: white;
-            border-color: var(--accent-primary);
-        }
+        <!-- Tabs Navigation -->
+        <nav class="tabs-nav">
+            <button class="tab-btn active" data-tab="overview">📊 Overview</button>
+            <button class="tab-btn" data-tab="projects">📁 By Project</button>
+            <button class="tab-btn" data-tab="authors">👥 By Author</button>
+            <button class="tab-btn" data-tab="timeline">📅 Timeline</button>
+            {f'<button class="tab-btn" data-tab="jira">🎫 JIRA Tickets</button>' if jira_linker and stats['jira_tickets'] else ''}
+        </nav>
         
-        /* Print Styles */
-        @media print {
-            body {
-                background: white !important;
-            }
-            
-            .header {
-                background: #333 !important;
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }
-            
-            .theme-toggle,
-            .search-container,
-            .footer-right,
-            .load-more {
-                display: none !important;
-            }
-            
-            .tab-pane {
-                display: block !important;
-                page-break-inside: avoid;
-            }
-            
-            .tabs-nav {
-                display: none;
-            }
-            
-            .project-commits,
-            .author-commits {
-                display: block !important;
-            }
-        }
+        <!-- Search Bar -->
+        <div class="search-container">
+            <input type="text" id="searchInput" class="search-input" placeholder="🔍 Search commits by SHA, message, author...">
+            <select id="projectFilter" class="filter-select">
+                <option value="">All Projects</option>
+                {self._generate_project_options(deltas)}
+            </select>
+        </div>
         
-        /* Responsive */
-        @media (max-width: 768px) {
-            .header-content {
-                flex-direction: column;
-                gap: 16px;
-            }
+        <!-- Tab Content -->
+        <main class="tab-content">
+            <!-- Overview Tab -->
+            <div id="overview" class="tab-pane active">
+                <div class="charts-grid">
+                    <div class="chart-card">
+                        <h3>📁 Commits by Project</h3>
+                        <div class="chart-container" id="projectChart"></div>
+                    </div>
+                    <div class="chart-card">
+                        <h3>👥 Top Contributors</h3>
+                        <div class="chart-container" id="authorChart"></div>
+                    </div>
+                </div>
+                
+                {self._generate_quick_stats(stats)}
+            </div>
             
-            .ref-badge-container {
-                flex-direction: column;
-                align-items: stretch;
-            }
+            <!-- Projects Tab -->
+            <div id="projects" class="tab-pane">
+                <div class="projects-list">
+                    """
+        yield self._generate_projects_section(deltas, jira_linker)
+        yield """
+                </div>
+            </div>
             
-            .ref-arrow {
-                transform: rotate(90deg);
-                text-align: center;
-            }
+            <!-- Authors Tab -->
+            <div id="authors" class="tab-pane">
+                <div class="authors-list">
+                    """
+        yield self._generate_authors_section(stats)
+        yield """
+                </div>
+            </div>
             
-            .charts-grid {
-                grid-template-columns: 1fr;
-            }
+            <!-- Timeline Tab -->
+            <div id="timeline" class="tab-pane">
+                <div class="timeline-container" id="timelineContainer">
+                    <!-- Populated by JavaScript -->
+                </div>
+                <div class="load-more" id="loadMore">
+                    <button onclick="loadMoreCommits()">Load More Commits</button>
+                </div>
+            </div>
             
-            .footer {
-                flex-direction: column;
-                text-align: center;
-            }
-        }
-        """
+            <!-- JIRA Tab -->
+            """
+        if jira_linker and stats['jira_tickets']:
+            yield self._generate_jira_tab(stats, jira_linker)
+        yield f"""
+        </main>
+        
+        <!-- Footer -->
+        <footer class="footer">
+            <div class="footer-left">
+                <span>Generated by GitDoctor on {timestamp}</span>
+            </div>
+            <div class="footer-right">
+                <button class="export-btn" onclick="exportCSV()">📥 Export CSV</button>
+                <button class="export-btn" onclick="exportJSON()">📥 Export JSON</button>
+                <button class="export-btn" onclick="window.print()">🖨️ Print</button>
+            </div>
+        </footer>
+    </div>
     
-    def _get_javascript(self) -> str:
-        """Get JavaScript for interactivity."""
-        return """
-        // State
-        let currentPage = 0;
-        const pageSize = 50;
-        let filteredCommits = [...allCommits];
+    <script>
+        // Data
+        const allCommits = """
+        yield json.dumps(stats['all_commits'], ensure_ascii=False, separators=COMPACT_JSON_SEPARATORS)
+        yield f""";
+        const projectsData = {json.dumps(dict(stats['commits_by_project']), ensure_ascii=False, separators=COMPACT_JSON_SEPARATORS)};
+        const authorsData = {json.dumps(dict(stats['commits_by_author']), ensure_ascii=False, separators=COMPACT_JSON_SEPARATORS)};
+        const ticketData = {json.dumps(stats['ticket_summary'], ensure_ascii=False, separators=COMPACT_JSON_SEPARATORS)};
+        const baseRef = {json.dumps(base_ref)};
+        const targetRef = {json.dumps(target_ref)};
         
-        // Initialize
-        document.addEventListener('DOMContentLoaded', function() {
-            initTabs();
-            initSearch();
-            renderCharts();
-            renderTimeline();
-            
-            // Check for saved theme
-            const savedTheme = localStorage.getItem('gitdoctor-theme');
-            if (savedTheme === 'dark') {
-                document.body.setAttribute('data-theme', 'dark');
-                document.querySelector('.theme-icon').textContent = '☀️';
-            }
-        });
+        {_DELTA_REPORT_JS}
+    </script>
+</body>
+</html>"""
+    
+    def _generate_project_options(self, deltas: List[DeltaResult]) -> str:
+        """Generate project dropdown options."""
+        parts = []
+        for delta in sorted(deltas, key=lambda d: d.project_name):
+            name = self._escape_html(delta.project_name)
+            parts.append(f'<option value="{name}">{name}</option>\n')
+        return "".join(parts)
+    
+    def _generate_quick_stats(self, stats: Dict[str, Any]) -> str:
+        """Generate quick stats section for overview."""
+        # Top 5 projects
+        top_projects = heapq.nlargest(5, stats['commits_by_project'].items(), key=itemgetter(1))
+        # Top 5 authors
+        top_authors = heapq.nlargest(5, stats['commits_by_author'].items(), key=itemgetter(1))
         
-        // Theme Toggle
-        function toggleTheme() {
-            const body = document.body;
-            const icon = document.querySelector('.theme-icon');
-            
-            if (body.getAttribute('data-theme') === 'dark') {
-                body.removeAttribute('data-theme');
-                icon.textContent = '🌙';
-                localStorage.setItem('gitdoctor-theme', 'light');
-            } else {
-                body.setAttribute('data-theme', 'dark');
-                icon.textContent = '☀️';
-                localStorage.setItem('gitdoctor-theme', 'dark');
-            }
-        }
+        parts = ['<div class="quick-stats">']
         
-        // Tabs
-        function initTabs() {
-            document.querySelectorAll('.tab-btn').forEach(btn => {
-                btn.addEventListener('click', () => {
-                    const tabId = btn.dataset.tab;
-                    
-                    // Update buttons
-                    document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
-                    btn.classList.add('active');
-                    
-                    // Update panes
-                    document.querySelectorAll('.tab-pane').forEach(p => p.classList.remove('active'));
-                    document.getElementById(tabId).classList.add('active');
-                });
-            });
-        }
+        # Top Projects
+        parts.append('<div class="quick-stat-card"><h4>🏆 Top Projects</h4><ol class="ranked-list">')
+        for project, count in top_projects:
+            parts.append(f'<li><span class="rank-name">{self._escape_html(project)}</span><span class="rank-count">{count}</span></li>')
+        parts.append('</ol></div>')
         
-        // Search & Filter
-        function initSearch() {
-            const searchInput = document.getElementById('searchInput');
-            const projectFilter = document.getElementById('projectFilter');
-            
-            searchInput.addEventListener('input', debounce(filterCommits, 300));
-            projectFilter.addEventListener('change', filterCommits);
-        }
+        # Top Authors
+        parts.append('<div class="quick-stat-card"><h4>🏆 Top Contributors</h4><ol class="ranked-list">')
+        for author, count in top_authors:
+            parts.append(f'<li><span class="rank-name">{self._escape_html(author)}</span><span class="rank-count">{count}</span></li>')
+        parts.append('</ol></div>')
         
-        function filterCommits() {
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const projectName = document.getElementById('projectFilter').value;
-            
-            filteredCommits = allCommits.filter(commit => {
-                const matchesSearch = !searchTerm || 
-                    commit.sha.toLowerCase().includes(searchTerm) ||
-                    commit.short_id.toLowerCase().includes(searchTerm) ||
-                    commit.title.toLowerCase().includes(searchTerm) ||
-                    commit.author.toLowerCase().includes(searchTerm) ||
-                    commit.message.toLowerCase().includes(searchTerm);
-                
-                const matchesProject = !projectName || commit.project_name === projectName;
-                
-                return matchesSearch && matchesProject;
-            });
-            
-            currentPage = 0;
-            renderTimeline();
-        }
+        parts.append('</div>')
+        return "".join(parts)
+    
+    def _generate_projects_section(self, deltas: List[DeltaResult], jira_linker=None) -> str:
+        """Generate collapsible projects section."""
+        parts = []
         
-        // Charts
-        function renderCharts() {
-            renderBarChart('projectChart', projectsData, 8);
-            renderBarChart('authorChart', authorsData, 8);
-        }
+        # Sort by commit count descending
+        sorted_deltas = sorted(deltas, key=lambda d: len(d.commits), reverse=True)
         
-        function renderBarChart(containerId, data, limit) {
-            const container = document.getElementById(containerId);
-            if (!container) return;
-            
-            const sorted = Object.entries(data)
-                .sort((a, b) => b[1] - a[1])
-                .slice(0, limit);
-            
-            if (sorted.length === 0) {
-                container.innerHTML = '<p style="color: var(--text-muted); text-align: center; padding: 40px;">No data available</p>';
-                return;
-            }
-            
-            const maxValue = sorted[0][1];
+        for delta in sorted_deltas:
+            commit_count = len(delta.commits)
+            status_class = "success" if delta.has_changes else ("error" if delta.error else "neutral")
+            status_icon = "✅" if delta.has_changes else ("❌" if delta.error else "⚪")
             
-            let html = '<div class="bar-chart">';
-            sorted.forEach(([label, value]) => {
-                const percentage = (value / maxValue) * 100;
-                html += `
-                    <div class="bar-item">
-                        <div class="bar-label" title="${escapeHtml(label)}">${escapeHtml(truncate(label, 15))}</div>
-                        <div class="bar-track">
-                            <div class="bar-fill" style="width: ${percentage}%"></div>
-                        </div>
-                        <div class="bar-value">${value}</div>
+            parts.append(f'''
+            <div class="project-card {status_class}">
+                <div class="project-header" onclick="toggleProject(this)">
+                    <div class="project-title">
+                        <span class="collapse-icon">▶</span>
+                        <span class="status-icon">{status_icon}</span>
+                        <h3>{self._escape_html(delta.project_name)}</h3>
+                        <span class="commit-badge">{commit_count} commits</span>
                     </div>
-                `;
-            });
-            html += '</div>';
-            
-            container.innerHTML = html;
-        }
-        
-        // Timeline
-        function renderTimeline() {
-            const container = document.getElementById('timelineContainer');
-            if (!container) return;
-            
-            const start = 0;
-            const end = (currentPage + 1) * pageSize;
-            const commits = filteredCommits.slice(start, end);
-            
-            if (commits.length === 0) {
-                container.innerHTML = '<p style="color: var(--text-muted); text-align: center; padding: 40px;">No commits found matching your filters.</p>';
-                document.getElementById('loadMore').style.display = 'none';
-                return;
-            }
+                    <a href="{delta.project_web_url}" target="_blank" class="project-link" onclick="event.stopPropagation()">View in GitLab →</a>
+                </div>
+                <div class="project-path">{self._escape_html(delta.project_path)}</div>
+                {f'<div class="error-msg">⚠️ {self._escape_html(delta.error)}</div>' if delta.error else ''}
+                <div class="project-commits" style="display: none;">''')
             
-            let html = '';
-            commits.forEach(commit => {
-                const date = commit.date ? commit.date.substring(0, 10) : 'N/A';
-                const tickets = commit.tickets.map(t => 
-                    `<a href="${ticketData[t]?.url || '#'}" class="ticket-badge" target="_blank">${t}</a>`
-                ).join('');
+            if delta.commits:
+                parts.append('<table class="commits-mini-table"><thead><tr><th>SHA</th><th>Message</th><th>Author</th><th>Date</th></tr></thead><tbody>')
+                for commit in delta.commits[:50]:  # Limit per project
+                    date_str = commit.committed_date[:10] if commit.committed_date else "N/A"
+                    
+                    # Extract tickets
+                    tickets_html = ""
+                    if jira_linker:
+                        tickets = jira_linker.get_commit_tickets(commit)
+                        if tickets:
+                            tickets_html = " ".join([
+                                f'<a href="{jira_linker.get_ticket_url(t)}" class="ticket-badge" target="_blank">{t}</a>'
+                                for t in tickets
+                            ])
+                    
+                    parts.append(f'''<tr>
+                        <td><a href="{commit.web_url}" target="_blank" class="sha-link">{commit.short_id}</a></td>
+                        <td class="commit-msg">{self._escape_html(self._truncate(commit.title, 60))} {tickets_html}</td>
+                        <td>{self._escape_html(commit.author_name)}</td>
+                        <td>{date_str}</td>
+                    </tr>''')
                 
-                html += `
-                    <div class="timeline-item">
-                        <div class="timeline-date">${date}</div>
-                        <div class="timeline-content">
-                            <div class="timeline-header">
-                                <a href="${commit.url}" class="timeline-sha" target="_blank">${commit.short_id}</a>
-                                <span class="timeline-project">${escapeHtml(commit.project_name)}</span>
-                                ${tickets}
-                            </div>
-                            <div class="timeline-title">${escapeHtml(commit.title)}</div>
-                            <div class="timeline-author">by ${escapeHtml(commit.author)}</div>
-                        </div>
-                    </div>
-                `;
-            });
-            
-            container.innerHTML = html;
+                if len(delta.commits) > 50:
+                    parts.append(f'<tr><td colspan="4" class="more-indicator">... and {len(delta.commits) - 50} more commits</td></tr>')
+                
+                parts.append('</tbody></table>')
+            else:
+                parts.append('<p class="no-commits">No commits in this project for the selected range.</p>')
             
-            // Show/hide load more
-            const loadMore = document.getElementById('loadMore');
-            loadMore.style.display = end < filteredCommits.length ? 'block' : 'none';
-        }
+            parts.append('</div></div>')
         
-        function loadMoreCommits() {
-            currentPage++;
-            renderTimeline();
-        }
+        return "".join(parts)
+    
+    def _generate_authors_section(self, stats: Dict[str, Any]) -> str:
+        """Generate authors breakdown section."""
+        # Sort authors by commit count
+        sorted_authors = sorted(
+            stats['author_commits'].items(), key=lambda x: len(x[1]), reverse=True
+        )
         
-        // Project/Author Collapse
-        function toggleProject(header) {
-            const card = header.parentElement;
-            const commits = card.querySelector('.project-commits');
-            const isExpanded = card.classList.contains('expanded');
+        parts = []
+        for author, commits in sorted_authors:
+            parts.append(f'''
+            <div class="author-card">
+                <div class="author-header" onclick="toggleAuthor(this)">
+                    <div class="author-info">
+                        <span class="collapse-icon">▶</span>
+                        <div class="author-avatar">{self._get_initials(author)}</div>
+                        <h3>{self._escape_html(author)}</h3>
+                        <span class="commit-badge">{len(commits)} commits</span>
+                    </div>
+                </div>
+                <div class="author-commits" style="display: none;">
+                    <table class="commits-mini-table">
+                        <thead><tr><th>Project</th><th>SHA</th><th>Message</th><th>Date</th></tr></thead>
+                        <tbody>''')
             
-            card.classList.toggle('expanded');
-            commits.style.display = isExpanded ? 'none' : 'block';
-        }
-        
-        function toggleAuthor(header) {
-            const card = header.parentElement;
-            const commits = card.querySelector('.author-commits');
-            const isExpanded = card.classList.contains('expanded');
+            for c in commits[:30]:
+                date_str = c['date'][:10] if c['date'] else "N/A"
+                parts.append(f'''<tr>
+                    <td><code>{self._escape_html(c['project_name'])}</code></td>
+                    <td><a href="{c['url']}" target="_blank" class="sha-link">{c['short_id']}</a></td>
+                    <td class="commit-msg">{self._escape_html(self._truncate(c['title'], 50))}</td>
+                    <td>{date_str}</td>
+                </tr>''')
             
-            card.classList.toggle('expanded');
-            commits.style.display = isExpanded ? 'none' : 'block';
-        }
-        
-        // Export Functions
-        function exportCSV() {
-            const headers = ['Project', 'SHA', 'Title', 'Author', 'Date', 'URL', 'JIRA Tickets'];
-            const rows = filteredCommits.map(c => [
-                c.project_name,
-                c.sha,
-                `"${c.title.replace(/"/g, '""')}"`,
-                c.author,
-                c.date || '',
-                c.url,
-                c.tickets.join('; ')
-            ]);
+            if len(commits) > 30:
+                parts.append(f'<tr><td colspan="4" class="more-indicator">... and {len(commits) - 30} more commits</td></tr>')
             
-            const csv = [headers.join(','), ...rows.map(r => r.join(','))].join('\\n');
-            downloadFile(csv, 'gitdoctor-delta-export.csv', 'text/csv');
-        }
+            parts.append('</tbody></table></div></div>')
         
-        function exportJSON() {
-            const json = JSON.stringify(filteredCommits, null, 2);
-            downloadFile(json, 'gitdoctor-delta-export.json', 'application/json');
-        }
+        return "".join(parts)
+    
+    def _generate_jira_tab(self, stats: Dict[str, Any], jira_linker) -> str:
+        """Generate JIRA tickets tab content."""
+        if not jira_linker or not stats['jira_tickets']:
+            return ''
         
-        function downloadFile(content, filename, mimeType) {
-            const blob = new Blob([content], { type: mimeType });
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = filename;
-            a.click();
-            URL.revokeObjectURL(url);
-        }
+        parts = ['''
+        <div id="jira" class="tab-pane">
+            <div class="jira-summary">
+                <table class="jira-table">
+                    <thead>
+                        <tr>
+                            <th>Ticket</th>
+                            <th>Commits</th>
+                            <th>Projects</th>
+                            <th>Link</th>
+                        </tr>
+                    </thead>
+                    <tbody>''']
         
-        // Utilities
-        function debounce(func, wait) {
-            let timeout;
-            return function executedFunction(...args) {
-                const later = () => {
-                    clearTimeout(timeout);
-                    func(...args);
-                };
-                clearTimeout(timeout);
-                timeout = setTimeout(later, wait);
-            };
-        }
+        # Sort tickets by commit count
+        sorted_tickets = sorted(
+            stats['ticket_summary'].items(),
+            key=lambda x: x[1]['count'],
+            reverse=True
+        )
         
-        function escapeHtml(text) {
-            if (!text) return '';
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
+        escape = self._escape_html
+        for ticket_id, data in sorted_tickets:
+            projects = data['projects']
+            projects_str = ", ".join(projects[:3])
+            if len(projects) > 3:
+                projects_str = f"{projects_str} +{len(projects) - 3} more"
+            
+            parts.append(f'''
+                <tr>
+                    <td><strong class="ticket-id">{ticket_id}</strong></td>
+                    <td>{data['count']}</td>
+                    <td>{escape(projects_str)}</td>
+                    <td><a href="{data['url']}" target="_blank" class="jira-link">View in JIRA →</a></td>
+                </tr>''')
         
-        function truncate(text, maxLen) {
-            if (!text) return '';
-            return text.length > maxLen ? text.substring(0, maxLen - 3) + '...' : text;
-        }
-        """
+        parts.append('''
+                    </tbody>
+                </table>
+            </div>
+        </div>''')
+        
+        return "".join(parts)
+    
+    def _escape_html(self, text: str) -> str:
+        """Escape HTML special characters."""
+        if not text:
+            return ""
+        text = str(text)
+        # Most names, paths and SHAs contain nothing to escape, and probing
+        # for the five special characters is cheaper than calling html.escape
+        if '&' in text or '<' in text or '>' in text or '"' in text or "'" in text:
+            return _html_escape(text)
+        return text
+    
+    def _truncate(self, text: str, max_len: int) -> str:
+        """Truncate text with ellipsis."""
+        if not text:
+            return ""
+        if len(text) <= max_len:
+            return text
+        return text[:max_len - 3] + "..."
+    
+    def _get_initials(self, name: str) -> str:
+        """Get initials from name."""
+        if not name:
+            return "?"
+        parts = name.split()
+        if len(parts) >= 2:
+            return (parts[0][0] + parts[-1][0]).upper()
+        return name[0].upper()
 
 
 class MRCSVExporter:
@@ -1853,7 +1908,7 @@ class MRCSVExporter:
     Exports merge request results to CSV format.
     """
     
-    HEADERS = [
+    HEADERS = (
         "project_path",
         "project_name",
         "project_id",
@@ -1877,7 +1932,7 @@ class MRCSVExporter:
         "jira_tickets",
         "jira_ticket_urls",
         "error"
-    ]
+    )
     
     def export(self, results: List[MRResult], output_path: str, jira_linker=None) -> None:
         """
@@ -1893,23 +1948,13 @@ class MRCSVExporter:
         logger.info(f"Exporting MR results to {output_path}")
         
         try:
-            with output_file.open('w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.HEADERS)
-                writer.writeheader()
-                
-                rows_written = 0
+            with _open_output(output_file, newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.HEADERS)
                 
-                for result in results:
-                    if result.merge_requests:
-                        for mr in result.merge_requests:
-                            row = self._create_row(result, mr, jira_linker)
-                            writer.writerow(row)
-                            rows_written += 1
-                    else:
-                        # Write one row for project even if no MRs
-                        row = self._create_empty_row(result)
-                        writer.writerow(row)
-                        rows_written += 1
+                writer.writerows(self._iter_rows(results, jira_linker))
+                # One row per MR, or a single row for a project without any
+                rows_written = sum(len(result.merge_requests) or 1 for result in results)
                 
             logger.info(f"Successfully exported {rows_written} rows to {output_path}")
             
@@ -1917,6 +1962,29 @@ class MRCSVExporter:
             logger.error(f"Failed to write CSV file: {e}")
             raise
     
+    def _iter_rows(self, results: List[MRResult], jira_linker=None) -> Iterator[tuple]:
+        """
+        Yield CSV rows as tuples in HEADERS order.
+        
+        The project and error columns are the same for every merge request
+        of a project, so they are built once per result.
+        """
+        for result in results:
+            project_fields = (
+                result.project_path,
+                result.project_name,
+                result.project_id,
+                result.project_web_url,
+            )
+            error_fields = (self._sanitize_text(result.error) if result.error else "",)
+            
+            if result.merge_requests:
+                for mr in result.merge_requests:
+                    yield project_fields + self._mr_fields(mr, jira_linker) + error_fields
+            else:
+                # Write one row for project even if no MRs
+                yield project_fields + self._EMPTY_MR_FIELDS + error_fields
+    
     @staticmethod
     def _sanitize_text(text: str) -> str:
         """
@@ -1934,284 +2002,125 @@ class MRCSVExporter:
         # Also strip multiple consecutive spaces
         return ' '.join(text.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ').split())
     
-    def _create_row(self, result: MRResult, mr: MergeRequest, jira_linker=None) -> dict:
-        """Create a CSV row for a merge request."""
-        # Extract JIRA tickets if linker is provided
-        jira_tickets = ""
-        jira_ticket_urls = ""
-        
-        if jira_linker:
-            text = f"{mr.title} {mr.description}"
-            tickets = jira_linker.extract_tickets_from_text(text)
-            if tickets:
-                jira_tickets = "|".join(sorted(tickets))
-                jira_ticket_urls = "|".join([jira_linker.get_ticket_url(t) for t in sorted(tickets)])
-        
-        # Sanitize description and truncate if needed
-        description = self._sanitize_text(mr.description) if mr.description else ""
-        if len(description) > 500:
-            description = description[:500] + "..."
-        
-        return {
-            "project_path": result.project_path,
-            "project_name": result.project_name,
-            "project_id": result.project_id,
-            "project_web_url": result.project_web_url,
-            "mr_iid": mr.mr_iid,
-            "title": self._sanitize_text(mr.title),
-            "description": description,
-            "state": mr.state,
-            "source_branch": mr.source_branch,
-            "target_branch": mr.target_branch,
-            "author_name": self._sanitize_text(mr.author_name),
-            "author_username": mr.author_username,
-            "merged_by_name": self._sanitize_text(mr.merged_by_name) if mr.merged_by_name else "",
-            "merged_by_username": mr.merged_by_username or "",
-            "merged_at": mr.merged_at or "",
-            "created_at": mr.created_at,
-            "updated_at": mr.updated_at,
-            "web_url": mr.web_url,
-            "merge_commit_sha": mr.merge_commit_sha or "",
-            "labels": "|".join(mr.labels) if mr.labels else "",
-            "jira_tickets": jira_tickets,
-            "jira_ticket_urls": jira_ticket_urls,
-            "error": self._sanitize_text(result.error) if result.error else ""
-        }
-    
-    def _create_empty_row(self, result: MRResult) -> dict:
-        """Create a CSV row for a project with no MRs."""
-        return {
-            "project_path": result.project_path,
-            "project_name": result.project_name,
-            "project_id": result.project_id,
-            "project_web_url": result.project_web_url,
-            "mr_iid": "",
-            "title": "",
-            "description": "",
-            "state": "",
-            "source_branch": "",
-            "target_branch": "",
-            "author_name": "",
-            "author_username": "",
-            "merged_by_name": "",
-            "merged_by_username": "",
-            "merged_at": "",
-            "created_at": "",
-            "updated_at": "",
-            "web_url": "",
-            "merge_commit_sha": "",
-            "labels": "",
-            "jira_tickets": "",
-            "jira_ticket_urls": "",
-            "error": self._sanitize_text(result.error) if result.error else ""
-        }
-
-
-class MRJSONExporter:
-    """
-    Exports merge request results to JSON format.
-    """
-    
-    def export(self, results: List[MRResult], output_path: str) -> None:
-        """
-        Export MR results to JSON file.
-        
-        Args:
-            results: List of MRResult objects
-            output_path: Path to output JSON file
-        """
-        output_file = Path(output_path)
-        
-        logger.info(f"Exporting MR results to {output_path}")
-        
-        try:
-            data = []
-            for result in results:
-                result_dict = {
-                    "project": {
-                        "id": result.project_id,
-                        "name": result.project_name,
-                        "path": result.project_path,
-                        "web_url": result.project_web_url
-                    },
-                    "filters": {
-                        "target_branch": result.target_branch,
-                        "source_branch": result.source_branch,
-                        "state": result.state_filter
-                    },
-                    "statistics": {
-                        "total_mrs": result.total_mrs
-                    },
-                    "merge_requests": [
-                        {
-                            "iid": mr.mr_iid,
-                            "title": mr.title,
-                            "description": mr.description,
-                            "state": mr.state,
-                            "source_branch": mr.source_branch,
-                            "target_branch": mr.target_branch,
-                            "author": {
-                                "name": mr.author_name,
-                                "username": mr.author_username
-                            },
-                            "merged_by": {
-                                "name": mr.merged_by_name,
-                                "username": mr.merged_by_username
-                            } if mr.merged_by_name else None,
-                            "merged_at": mr.merged_at,
-                            "created_at": mr.created_at,
-                            "web_url": mr.web_url,
-                            "merge_commit_sha": mr.merge_commit_sha,
-                            "labels": mr.labels
-                        }
-                        for mr in result.merge_requests
-                    ],
-                    "error": result.error
-                }
-                data.append(result_dict)
-            
-            with output_file.open('w', encoding='utf-8') as jsonfile:
-                json.dump(data, jsonfile, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Successfully exported {len(results)} project results to {output_path}")
-            
-        except IOError as e:
-            logger.error(f"Failed to write JSON file: {e}")
-            raise
-
-
-class MRHTMLExporter:
-    """
-    Exports merge request results to an interactive HTML report.
-    """
-    
-    def export(self, results: List[MRResult], output_path: str, summary: MRSummary = None, jira_linker=None) -> None:
-        """
-        Export MR results to HTML file.
-        """
-        output_file = Path(output_path)
-        
-        logger.info(f"Exporting MR results to {output_path}")
-        
-        try:
-            html_content = self._generate_html(results, summary, jira_linker)
-            
-            with output_file.open('w', encoding='utf-8') as htmlfile:
-                htmlfile.write(html_content)
-            
-            logger.info(f"Successfully exported HTML report to {output_path}")
-            
-        except IOError as e:
-            logger.error(f"Failed to write HTML file: {e}")
-            raise
+    # Merge request columns (mr_iid .. jira_ticket_urls) for projects without MRs
+    _EMPTY_MR_FIELDS = ("",) * 18
     
-    def _collect_statistics(self, results: List[MRResult], jira_linker=None) -> Dict[str, Any]:
-        """Collect all statistics for the report."""
-        stats = {
-            'total_mrs': 0,
-            'projects_searched': len(results),
-            'projects_with_mrs': 0,
-            'projects_with_errors': 0,
-            'unique_authors': set(),
-            'jira_tickets': set(),
-            'mrs_by_project': defaultdict(int),
-            'mrs_by_author': defaultdict(int),
-            'mrs_by_date': defaultdict(int),
-            'all_mrs': [],
-            'ticket_summary': defaultdict(lambda: {'count': 0, 'projects': set(), 'mrs': []})
-        }
-        
-        for result in results:
-            if result.has_mrs:
-                stats['projects_with_mrs'] += 1
-            if result.error:
-                stats['projects_with_errors'] += 1
-            
-            stats['mrs_by_project'][result.project_name] = len(result.merge_requests)
-            stats['total_mrs'] += len(result.merge_requests)
-            
-            for mr in result.merge_requests:
-                stats['unique_authors'].add(mr.author_name)
-                stats['mrs_by_author'][mr.author_name] += 1
-                
-                # Extract date for timeline
-                date_str = mr.merged_at[:10] if mr.merged_at else (mr.created_at[:10] if mr.created_at else None)
-                if date_str:
-                    stats['mrs_by_date'][date_str] += 1
-                
-                # Extract JIRA tickets
-                if jira_linker:
-                    text = f"{mr.title} {mr.description}"
-                    tickets = jira_linker.extract_tickets_from_text(text)
-                    for ticket in tickets:
-                        stats['jira_tickets'].add(ticket)
-                        stats['ticket_summary'][ticket]['count'] += 1
-                        stats['ticket_summary'][ticket]['projects'].add(result.project_name)
-                        stats['ticket_summary'][ticket]['mrs'].append(mr.mr_iid)
-                        stats['ticket_summary'][ticket]['url'] = jira_linker.get_ticket_url(ticket)
-                
-                # Store MR with project info
-                stats['all_mrs'].append({
-                    'project_name': result.project_name,
-                    'project_path': result.project_path,
-                    'project_url': result.project_web_url,
-                    'iid': mr.mr_iid,
-                    'title': mr.title,
-                    'description': mr.description[:200] if mr.description else "",
-                    'state': mr.state,
-                    'source_branch': mr.source_branch,
-                    'target_branch': mr.target_branch,
-                    'author': mr.author_name,
-                    'merged_by': mr.merged_by_name,
-                    'merged_at': mr.merged_at,
-                    'created_at': mr.created_at,
-                    'url': mr.web_url,
-                    'tickets': list(jira_linker.extract_tickets_from_text(
-                        f"{mr.title} {mr.description}"
-                    )) if jira_linker else []
-                })
-        
-        # Sort MRs by date (newest first)
-        stats['all_mrs'].sort(key=lambda x: x['merged_at'] or x['created_at'] or '', reverse=True)
+    def _mr_fields(self, mr: MergeRequest, jira_linker=None) -> tuple:
+        """Build the per-MR CSV columns, mr_iid through jira_ticket_urls."""
+        # Extract JIRA tickets if linker is provided
+        jira_tickets = ""
+        jira_ticket_urls = ""
         
-        # Convert sets to lists
-        stats['unique_authors'] = list(stats['unique_authors'])
-        stats['jira_tickets'] = list(stats['jira_tickets'])
+        if jira_linker:
+            tickets = jira_linker.get_mr_tickets(mr)
+            if tickets:
+                jira_tickets = "|".join(tickets)
+                jira_ticket_urls = "|".join([jira_linker.get_ticket_url(t) for t in tickets])
         
-        for ticket_id in stats['ticket_summary']:
-            stats['ticket_summary'][ticket_id]['projects'] = list(
-                stats['ticket_summary'][ticket_id]['projects']
-            )
+        # Sanitize description and truncate if needed
+        description = self._sanitize_text(mr.description) if mr.description else ""
+        if len(description) > 500:
+            description = description[:500] + "..."
         
-        return stats
+        return (
+            mr.mr_iid,
+            self._sanitize_text(mr.title),
+            description,
+            mr.state,
+            mr.source_branch,
+            mr.target_branch,
+            self._sanitize_text(mr.author_name),
+            mr.author_username,
+            self._sanitize_text(mr.merged_by_name) if mr.merged_by_name else "",
+            mr.merged_by_username or "",
+            mr.merged_at or "",
+            mr.created_at,
+            mr.updated_at,
+            mr.web_url,
+            mr.merge_commit_sha or "",
+            "|".join(mr.labels) if mr.labels else "",
+            jira_tickets,
+            jira_ticket_urls,
+        )
+
+
+class MRJSONExporter:
+    """
+    Exports merge request results to JSON format.
+    """
     
-    def _generate_html(self, results: List[MRResult], summary: MRSummary = None, jira_linker=None) -> str:
-        """Generate the complete HTML content."""
-        # Get filter info
-        target_branch = results[0].target_branch if results else "N/A"
-        source_branch = results[0].source_branch if results else "N/A"
-        state_filter = results[0].state_filter if results else "merged"
-        
-        # Collect statistics
-        stats = self._collect_statistics(results, jira_linker)
+    def export(self, results: List[MRResult], output_path: str) -> None:
+        """
+        Export MR results to JSON file.
         
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        Args:
+            results: List of MRResult objects
+            output_path: Path to output JSON file
+        """
+        output_file = Path(output_path)
         
-        # Prepare data for JavaScript
-        mrs_json = json.dumps(stats['all_mrs'], ensure_ascii=False)
-        projects_data = json.dumps(dict(stats['mrs_by_project']), ensure_ascii=False)
-        authors_data = json.dumps(dict(stats['mrs_by_author']), ensure_ascii=False)
-        ticket_data = json.dumps(dict(stats['ticket_summary']), ensure_ascii=False)
+        logger.info(f"Exporting MR results to {output_path}")
         
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitDoctor MR Report</title>
-    <style>
-        :root {{
+        try:
+            with _open_output(output_file) as jsonfile:
+                _write_json_array(jsonfile, map(self._result_to_dict, results))
+            
+            logger.info(f"Successfully exported {len(results)} project results to {output_path}")
+            
+        except IOError as e:
+            logger.error(f"Failed to write JSON file: {e}")
+            raise
+    
+    @staticmethod
+    def _result_to_dict(result: MRResult) -> Dict[str, Any]:
+        """Convert an MRResult to its JSON representation."""
+        return {
+            "project": {
+                "id": result.project_id,
+                "name": result.project_name,
+                "path": result.project_path,
+                "web_url": result.project_web_url
+            },
+            "filters": {
+                "target_branch": result.target_branch,
+                "source_branch": result.source_branch,
+                "state": result.state_filter
+            },
+            "statistics": {
+                "total_mrs": result.total_mrs
+            },
+            "merge_requests": [
+                {
+                    "iid": mr.mr_iid,
+                    "title": mr.title,
+                    "description": mr.description,
+                    "state": mr.state,
+                    "source_branch": mr.source_branch,
+                    "target_branch": mr.target_branch,
+                    "author": {
+                        "name": mr.author_name,
+                        "username": mr.author_username
+                    },
+                    "merged_by": {
+                        "name": mr.merged_by_name,
+                        "username": mr.merged_by_username
+                    } if mr.merged_by_name else None,
+                    "merged_at": mr.merged_at,
+                    "created_at": mr.created_at,
+                    "web_url": mr.web_url,
+                    "merge_commit_sha": mr.merge_commit_sha,
+                    "labels": mr.labels
+                }
+                for mr in result.merge_requests
+            ],
+            "error": result.error
+        }
+
+
+# Stylesheet and script embedded in every MR HTML report, defined once at
+# import like the delta report's.
+_MR_REPORT_CSS = _minify_css("""
+        :root {
             --bg-primary: #f8fafc;
             --bg-secondary: #ffffff;
             --bg-tertiary: #f1f5f9;
@@ -2230,9 +2139,9 @@ class MRHTMLExporter:
             --radius-sm: 6px;
             --radius-md: 10px;
             --radius-lg: 16px;
-        }}
+        }
         
-        [data-theme="dark"] {{
+        [data-theme="dark"] {
             --bg-primary: #0f172a;
             --bg-secondary: #1e293b;
             --bg-tertiary: #334155;
@@ -2240,56 +2149,56 @@ class MRHTMLExporter:
             --text-secondary: #94a3b8;
             --text-muted: #64748b;
             --border-color: #334155;
-        }}
+        }
         
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
         
-        body {{
+        body {
             font-family: 'Inter', -apple-system, sans-serif;
             background: var(--bg-primary);
             color: var(--text-primary);
             line-height: 1.6;
             min-height: 100vh;
-        }}
+        }
         
-        .app-container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
+        .app-container { max-width: 1400px; margin: 0 auto; padding: 20px; }
         
-        .header {{
+        .header {
             background: var(--accent-gradient);
             border-radius: var(--radius-lg);
             padding: 30px;
             margin-bottom: 24px;
             color: white;
-        }}
+        }
         
-        .header h1 {{ font-size: 2rem; font-weight: 700; margin-bottom: 10px; }}
-        .header-subtitle {{ font-size: 1.1rem; opacity: 0.9; }}
+        .header h1 { font-size: 2rem; font-weight: 700; margin-bottom: 10px; }
+        .header-subtitle { font-size: 1.1rem; opacity: 0.9; }
         
-        .filter-badges {{
+        .filter-badges {
             display: flex;
             gap: 12px;
             flex-wrap: wrap;
             margin-top: 20px;
-        }}
+        }
         
-        .filter-badge {{
+        .filter-badge {
             background: rgba(255,255,255,0.15);
             border-radius: var(--radius-sm);
             padding: 8px 16px;
             font-size: 0.9rem;
-        }}
+        }
         
-        .filter-label {{ font-size: 0.7rem; text-transform: uppercase; opacity: 0.8; display: block; }}
-        .filter-value {{ font-weight: 600; }}
+        .filter-label { font-size: 0.7rem; text-transform: uppercase; opacity: 0.8; display: block; }
+        .filter-value { font-weight: 600; }
         
-        .summary-cards {{
+        .summary-cards {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 16px;
             margin-bottom: 24px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: var(--bg-secondary);
             border-radius: var(--radius-md);
             padding: 24px;
@@ -2297,29 +2206,29 @@ class MRHTMLExporter:
             align-items: center;
             gap: 16px;
             border: 1px solid var(--border-color);
-        }}
+        }
         
-        .stat-icon {{ font-size: 2.5rem; }}
-        .stat-value {{ font-size: 2rem; font-weight: 700; color: var(--accent-primary); }}
-        .stat-label {{ font-size: 0.85rem; color: var(--text-secondary); text-transform: uppercase; }}
+        .stat-icon { font-size: 2.5rem; }
+        .stat-value { font-size: 2rem; font-weight: 700; color: var(--accent-primary); }
+        .stat-label { font-size: 0.85rem; color: var(--text-secondary); text-transform: uppercase; }
         
-        .content-card {{
+        .content-card {
             background: var(--bg-secondary);
             border-radius: var(--radius-lg);
             padding: 24px;
             border: 1px solid var(--border-color);
             margin-bottom: 24px;
-        }}
+        }
         
-        .content-card h2 {{ margin-bottom: 20px; font-size: 1.3rem; }}
+        .content-card h2 { margin-bottom: 20px; font-size: 1.3rem; }
         
-        .mr-table {{
+        .mr-table {
             width: 100%;
             border-collapse: collapse;
             font-size: 0.9rem;
-        }}
+        }
         
-        .mr-table th {{
+        .mr-table th {
             text-align: left;
             padding: 14px;
             background: var(--bg-tertiary);
@@ -2327,33 +2236,33 @@ class MRHTMLExporter:
             font-weight: 600;
             text-transform: uppercase;
             font-size: 0.75rem;
-        }}
+        }
         
-        .mr-table td {{
+        .mr-table td {
             padding: 14px;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .mr-table tr:hover {{ background: var(--bg-tertiary); }}
+        .mr-table tr:hover { background: var(--bg-tertiary); }
         
-        .mr-link {{
+        .mr-link {
             color: var(--accent-primary);
             text-decoration: none;
             font-weight: 500;
-        }}
+        }
         
-        .mr-link:hover {{ text-decoration: underline; }}
+        .mr-link:hover { text-decoration: underline; }
         
-        .branch-badge {{
+        .branch-badge {
             display: inline-block;
             background: var(--bg-tertiary);
             padding: 2px 8px;
             border-radius: 4px;
             font-size: 0.8rem;
             font-family: monospace;
-        }}
+        }
         
-        .ticket-badge {{
+        .ticket-badge {
             display: inline-block;
             background: #0052CC;
             color: white;
@@ -2363,41 +2272,225 @@ class MRHTMLExporter:
             font-weight: 600;
             text-decoration: none;
             margin-left: 4px;
-        }}
+        }
         
-        .ticket-badge:hover {{ background: #0065FF; }}
+        .ticket-badge:hover { background: #0065FF; }
         
-        .bar-chart {{ display: flex; flex-direction: column; gap: 8px; }}
-        .bar-item {{ display: flex; align-items: center; gap: 12px; }}
-        .bar-label {{ width: 150px; font-size: 0.85rem; color: var(--text-secondary); white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }}
-        .bar-track {{ flex: 1; height: 24px; background: var(--bg-tertiary); border-radius: var(--radius-sm); overflow: hidden; }}
-        .bar-fill {{ height: 100%; background: var(--accent-gradient); border-radius: var(--radius-sm); }}
-        .bar-value {{ width: 40px; text-align: right; font-weight: 600; font-size: 0.9rem; }}
+        .bar-chart { display: flex; flex-direction: column; gap: 8px; }
+        .bar-item { display: flex; align-items: center; gap: 12px; }
+        .bar-label { width: 150px; font-size: 0.85rem; color: var(--text-secondary); white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+        .bar-track { flex: 1; height: 24px; background: var(--bg-tertiary); border-radius: var(--radius-sm); overflow: hidden; }
+        .bar-fill { height: 100%; background: var(--accent-gradient); border-radius: var(--radius-sm); }
+        .bar-value { width: 40px; text-align: right; font-weight: 600; font-size: 0.9rem; }
         
-        .charts-grid {{
+        .charts-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
             gap: 24px;
-        }}
+        }
         
-        .chart-section {{
+        .chart-section {
             background: var(--bg-tertiary);
             border-radius: var(--radius-md);
             padding: 20px;
-        }}
+        }
         
-        .chart-section h3 {{ margin-bottom: 16px; font-size: 1rem; }}
+        .chart-section h3 { margin-bottom: 16px; font-size: 1rem; }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 20px;
             color: var(--text-muted);
             font-size: 0.9rem;
-        }}
+        }
+        
+        @media (max-width: 768px) {
+            .charts-grid { grid-template-columns: 1fr; }
+        }""")
+
+_MR_REPORT_JS = """
+        function renderBarChart(containerId, data, limit) {
+            const container = document.getElementById(containerId);
+            if (!container) return;
+            
+            const sorted = Object.entries(data)
+                .sort((a, b) => b[1] - a[1])
+                .slice(0, limit || 8);
+            
+            if (sorted.length === 0) {
+                container.innerHTML = '<p style="color: var(--text-muted); text-align: center;">No data</p>';
+                return;
+            }
+            
+            const maxValue = sorted[0][1];
+            
+            let html = '';
+            sorted.forEach(([label, value]) => {
+                const percentage = (value / maxValue) * 100;
+                const truncatedLabel = label.length > 20 ? label.substring(0, 17) + '...' : label;
+                html += `
+                    <div class="bar-item">
+                        <div class="bar-label" title="${escapeHtml(label)}">${escapeHtml(truncatedLabel)}</div>
+                        <div class="bar-track">
+                            <div class="bar-fill" style="width: ${percentage}%"></div>
+                        </div>
+                        <div class="bar-value">${value}</div>
+                    </div>
+                `;
+            });
+            
+            container.innerHTML = html;
+        }
+        
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+        
+        function escapeHtml(text) {
+            if (!text) return '';
+            return String(text).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+        }
+        
+        document.addEventListener('DOMContentLoaded', function() {
+            renderBarChart('projectChart', projectsData, 8);
+            renderBarChart('authorChart', authorsData, 8);
+        });"""
+
+
+class MRHTMLExporter:
+    """
+    Exports merge request results to an interactive HTML report.
+    """
+    
+    def export(self, results: List[MRResult], output_path: str, summary: MRSummary = None, jira_linker=None) -> None:
+        """
+        Export MR results to HTML file.
+        """
+        output_file = Path(output_path)
+        
+        logger.info(f"Exporting MR results to {output_path}")
+        
+        try:
+            # Collect statistics before creating the file, so a failure there
+            # does not leave a truncated report behind
+            stats = self._collect_statistics(results, jira_linker)
+            
+            with _open_output(output_file) as htmlfile:
+                htmlfile.writelines(self._iter_html(results, stats, jira_linker))
+            
+            logger.info(f"Successfully exported HTML report to {output_path}")
+            
+        except IOError as e:
+            logger.error(f"Failed to write HTML file: {e}")
+            raise
+    
+    def _collect_statistics(self, results: List[MRResult], jira_linker=None) -> Dict[str, Any]:
+        """Collect all statistics for the report."""
+        stats = {
+            'total_mrs': 0,
+            'projects_searched': len(results),
+            'projects_with_mrs': 0,
+            'projects_with_errors': 0,
+            'unique_authors': [],
+            'jira_tickets': set(),
+            'mrs_by_project': defaultdict(int),
+            'mrs_by_author': Counter(),
+            'mrs_by_date': Counter(),
+            'all_mrs': [],
+            'ticket_summary': {}
+        }
+        
+        ticket_summary = stats['ticket_summary']
+        
+        for result in results:
+            if result.has_mrs:
+                stats['projects_with_mrs'] += 1
+            if result.error:
+                stats['projects_with_errors'] += 1
+            
+            stats['mrs_by_project'][result.project_name] = len(result.merge_requests)
+            stats['total_mrs'] += len(result.merge_requests)
+            
+            # Counter.update counts a whole project's MRs in C
+            stats['mrs_by_author'].update([mr.author_name for mr in result.merge_requests])
+            # Extract dates for timeline
+            stats['mrs_by_date'].update([
+                (mr.merged_at or mr.created_at)[:10]
+                for mr in result.merge_requests if mr.merged_at or mr.created_at
+            ])
+            
+            for mr in result.merge_requests:
+                # Extract JIRA tickets
+                tickets = jira_linker.get_mr_tickets(mr) if jira_linker else ()
+                if tickets:
+                    for ticket in tickets:
+                        stats['jira_tickets'].add(ticket)
+                        ticket_data = ticket_summary.get(ticket)
+                        if ticket_data is None:
+                            # Projects are dict keys to keep first-seen order
+                            ticket_data = ticket_summary[ticket] = {
+                                'count': 0, 'projects': {}, 'mrs': [],
+                                'url': jira_linker.get_ticket_url(ticket)
+                            }
+                        ticket_data['count'] += 1
+                        ticket_data['projects'][result.project_name] = None
+                        ticket_data['mrs'].append(mr.mr_iid)
+                
+                # Store MR with project info
+                stats['all_mrs'].append({
+                    'project_name': result.project_name,
+                    'project_path': result.project_path,
+                    'project_url': result.project_web_url,
+                    'iid': mr.mr_iid,
+                    'title': mr.title,
+                    'description': mr.description[:200] if mr.description else "",
+                    'state': mr.state,
+                    'source_branch': mr.source_branch,
+                    'target_branch': mr.target_branch,
+                    'author': mr.author_name,
+                    'merged_by': mr.merged_by_name,
+                    'merged_at': mr.merged_at,
+                    'created_at': mr.created_at,
+                    'url': mr.web_url,
+                    'tickets': list(tickets)
+                })
+        
+        # Sort MRs by date (newest first)
+        stats['all_mrs'].sort(key=lambda x: x['merged_at'] or x['created_at'] or '', reverse=True)
+        
+        # Convert sets to lists
+        stats['unique_authors'] = list(stats['mrs_by_author'])
+        stats['jira_tickets'] = list(stats['jira_tickets'])
+        
+        for ticket_data in ticket_summary.values():
+            ticket_data['projects'] = list(ticket_data['projects'])
+        
+        return stats
+    
+    def _iter_html(self, results: List[MRResult], stats: Dict[str, Any], jira_linker=None) -> Iterator[str]:
+        """
+        Yield the complete HTML content in pieces.
         
-        @media (max-width: 768px) {{
-            .charts-grid {{ grid-template-columns: 1fr; }}
-        }}
+        The MR table is generated and yielded on its own, like the delta
+        report's sections.
+        """
+        # Get filter info
+        target_branch = results[0].target_branch if results else "N/A"
+        source_branch = results[0].source_branch if results else "N/A"
+        state_filter = results[0].state_filter if results else "merged"
+        
+        # Generate timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Prepare data for JavaScript
+        projects_data = json.dumps(dict(stats['mrs_by_project']), ensure_ascii=False, separators=COMPACT_JSON_SEPARATORS)
+        authors_data = json.dumps(dict(stats['mrs_by_author']), ensure_ascii=False, separators=COMPACT_JSON_SEPARATORS)
+        
+        yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitDoctor MR Report</title>
+    <style>{_MR_REPORT_CSS}
     </style>
 </head>
 <body>
@@ -2472,7 +2565,9 @@ class MRHTMLExporter:
                     </tr>
                 </thead>
                 <tbody>
-                    {self._generate_mr_rows(results, jira_linker)}
+                    """
+        yield self._generate_mr_rows(results, jira_linker)
+        yield f"""
                 </tbody>
             </table>
         </div>
@@ -2485,77 +2580,40 @@ class MRHTMLExporter:
     <script>
         const projectsData = {projects_data};
         const authorsData = {authors_data};
-        
-        function renderBarChart(containerId, data, limit) {{
-            const container = document.getElementById(containerId);
-            if (!container) return;
-            
-            const sorted = Object.entries(data)
-                .sort((a, b) => b[1] - a[1])
-                .slice(0, limit || 8);
-            
-            if (sorted.length === 0) {{
-                container.innerHTML = '<p style="color: var(--text-muted); text-align: center;">No data</p>';
-                return;
-            }}
-            
-            const maxValue = sorted[0][1];
-            
-            let html = '';
-            sorted.forEach(([label, value]) => {{
-                const percentage = (value / maxValue) * 100;
-                const truncatedLabel = label.length > 20 ? label.substring(0, 17) + '...' : label;
-                html += `
-                    <div class="bar-item">
-                        <div class="bar-label" title="${{label}}">${{truncatedLabel}}</div>
-                        <div class="bar-track">
-                            <div class="bar-fill" style="width: ${{percentage}}%"></div>
-                        </div>
-                        <div class="bar-value">${{value}}</div>
-                    </div>
-                `;
-            }});
-            
-            container.innerHTML = html;
-        }}
-        
-        document.addEventListener('DOMContentLoaded', function() {{
-            renderBarChart('projectChart', projectsData, 8);
-            renderBarChart('authorChart', authorsData, 8);
-        }});
+        {_MR_REPORT_JS}
     </script>
 </body>
 </html>"""
-        
-        return html
     
     def _generate_mr_rows(self, results: List[MRResult], jira_linker=None) -> str:
         """Generate table rows for all MRs."""
-        html = ""
+        parts = []
         
-        # Collect all MRs with project info
-        all_mrs = []
-        for result in results:
-            for mr in result.merge_requests:
-                all_mrs.append((result, mr))
+        total_mrs = sum(len(result.merge_requests) for result in results)
         
-        # Sort by merged date (newest first)
-        all_mrs.sort(key=lambda x: x[1].merged_at or x[1].created_at or '', reverse=True)
+        # Only the newest 100 MRs (by merged date) are rendered, so pick them
+        # straight from a generator instead of building and sorting a list of
+        # every MR. nlargest keeps the same tie order as a stable sort.
+        newest_mrs = heapq.nlargest(
+            100,
+            ((result, mr) for result in results for mr in result.merge_requests),
+            key=lambda x: x[1].merged_at or x[1].created_at or ''
+        )
         
-        for result, mr in all_mrs[:100]:  # Limit to 100 rows
+        for result, mr in newest_mrs:
             date_str = mr.merged_at[:10] if mr.merged_at else (mr.created_at[:10] if mr.created_at else "N/A")
             
             # Extract tickets
             tickets_html = ""
             if jira_linker:
-                tickets = jira_linker.extract_tickets_from_text(f"{mr.title} {mr.description}")
+                tickets = jira_linker.get_mr_tickets(mr)
                 if tickets:
                     tickets_html = " ".join([
                         f'<a href="{jira_linker.get_ticket_url(t)}" class="ticket-badge" target="_blank">{t}</a>'
-                        for t in sorted(tickets)
+                        for t in tickets
                     ])
             
-            html += f"""
+            parts.append(f"""
             <tr>
                 <td><a href="{mr.web_url}" class="mr-link" target="_blank">!{mr.mr_iid}</a></td>
                 <td>{self._escape_html(self._truncate(mr.title, 60))} {tickets_html}</td>
@@ -2567,23 +2625,23 @@ class MRHTMLExporter:
                 </td>
                 <td>{date_str}</td>
             </tr>
-            """
+            """)
         
-        if len(all_mrs) > 100:
-            html += f'<tr><td colspan="6" style="text-align: center; color: var(--text-muted);">... and {len(all_mrs) - 100} more MRs</td></tr>'
+        if total_mrs > 100:
+            parts.append(f'<tr><td colspan="6" style="text-align: center; color: var(--text-muted);">... and {total_mrs - 100} more MRs</td></tr>')
         
-        return html
+        return "".join(parts)
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
         if not text:
             return ""
-        return (str(text)
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;")
-                .replace("'", "&#x27;"))
+        text = str(text)
+        # Most names, paths and SHAs contain nothing to escape, and probing
+        # for the five special characters is cheaper than calling html.escape
+        if '&' in text or '<' in text or '>' in text or '"' in text or "'" in text:
+            return _html_escape(text)
+        return text
     
     def _truncate(self, text: str, max_len: int) -> str:
         """Truncate text with ellipsis."""
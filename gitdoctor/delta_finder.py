@@ -6,7 +6,8 @@ across multiple GitLab projects.
 """
 
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from .api_client import GitLabClient, GitLabNotFound, GitLabAPIError
@@ -16,6 +17,10 @@ from .models import DeltaCommit, DeltaResult, DeltaSummary
 
 logger = logging.getLogger(__name__)
 
+# Number of projects compared concurrently. Kept within GitLabClient's
+# connection pool so every worker reuses a keep-alive connection.
+DEFAULT_MAX_WORKERS = 16
+
 
 class DeltaFinder:
     """
@@ -23,7 +28,8 @@ class DeltaFinder:
     
     For each project:
     1. Verifies both BASE and TARGET refs exist (can be tags, branches, or commits)
-    2. Fetches all commits from both refs using paginated API
+    2. Fetches all commits from TARGET and only the commit SHAs from BASE
+       using paginated API
     3. Computes set difference (target_commits - base_commits) for exact delta
     4. Optionally filters by date range
     5. Gathers statistics
@@ -33,16 +39,27 @@ class DeltaFinder:
     git history shape (merges, complex branching) and handles unlimited commit ranges.
     """
 
-    def __init__(self, client: GitLabClient, projects: List[ProjectInfo]):
+    def __init__(
+        self,
+        client: GitLabClient,
+        projects: List[ProjectInfo],
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ):
         """
         Initialize delta finder.
 
         Args:
             client: GitLab API client
             projects: List of projects to compare
+            max_workers: Maximum number of projects compared concurrently
         """
         self.client = client
         self.projects = projects
+        self.max_workers = max_workers
+        # Ref name -> kind ("tag", "branch" or "commit") it last resolved
+        # as. The same ref is usually the same kind in every project, so
+        # that kind is probed first.
+        self._ref_kinds: Dict[str, str] = {}
 
     def find_deltas(
         self,
@@ -84,29 +101,36 @@ class DeltaFinder:
         if before_date:
             logger.info(f"  Filtering commits before: {before_date}")
         
-        for i, project in enumerate(self.projects, 1):
-            logger.info(
-                f"[{i}/{len(self.projects)}] Comparing in "
-                f"{project.path_with_namespace}"
-            )
-            
-            delta = self._compare_in_project(
-                project, base_ref, target_ref, after_date, before_date
-            )
-            results.append(delta)
+        # Each comparison is a handful of paginated requests, i.e. pure
+        # network latency, so compare projects on a thread pool. Results are
+        # collected in project order to keep the output deterministic.
+        workers = max(1, min(self.max_workers, len(self.projects)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._compare_in_project,
+                    project, base_ref, target_ref, after_date, before_date
+                )
+                for project in self.projects
+            ]
             
-            if delta.has_changes:
-                logger.info(f"  ✓ Found {len(delta.commits)} commits")
-            elif delta.error:
-                logger.warning(f"  ✗ Error: {delta.error}")
-            elif not delta.base_exists:
-                logger.info(f"  ⊘ Base ref '{base_ref}' not found (skipped)")
-            elif not delta.target_exists:
-                logger.info(f"  ⊘ Target ref '{target_ref}' not found (skipped)")
-            elif delta.compare_same_ref:
-                logger.info("  = Refs are identical (no changes)")
-            else:
-                logger.info("  ○ No commits between refs")
+            for i, future in enumerate(futures, 1):
+                delta = future.result()
+                results.append(delta)
+                
+                prefix = f"[{i}/{len(self.projects)}] {delta.project_path}:"
+                if delta.has_changes:
+                    logger.info(f"{prefix} ✓ Found {len(delta.commits)} commits")
+                elif delta.error:
+                    logger.warning(f"{prefix} ✗ Error: {delta.error}")
+                elif not delta.base_exists:
+                    logger.info(f"{prefix} ⊘ Base ref '{base_ref}' not found (skipped)")
+                elif not delta.target_exists:
+                    logger.info(f"{prefix} ⊘ Target ref '{target_ref}' not found (skipped)")
+                elif delta.compare_same_ref:
+                    logger.info(f"{prefix} = Refs are identical (no changes)")
+                else:
+                    logger.info(f"{prefix} ○ No commits between refs")
         
         logger.info(
             f"Delta discovery complete. "
@@ -126,8 +150,9 @@ class DeltaFinder:
         """
         Compare two refs in a single project using set difference algorithm.
         
-        This method fetches all commits from both refs using paginated API,
-        then computes the set difference to find commits in target but not in base.
+        This method fetches all commits from the target ref and only the
+        commit SHAs of the base ref using paginated API, then computes the
+        set difference to find commits in target but not in base.
         This approach avoids timeouts and handles any git history shape accurately.
         
         Args:
@@ -172,42 +197,57 @@ class DeltaFinder:
             target_commit_map = {
                 commit.get("id"): commit for commit in target_commits
             }
-            target_shas = set(target_commit_map.keys())
+            del target_commits
+            # The map's keys view serves as the target SHA set, so no
+            # separate set is built
+            target_shas = target_commit_map.keys()
             logger.debug(f"Found {len(target_shas)} commits in target ref")
             
             # Step 4: Fetch all commits from BASE ref (paginated)
             logger.debug(f"Fetching commits from base ref '{base_ref}'...")
-            base_commits = self.client.list_commits_from_ref(
-                project.id, base_ref
-            )
-            
-            base_shas = {commit.get("id") for commit in base_commits}
+            base_shas = set(self.client.iter_commit_shas(project.id, base_ref))
             logger.debug(f"Found {len(base_shas)} commits in base ref")
             
             # Store commit counts for transparency
             result.base_commit_count = len(base_shas)
             result.target_commit_count = len(target_shas)
             
-            # Step 5: Compute set difference (commits in target but not in base)
-            delta_shas = target_shas - base_shas
+            # Step 5: Compute set difference (commits in target but not in base).
+            # Walk the target SHAs and probe the base set; this avoids copying
+            # all target SHAs into a temporary set first.
+            delta_shas = {sha for sha in target_shas if sha not in base_shas}
             logger.debug(f"Delta contains {len(delta_shas)} commits")
-            logger.info(f"  Base ref has {result.base_commit_count} commits, Target ref has {result.target_commit_count} commits")
+            logger.info(
+                f"  {project.path_with_namespace}: base ref has "
+                f"{result.base_commit_count} commits, target ref has "
+                f"{result.target_commit_count} commits"
+            )
             
             # Check if refs are identical
             if not delta_shas and target_shas == base_shas:
                 result.compare_same_ref = True
             
+            # Base SHAs aren't needed past this point; release them before
+            # building the delta commits
+            del base_shas
+            
             result.total_commits = len(delta_shas)
             
-            # Step 6: Process delta commits with optional date filtering
+            # Step 6: Process delta commits with optional date filtering.
+            # ISO 8601 timestamps order correctly as strings, so the filter
+            # is one chained comparison against precomputed bounds; a missing
+            # bound is widened to one every timestamp passes.
+            filter_dates = bool(after_date or before_date)
+            lower_bound = after_date or ""
+            upper_bound = before_date or "\uffff"
+            
             for sha in delta_shas:
                 commit_data = target_commit_map[sha]
                 committed_date = commit_data.get("committed_date", "")
                 
                 # Apply date filters if specified
-                if after_date and committed_date and committed_date < after_date:
-                    continue
-                if before_date and committed_date and committed_date > before_date:
+                if (filter_dates and committed_date
+                        and not lower_bound <= committed_date <= upper_bound):
                     continue
                 
                 # Create DeltaCommit object
@@ -262,6 +302,10 @@ class DeltaFinder:
         2. Branch  
         3. Commit SHA
         
+        except that the kind the ref resolved as in a previous project is
+        tried first, which saves a round trip per project for branches and
+        two for commit SHAs.
+        
         Args:
             project_id: GitLab project ID
             ref: Reference name to check
@@ -269,37 +313,32 @@ class DeltaFinder:
         Returns:
             True if ref exists, False otherwise
         """
-        # Try as tag first
-        try:
-            self.client.get_tag(project_id, ref)
-            logger.debug(f"Ref '{ref}' exists as tag in project {project_id}")
-            return True
-        except GitLabNotFound:
-            pass
-        except GitLabAPIError as e:
-            logger.warning(f"Error checking tag '{ref}': {e}")
+        probes = {
+            "tag": self.client.get_tag,
+            "branch": self.client.get_branch,
+            "commit": self.client.get_commit,
+        }
+        kinds = list(probes)
+        known_kind = self._ref_kinds.get(ref)
+        if known_kind is not None:
+            kinds.remove(known_kind)
+            kinds.insert(0, known_kind)
         
-        # Try as branch
-        try:
-            self.client.get_branch(project_id, ref)
-            logger.debug(f"Ref '{ref}' exists as branch in project {project_id}")
+        for kind in kinds:
+            try:
+                probes[kind](project_id, ref)
+            except GitLabNotFound:
+                continue
+            except GitLabAPIError as e:
+                logger.warning(f"Error checking {kind} '{ref}': {e}")
+                continue
+            
+            logger.debug(f"Ref '{ref}' exists as {kind} in project {project_id}")
+            self._ref_kinds[ref] = kind
             return True
-        except GitLabNotFound:
-            pass
-        except GitLabAPIError as e:
-            logger.warning(f"Error checking branch '{ref}': {e}")
         
-        # Try as commit SHA
-        try:
-            self.client.get_commit(project_id, ref)
-            logger.debug(f"Ref '{ref}' exists as commit in project {project_id}")
-            return True
-        except GitLabNotFound:
-            logger.debug(f"Ref '{ref}' not found in project {project_id}")
-            return False
-        except GitLabAPIError as e:
-            logger.warning(f"Error checking commit '{ref}': {e}")
-            return False
+        logger.debug(f"Ref '{ref}' not found in project {project_id}")
+        return False
 
     def generate_summary(self, deltas: List[DeltaResult]) -> DeltaSummary:
         """
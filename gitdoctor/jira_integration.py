@@ -6,10 +6,10 @@ Extracts JIRA ticket references from commit messages and creates links.
 
 import re
 import logging
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Tuple
 from urllib.parse import quote
 
-from .models import DeltaCommit, DeltaResult
+from .models import DeltaCommit, DeltaResult, MergeRequest
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +40,19 @@ class JIRALinker:
         """
         self.jira_base_url = jira_base_url.rstrip('/')
         self.project_key = project_key.upper() if project_key else None
+        # With a project key only that key's tickets are wanted, so scan for
+        # them directly instead of matching every ticket and filtering
+        self._ticket_pattern = (
+            re.compile(rf'\b({re.escape(self.project_key)}-\d+)\b')
+            if self.project_key else self.JIRA_PATTERN
+        )
+        # ticket ID -> URL, shared by every output that links the same ticket
+        self._ticket_urls: Dict[str, str] = {}
+        # commit SHA -> sorted ticket IDs; CSV, HTML and summaries of one run
+        # all ask for the same commits
+        self._commit_tickets: Dict[str, Tuple[str, ...]] = {}
+        # MR ID -> sorted ticket IDs, same idea for merge request reports
+        self._mr_tickets: Dict[int, Tuple[str, ...]] = {}
     
     def extract_tickets_from_commits(self, commits: List[DeltaCommit]) -> Dict[str, List[str]]:
         """
@@ -55,9 +68,7 @@ class JIRALinker:
         ticket_to_commits: Dict[str, List[str]] = {}
         
         for commit in commits:
-            tickets = self.extract_tickets_from_text(commit.title + " " + commit.message)
-            
-            for ticket in tickets:
+            for ticket in self.get_commit_tickets(commit):
                 if ticket not in ticket_to_commits:
                     ticket_to_commits[ticket] = []
                 ticket_to_commits[ticket].append(commit.commit_sha)
@@ -77,13 +88,50 @@ class JIRALinker:
         if not text:
             return set()
         
-        matches = self.JIRA_PATTERN.findall(text.upper())
+        return set(self._ticket_pattern.findall(text.upper()))
+    
+    def get_commit_tickets(self, commit: DeltaCommit) -> Tuple[str, ...]:
+        """
+        Get the JIRA tickets referenced by a commit's title and message.
         
-        # Filter by project key if specified
-        if self.project_key:
-            matches = [t for t in matches if t.startswith(self.project_key + '-')]
+        Results are cached per commit SHA, so each commit message is only
+        scanned once no matter how many outputs link its tickets.
         
-        return set(matches)
+        Args:
+            commit: DeltaCommit object
+            
+        Returns:
+            Sorted tuple of unique ticket IDs
+        """
+        tickets = self._commit_tickets.get(commit.commit_sha)
+        if tickets is None:
+            tickets = tuple(sorted(
+                self.extract_tickets_from_text(commit.title + " " + commit.message)
+            ))
+            self._commit_tickets[commit.commit_sha] = tickets
+        return tickets
+    
+    def get_mr_tickets(self, mr: MergeRequest) -> Tuple[str, ...]:
+        """
+        Get the JIRA tickets referenced by a merge request's title and description.
+        
+        Results are cached per MR ID, like get_commit_tickets(). MRs without
+        an ID (mr_id defaults to 0) can't be told apart and are never cached.
+        
+        Args:
+            mr: MergeRequest object
+            
+        Returns:
+            Sorted tuple of unique ticket IDs
+        """
+        tickets = self._mr_tickets.get(mr.mr_id) if mr.mr_id else None
+        if tickets is None:
+            tickets = tuple(sorted(
+                self.extract_tickets_from_text(f"{mr.title} {mr.description}")
+            ))
+            if mr.mr_id:
+                self._mr_tickets[mr.mr_id] = tickets
+        return tickets
     
     def get_ticket_url(self, ticket_id: str) -> str:
         """
@@ -95,7 +143,10 @@ class JIRALinker:
         Returns:
             Full URL to the ticket
         """
-        return f"{self.jira_base_url}/browse/{ticket_id}"
+        url = self._ticket_urls.get(ticket_id)
+        if url is None:
+            url = self._ticket_urls[ticket_id] = f"{self.jira_base_url}/browse/{ticket_id}"
+        return url
     
     def enrich_commit_with_jira_links(self, commit: DeltaCommit) -> Dict[str, str]:
         """
@@ -108,11 +159,9 @@ class JIRALinker:
             Dictionary mapping ticket ID to JIRA URL
             Example: {"MON-12345": "https://jira.company.com/browse/MON-12345"}
         """
-        tickets = self.extract_tickets_from_text(commit.title + " " + commit.message)
-        
         return {
             ticket: self.get_ticket_url(ticket)
-            for ticket in tickets
+            for ticket in self.get_commit_tickets(commit)
         }
     
     def generate_ticket_summary(self, deltas: List[DeltaResult]) -> Dict[str, Dict[str, any]]:
@@ -137,9 +186,7 @@ class JIRALinker:
         
         for delta in deltas:
             for commit in delta.commits:
-                tickets = self.extract_tickets_from_text(commit.title + " " + commit.message)
-                
-                for ticket in tickets:
+                for ticket in self.get_commit_tickets(commit):
                     if ticket not in ticket_summary:
                         ticket_summary[ticket] = {
                             "url": self.get_ticket_url(ticket),
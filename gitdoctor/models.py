@@ -9,13 +9,14 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaCommit:
     """
     Represents a single commit in a delta comparison.
     
     This captures all relevant information about a commit that exists
-    in the target reference but not in the base reference.
+    in the target reference but not in the base reference. Slotted,
+    since one is created per delta commit.
     """
     commit_sha: str
     short_id: str
@@ -29,14 +30,9 @@ class DeltaCommit:
     committer_email: str
     web_url: str
     parent_ids: List[str] = field(default_factory=list)
-    
-    def __post_init__(self):
-        """Normalize empty strings to empty list for parent_ids."""
-        if isinstance(self.parent_ids, str):
-            self.parent_ids = []
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaResult:
     """
     Result of comparing two references (tags/branches/commits) in a single project.
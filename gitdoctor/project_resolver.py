@@ -208,12 +208,11 @@ class ProjectResolver:
         Returns:
             Filtered list of projects
         """
-        include_paths = self.config.filters.include_project_paths
-        exclude_paths = self.config.filters.exclude_project_paths
+        include_set = self.config.filters.include_path_set
+        exclude_set = self.config.filters.exclude_path_set
 
         # Apply include filter if specified
-        if include_paths:
-            include_set = set(include_paths)
+        if include_set:
             projects = [
                 p for p in projects
                 if p.path_with_namespace in include_set
@@ -223,8 +222,7 @@ class ProjectResolver:
             )
 
         # Apply exclude filter
-        if exclude_paths:
-            exclude_set = set(exclude_paths)
+        if exclude_set:
             before_count = len(projects)
             projects = [
                 p for p in projects
@@ -181,6 +181,31 @@ def test_list_group_projects_pagination(client):
     assert result[1]["id"] == 2
 
 
+@responses.activate
+def test_iter_commit_shas_pagination(client):
+    """Test that commit SHAs are streamed across pages."""
+    url = "https://gitlab.example.com/api/v4/projects/123/repository/commits"
+    responses.add(
+        responses.GET, url,
+        json=[{"id": "aaa111", "title": "First"}, {"id": "bbb222", "title": "Second"}],
+        status=200,
+        headers={"x-next-page": "2"}
+    )
+    responses.add(
+        responses.GET, url,
+        json=[{"id": "ccc333", "title": "Third"}],
+        status=200,
+        headers={"x-next-page": ""}
+    )
+    
+    shas = client.iter_commit_shas(123, "v1.0.0")
+    assert next(shas) == "aaa111"
+    assert len(responses.calls) == 1
+    assert list(shas) == ["bbb222", "ccc333"]
+    assert "ref_name=v1.0.0" in responses.calls[1].request.url
+    assert "page=2" in responses.calls[1].request.url
+
+
 @responses.activate
 def test_get_commit_success(client):
     """Test successful commit fetch."""
@@ -418,3 +443,52 @@ def test_list_commits_from_ref_empty(client):
     
     assert len(result) == 0
 
+
+
+def test_client_context_manager_closes_session():
+    """Test that leaving the client context closes the HTTP session."""
+    with GitLabClient(
+        base_url="https://gitlab.example.com",
+        private_token="test-token-123",
+    ) as client:
+        adapter = client.session.get_adapter("https://gitlab.example.com")
+        adapter.poolmanager.connection_from_url("https://gitlab.example.com")
+        assert len(adapter.poolmanager.pools) == 1
+    
+    assert len(adapter.poolmanager.pools) == 0
+
+
+def test_connection_pool_sized_for_concurrent_use(client):
+    """Test that the session keeps enough connections for worker threads."""
+    from gitdoctor.commit_finder import DEFAULT_MAX_WORKERS
+    
+    adapter = client.session.get_adapter("https://gitlab.example.com")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] >= DEFAULT_MAX_WORKERS
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    """Test that the token bucket delays requests beyond the burst size."""
+    from gitdoctor.api_client import RateLimiter
+    import gitdoctor.api_client as api_client
+    
+    sleeps = []
+    monkeypatch.setattr(api_client.time, "sleep", sleeps.append)
+    
+    limiter = RateLimiter(rate=2, burst=2)
+    for _ in range(4):
+        limiter.acquire()
+    
+    # First two requests use the burst, the next two wait for refill
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+    assert sleeps[1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_rate_limit_zero_disables_throttling():
+    """Test that rate_limit=0 turns off the limiter."""
+    client = GitLabClient(
+        base_url="https://gitlab.example.com",
+        private_token="test-token-123",
+        rate_limit=0,
+    )
+    assert client.rate_limiter is None
@@ -0,0 +1,47 @@
+"""
+Tests for the local response cache.
+"""
+
+import pytest
+
+from gitdoctor.cache import CommitCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    cache = CommitCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+def test_commit_roundtrip(cache):
+    """Test that stored commits are returned for the same project and SHA."""
+    cache.set_commit(1, "abc123", {"id": "abc123", "title": "Test commit"})
+    
+    assert cache.get_commit(1, "abc123") == {"id": "abc123", "title": "Test commit"}
+    assert cache.get_commit(2, "abc123") is None
+    assert cache.get_commit(1, "def456") is None
+
+
+def test_refs_expire_after_ttl(tmp_path):
+    """Test that cached refs are ignored once their TTL has passed."""
+    cache = CommitCache(tmp_path, refs_ttl_seconds=-1)
+    cache.set_refs(1, "abc123", [{"type": "branch", "name": "main"}])
+    cache.set_commit(1, "abc123", {"id": "abc123"})
+    
+    assert cache.get_refs(1, "abc123") is None
+    # Commits never expire
+    assert cache.get_commit(1, "abc123") == {"id": "abc123"}
+    cache.close()
+
+
+def test_cache_persists_between_instances(tmp_path):
+    """Test that entries survive reopening the cache."""
+    first = CommitCache(tmp_path)
+    first.set_refs(1, "abc123", [{"type": "tag", "name": "v1.0.0"}])
+    first.close()
+    
+    second = CommitCache(tmp_path)
+    assert second.get_refs(1, "abc123") == [{"type": "tag", "name": "v1.0.0"}]
+    second.close()
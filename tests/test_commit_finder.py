@@ -13,6 +13,7 @@ from gitdoctor.commit_finder import (
     load_commit_shas_from_file,
 )
 from gitdoctor.api_client import GitLabNotFound, GitLabAPIError
+from gitdoctor.cache import CommitCache
 from gitdoctor.project_resolver import ProjectInfo
 
 
@@ -324,3 +325,146 @@ def test_whitespace_only_commits_ignored(mock_client, sample_projects):
     # Should process only abc123 and def456 (2 commits x 2 projects = 4 results)
     assert len(results) == 4
 
+
+
+def test_results_keep_project_order_when_parallel(mock_client):
+    """Test that concurrent probes return results in project order."""
+    projects = [
+        ProjectInfo(
+            id=i,
+            name=f"project{i}",
+            path_with_namespace=f"group/project{i}",
+            web_url=f"https://gitlab.example.com/group/project{i}"
+        )
+        for i in range(1, 21)
+    ]
+    
+    mock_client.get_commit.return_value = {"id": "abc123", "web_url": "url"}
+    mock_client.list_commit_refs.return_value = []
+    
+    finder = CommitFinder(mock_client, projects, max_workers=4)
+    results = finder.search_commits(["abc123"])
+    
+    assert [r.project_id for r in results] == list(range(1, 21))
+    assert mock_client.get_commit.call_count == 20
+
+
+def test_cached_lookups_skip_api(mock_client, sample_projects, tmp_path):
+    """Test that a second search is served from the cache."""
+    mock_client.get_commit.return_value = {
+        "id": "abc123",
+        "title": "Test commit",
+        "web_url": "url"
+    }
+    mock_client.list_commit_refs.return_value = [{"type": "branch", "name": "main"}]
+    
+    cache = CommitCache(tmp_path)
+    finder = CommitFinder(mock_client, [sample_projects[0]], cache=cache)
+    first = finder.search_commits(["abc123"])
+    second = finder.search_commits(["abc123"])
+    cache.close()
+    
+    assert mock_client.get_commit.call_count == 1
+    assert mock_client.list_commit_refs.call_count == 1
+    assert second == first
+    assert second[0].branches == "main"
+
+
+def test_iter_search_commits_is_lazy(mock_client, sample_projects):
+    """Test that results are yielded before later commits are searched."""
+    mock_client.get_commit.side_effect = lambda project_id, sha: {"id": sha, "web_url": "url"}
+    mock_client.list_commit_refs.return_value = []
+    
+    finder = CommitFinder(mock_client, sample_projects)
+    results = finder.iter_search_commits(["abc123", "def456"])
+    
+    first = next(results)
+    assert first.commit_sha == "abc123"
+    assert mock_client.get_commit.call_count == 2  # only abc123 probed so far
+    
+    remaining = list(results)
+    assert [r.commit_sha for r in remaining] == ["abc123", "def456", "def456"]
+
+
+def test_load_commit_shas_deduplicates():
+    """Test that duplicate SHAs are dropped, keeping first-seen order."""
+    content = "abc123\nDEF456\n  abc123  \ndef456\nghi789\n"
+    
+    with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+        f.write(content)
+        f.flush()
+        
+        commits = load_commit_shas_from_file(f.name)
+        
+        assert commits == ["abc123", "def456", "ghi789"]
+        
+        Path(f.name).unlink()
+
+
+def test_duplicate_commits_searched_once(mock_client, sample_projects):
+    """Test that a SHA repeated in the input is only probed once per project."""
+    mock_client.get_commit.side_effect = GitLabNotFound("Not found", status_code=404)
+    
+    finder = CommitFinder(mock_client, sample_projects)
+    finder.search_commits(["abc123", " abc123", "ABC123"])
+    
+    assert mock_client.get_commit.call_count == 2
+
+
+def test_not_found_projects_skipped_on_repeat_search(mock_client, sample_projects):
+    """Test that a project that returned 404 isn't probed again for the same SHA."""
+    def mock_get_commit(project_id, sha):
+        if project_id == 1:
+            return {"id": sha, "web_url": "url"}
+        raise GitLabNotFound("Not found", status_code=404)
+    
+    mock_client.get_commit.side_effect = mock_get_commit
+    mock_client.list_commit_refs.return_value = []
+    
+    finder = CommitFinder(mock_client, sample_projects)
+    finder.search_commits(["abc123"])
+    finder.search_commits(["abc123"])
+    
+    probed = [c.args[0] for c in mock_client.get_commit.call_args_list]
+    assert probed.count(1) == 2
+    assert probed.count(2) == 1
+
+
+def test_not_found_persisted_in_cache(mock_client, sample_projects, tmp_path):
+    """Test that 404 results are remembered across finder instances via the cache."""
+    mock_client.get_commit.side_effect = GitLabNotFound("Not found", status_code=404)
+    
+    cache = CommitCache(tmp_path)
+    CommitFinder(mock_client, sample_projects, cache=cache).search_commits(["abc123"])
+    CommitFinder(mock_client, sample_projects, cache=cache).search_commits(["abc123"])
+    cache.close()
+    
+    assert mock_client.get_commit.call_count == 2
+
+
+def test_first_match_stops_after_first_project(mock_client, sample_projects):
+    """Test that first_match only reports the first project containing the commit."""
+    mock_client.get_commit.side_effect = lambda project_id, sha: {"id": sha, "web_url": "url"}
+    mock_client.list_commit_refs.return_value = []
+    
+    finder = CommitFinder(mock_client, sample_projects, max_workers=1, first_match=True)
+    results = finder.search_commits(["abc123"])
+    
+    assert [r.project_id for r in results] == [1]
+
+
+def test_commit_web_url_built_when_missing(mock_client):
+    """Test that a missing web_url falls back to <project web_url>/commit/<sha>."""
+    project = ProjectInfo(
+        id=1,
+        name="project1",
+        path_with_namespace="group/project1",
+        web_url="https://gitlab.example.com/group/project1/"
+    )
+    mock_client.get_commit.return_value = {"id": "abc123", "web_url": ""}
+    mock_client.list_commit_refs.return_value = []
+    
+    finder = CommitFinder(mock_client, [project])
+    results = finder.search_commits(["abc123"])
+    
+    assert results[0].commit_web_url == "https://gitlab.example.com/group/project1/commit/abc123"
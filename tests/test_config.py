@@ -4,10 +4,12 @@ Tests for configuration loading and validation.
 
 import pytest
 import tempfile
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 from gitdoctor.config import (
     load_config,
+    clear_config_cache,
     ConfigError,
     AppConfig,
     GitLabConfig,
@@ -39,8 +41,11 @@ groups:
         assert config.gitlab.private_token == "test-token-123"
         assert config.gitlab.api_version == "v4"
         assert config.gitlab.verify_ssl is True
+        assert config.gitlab.rate_limit == 10.0
         assert config.scan.mode == "auto_discover"
-        assert config.groups.by_path == ["test-group"]
+        assert config.groups.by_path == ("test-group",)
+        assert config.jira is None
+        assert config.notifications is None
         
         Path(f.name).unlink()
 
@@ -67,7 +72,7 @@ projects:
         config = load_config(f.name)
         
         assert config.scan.mode == "explicit"
-        assert config.projects.by_id == [123, 456]
+        assert config.projects.by_id == (123, 456)
         
         Path(f.name).unlink()
 
@@ -81,6 +86,7 @@ gitlab:
   api_version: "v4"
   verify_ssl: false
   timeout_seconds: 30
+  rate_limit: 5
 
 scan:
   mode: "auto_discover"
@@ -115,22 +121,25 @@ filters:
         assert config.gitlab.base_url == "https://gitlab.example.com"
         assert config.gitlab.verify_ssl is False
         assert config.gitlab.timeout_seconds == 30
+        assert config.gitlab.rate_limit == 5
         
         # Test scan config
         assert config.scan.mode == "auto_discover"
         
         # Test projects
-        assert config.projects.by_id == [100]
-        assert config.projects.by_path == ["group/project1"]
+        assert config.projects.by_id == (100,)
+        assert config.projects.by_path == ("group/project1",)
         
         # Test groups
         assert config.groups.include_subgroups is False
-        assert config.groups.by_id == [50]
-        assert config.groups.by_path == ["test-group"]
+        assert config.groups.by_id == (50,)
+        assert config.groups.by_path == ("test-group",)
         
         # Test filters
         assert len(config.filters.include_project_paths) == 2
         assert len(config.filters.exclude_project_paths) == 1
+        assert config.filters.include_path_set == {"group/project1", "group/project2"}
+        assert config.filters.exclude_path_set == {"group/excluded-project"}
         
         Path(f.name).unlink()
 
@@ -288,3 +297,258 @@ gitlab:
         
         Path(f.name).unlink()
 
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path):
+    """Test that an unchanged config file is parsed once and reloaded after edits."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+groups:
+  by_path:
+    - "test-group"
+""")
+
+    first = load_config(config_file)
+    assert load_config(str(config_file)) is first
+
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+groups:
+  by_path:
+    - "test-group"
+    - "other-group"
+""")
+
+    reloaded = load_config(config_file)
+    assert reloaded is not first
+    assert reloaded.groups.by_path == ("test-group", "other-group")
+
+    clear_config_cache()
+    assert load_config(config_file) is not reloaded
+
+
+def test_cached_config_is_frozen(tmp_path):
+    """Test that a shared cached config can't be modified by one caller."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+groups:
+  by_path: ["test-group"]
+""")
+
+    config = load_config(config_file)
+    with pytest.raises(FrozenInstanceError):
+        config.gitlab.timeout_seconds = 60
+
+    assert load_config(config_file).gitlab.timeout_seconds == 15
+
+
+def test_missing_gitlab_section(tmp_path):
+    """Test that a config without a gitlab section fails before full parsing."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+scan:
+  mode: "explicit"
+
+projects:
+  by_id:
+    - 123
+  # unbalanced flow collection would fail YAML parsing
+  by_path: [
+""")
+
+    with pytest.raises(ConfigError, match="gitlab section is required"):
+        load_config(config_file)
+
+
+def test_duplicate_project_and_group_entries_removed(tmp_path):
+    """Test that repeated project/group entries are only kept once, in order."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+projects:
+  by_id: [3, 1, 3]
+  by_path: ["group/a", "group/b", "group/a"]
+
+groups:
+  by_path: ["test-group", "test-group"]
+""")
+
+    config = load_config(config_file)
+
+    assert config.projects.by_id == (3, 1)
+    assert config.projects.by_path == ("group/a", "group/b")
+    assert config.groups.by_path == ("test-group",)
+
+
+def test_optional_sections_loaded_when_present(tmp_path):
+    """Test that jira and notifications sections are parsed when configured."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+groups:
+  by_path: ["test-group"]
+
+jira:
+  base_url: "https://jira.example.com/"
+  project_key: "PROJ"
+
+notifications:
+  slack_webhook: "https://hooks.slack.com/services/T000/B000/XXX"
+""")
+
+    config = load_config(config_file)
+
+    assert config.jira.base_url == "https://jira.example.com"
+    assert config.jira.project_key == "PROJ"
+    assert config.notifications.slack_webhook == "https://hooks.slack.com/services/T000/B000/XXX"
+    assert config.notifications.teams_webhook is None
+
+
+def test_invalid_field_type(tmp_path):
+    """Test that fields of the wrong type are rejected with a clear error."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+groups:
+  by_path: "test-group"
+""")
+
+    with pytest.raises(ConfigError, match="groups.by_path has invalid type str"):
+        load_config(config_file)
+
+
+def test_null_fields_use_defaults(tmp_path):
+    """Test that null values in the YAML fall back to the field defaults."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+  api_version: null
+  verify_ssl: null
+  timeout_seconds: null
+
+scan:
+  mode: null
+
+groups:
+  include_subgroups: null
+  by_path: ["test-group"]
+""")
+
+    config = load_config(config_file)
+
+    assert config.scan.mode == "auto_discover"
+    assert config.gitlab.api_version == "v4"
+    assert config.gitlab.verify_ssl is True
+    assert config.gitlab.timeout_seconds == 15
+    assert config.groups.include_subgroups is True
+
+
+@pytest.mark.parametrize("field_name", ["timeout_seconds", "rate_limit"])
+def test_bool_rejected_for_numeric_fields(tmp_path, field_name):
+    """Test that true/false are not accepted where a number is expected."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(f"""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+  {field_name}: true
+
+groups:
+  by_path: ["test-group"]
+""")
+
+    with pytest.raises(ConfigError, match=f"gitlab.{field_name} has invalid type bool"):
+        load_config(config_file)
+
+
+def test_null_rate_limit_uses_default(tmp_path):
+    """Test that rate_limit: null is accepted and keeps the default rate."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+  rate_limit: null
+
+groups:
+  by_path: ["test-group"]
+""")
+
+    config = load_config(config_file)
+
+    assert config.gitlab.rate_limit == 10.0
+
+
+def test_negative_rate_limit_rejected(tmp_path):
+    """Test that a negative rate_limit is rejected."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+  rate_limit: -1
+
+groups:
+  by_path: ["test-group"]
+""")
+
+    with pytest.raises(ConfigError, match="gitlab.rate_limit must be zero or positive"):
+        load_config(config_file)
+
+
+@pytest.mark.parametrize("value, expected", [("0", 0), ("2.5", 2.5), ("null", 10.0)])
+def test_rate_limit_values(tmp_path, value, expected):
+    """Test that zero, custom and null rate limits load as expected."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(f"""
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+  rate_limit: {value}
+
+groups:
+  by_path: ["test-group"]
+""")
+
+    assert load_config(config_file).gitlab.rate_limit == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-16-le", "utf-16-be"])
+def test_load_utf16_config_with_bom(tmp_path, encoding):
+    """Test that UTF-16 configs with a byte-order mark are loaded."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_bytes("""\ufeff
+gitlab:
+  base_url: "https://gitlab.example.com"
+  private_token: "test-token"
+
+groups:
+  by_path: ["test-group"]
+""".encode(encoding))
+
+    config = load_config(config_file)
+
+    assert config.gitlab.base_url == "https://gitlab.example.com"
+    assert config.groups.by_path == ("test-group",)
@@ -0,0 +1,305 @@
+"""
+Tests for delta_exporter module.
+"""
+
+import csv
+import gzip
+import json
+
+import pytest
+
+from gitdoctor.delta_exporter import (
+    DeltaCSVExporter, DeltaJSONExporter, DeltaHTMLExporter,
+    MRCSVExporter, MRJSONExporter, MRHTMLExporter
+)
+from gitdoctor.jira_integration import JIRALinker
+from gitdoctor.models import DeltaResult, DeltaCommit, MRResult, MergeRequest
+
+
+@pytest.fixture
+def sample_deltas():
+    """Create one delta with commits and one that failed."""
+    return [
+        DeltaResult(
+            project_id=1,
+            project_name="project1",
+            project_path="group/project1",
+            project_web_url="https://gitlab.example.com/group/project1",
+            base_ref="v1.0.0",
+            target_ref="v1.1.0",
+            base_exists=True,
+            target_exists=True,
+            commits=[
+                DeltaCommit(
+                    commit_sha="abc123",
+                    short_id="abc123",
+                    title="PROJ-12 Feature A",
+                    message="Add feature A\n\nAlso fixes PROJ-3",
+                    author_name="John Doe",
+                    author_email="john@example.com",
+                    authored_date="2025-09-01T10:00:00Z",
+                    committed_date="2025-09-01T10:30:00Z",
+                    committer_name="John Doe",
+                    committer_email="john@example.com",
+                    web_url="https://gitlab.example.com/group/project1/commit/abc123",
+                    parent_ids=["parent1", "parent2"],
+                ),
+                DeltaCommit(
+                    commit_sha="def456",
+                    short_id="def456",
+                    title="Fix bug",
+                    message="Fix bug\r\nin parser",
+                    author_name="Jane Smith",
+                    author_email="jane@example.com",
+                    authored_date="2025-09-02T10:00:00Z",
+                    committed_date="2025-09-02T10:30:00Z",
+                    committer_name="Jane Smith",
+                    committer_email="jane@example.com",
+                    web_url="https://gitlab.example.com/group/project1/commit/def456",
+                ),
+            ],
+            total_commits=2,
+        ),
+        DeltaResult(
+            project_id=2,
+            project_name="project2",
+            project_path="group/project2",
+            project_web_url="https://gitlab.example.com/group/project2",
+            base_ref="v1.0.0",
+            target_ref="v1.1.0",
+            base_exists=False,
+            target_exists=True,
+            error="Base ref 'v1.0.0'\nnot found",
+        ),
+    ]
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return header, [dict(zip(header, row)) for row in reader]
+
+
+def test_csv_export_rows(sample_deltas, tmp_path):
+    """Test that commits and commit-less projects are exported one row each."""
+    output = tmp_path / "delta.csv"
+
+    DeltaCSVExporter().export(sample_deltas, str(output))
+
+    header, rows = _read_csv(output)
+    assert tuple(header) == DeltaCSVExporter.HEADERS
+    assert len(rows) == 3
+
+    first = rows[0]
+    assert first["project_path"] == "group/project1"
+    assert first["project_id"] == "1"
+    assert first["base_exists"] == "True"
+    assert first["commit_sha"] == "abc123"
+    assert first["message"] == "Add feature A Also fixes PROJ-3"
+    assert first["parent_shas"] == "parent1|parent2"
+    assert first["jira_tickets"] == ""
+    assert first["error"] == ""
+
+    assert rows[1]["message"] == "Fix bug in parser"
+    assert rows[1]["parent_shas"] == ""
+
+    empty = rows[2]
+    assert empty["project_path"] == "group/project2"
+    assert empty["commit_sha"] == ""
+    assert empty["jira_tickets"] == ""
+    assert empty["compare_timeout"] == "False"
+    assert empty["error"] == "Base ref 'v1.0.0' not found"
+
+
+def test_csv_export_with_jira_linker(sample_deltas, tmp_path):
+    """Test that JIRA tickets and their URLs are exported sorted."""
+    output = tmp_path / "delta.csv"
+    linker = JIRALinker("https://jira.example.com/")
+
+    DeltaCSVExporter().export(sample_deltas, str(output), jira_linker=linker)
+
+    _, rows = _read_csv(output)
+    assert rows[0]["jira_tickets"] == "PROJ-12|PROJ-3"
+    assert rows[0]["jira_ticket_urls"] == (
+        "https://jira.example.com/browse/PROJ-12|https://jira.example.com/browse/PROJ-3"
+    )
+    assert rows[1]["jira_tickets"] == ""
+
+
+def test_csv_export_gzip_suffix(sample_deltas, tmp_path):
+    """Test that a .gz output path is written gzip-compressed."""
+    plain = tmp_path / "delta.csv"
+    compressed = tmp_path / "delta.csv.gz"
+
+    DeltaCSVExporter().export(sample_deltas, str(plain))
+    DeltaCSVExporter().export(sample_deltas, str(compressed))
+
+    with gzip.open(compressed, 'rb') as f:
+        assert f.read() == plain.read_bytes()
+
+
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_json_export_matches_json_dump(sample_deltas, tmp_path, count):
+    """Test that the streamed JSON is identical to a single json.dump call."""
+    deltas = sample_deltas[:count]
+    output = tmp_path / "delta.json"
+
+    DeltaJSONExporter().export(deltas, str(output))
+
+    expected = json.dumps(
+        [DeltaJSONExporter._delta_to_dict(delta) for delta in deltas],
+        indent=2,
+        ensure_ascii=False,
+    )
+    assert output.read_text(encoding='utf-8') == expected
+    assert len(json.loads(expected)) == count
+
+
+def test_mr_json_export_matches_json_dump(tmp_path):
+    """Test that the streamed MR JSON is identical to a single json.dump call."""
+    results = [
+        MRResult(
+            project_id=1,
+            project_name="project1",
+            project_path="group/project1",
+            project_web_url="https://gitlab.example.com/group/project1",
+            target_branch="main",
+            merge_requests=[
+                MergeRequest(
+                    mr_id=10,
+                    mr_iid=1,
+                    title="PROJ-1 Add feature",
+                    description="Line one\nLine two",
+                    state="merged",
+                    source_branch="feature",
+                    target_branch="main",
+                    author_name="John Doe",
+                    author_username="jdoe",
+                    merged_by_name="Jane Smith",
+                    merged_by_username="jsmith",
+                    labels=["backend"],
+                ),
+            ],
+            total_mrs=1,
+        ),
+        MRResult(
+            project_id=2,
+            project_name="project2",
+            project_path="group/project2",
+            project_web_url="https://gitlab.example.com/group/project2",
+            error="Forbidden",
+        ),
+    ]
+    output = tmp_path / "mr.json"
+
+    MRJSONExporter().export(results, str(output))
+
+    expected = json.dumps(
+        [MRJSONExporter._result_to_dict(result) for result in results],
+        indent=2,
+        ensure_ascii=False,
+    )
+    assert output.read_text(encoding='utf-8') == expected
+    assert json.loads(expected)[0]["merge_requests"][0]["merged_by"]["username"] == "jsmith"
+
+
+def test_html_export_sections(sample_deltas, tmp_path):
+    """Test that the HTML report renders projects, authors and JIRA tickets."""
+    sample_deltas[0].commits[1].author_name = "Jane <Smith>"
+    output = tmp_path / "delta.html"
+    linker = JIRALinker("https://jira.example.com")
+
+    DeltaHTMLExporter().export(sample_deltas, str(output), jira_linker=linker)
+
+    html = output.read_text(encoding='utf-8')
+    assert html.startswith("<!DOCTYPE html>")
+    assert html.rstrip().endswith("</html>")
+    assert html.count('<div class="project-card ') == 2
+    assert html.count('<div class="author-card">') == 2
+    assert "Jane &lt;Smith&gt;" in html
+    assert '<div class="error-msg">⚠️ Base ref &#x27;v1.0.0&#x27;\nnot found</div>' in html
+    assert 'href="https://jira.example.com/browse/PROJ-12" class="ticket-badge"' in html
+    assert '<strong class="ticket-id">PROJ-3</strong>' in html
+
+
+def test_ticket_extraction_shared_across_exports(sample_deltas, tmp_path, monkeypatch):
+    """Test that each commit message is scanned once for CSV and HTML together."""
+    linker = JIRALinker("https://jira.example.com")
+    scanned = []
+    original = linker.extract_tickets_from_text
+    monkeypatch.setattr(
+        linker, "extract_tickets_from_text",
+        lambda text: scanned.append(text) or original(text)
+    )
+
+    DeltaCSVExporter().export(sample_deltas, str(tmp_path / "delta.csv"), jira_linker=linker)
+    DeltaHTMLExporter().export(sample_deltas, str(tmp_path / "delta.html"), jira_linker=linker)
+    linker.generate_ticket_summary(sample_deltas)
+
+    assert len(scanned) == 2
+    assert linker.get_commit_tickets(sample_deltas[0].commits[0]) == ("PROJ-12", "PROJ-3")
+
+
+def test_mr_ticket_extraction_shared_across_exports(tmp_path, monkeypatch):
+    """Test that each MR is scanned once for CSV and HTML together."""
+    results = [
+        MRResult(
+            project_id=1,
+            project_name="project1",
+            project_path="group/project1",
+            project_web_url="https://gitlab.example.com/group/project1",
+            merge_requests=[
+                MergeRequest(
+                    mr_id=10,
+                    mr_iid=1,
+                    title="PROJ-9 Add feature",
+                    description="Relates to PROJ-10",
+                    state="merged",
+                    source_branch="feature",
+                    target_branch="main",
+                    author_name="John Doe",
+                    author_username="jdoe",
+                ),
+            ],
+            total_mrs=1,
+        ),
+    ]
+    linker = JIRALinker("https://jira.example.com")
+    scanned = []
+    original = linker.extract_tickets_from_text
+    monkeypatch.setattr(
+        linker, "extract_tickets_from_text",
+        lambda text: scanned.append(text) or original(text)
+    )
+
+    MRCSVExporter().export(results, str(tmp_path / "mr.csv"), jira_linker=linker)
+    MRHTMLExporter().export(results, str(tmp_path / "mr.html"), jira_linker=linker)
+
+    assert len(scanned) == 1
+    _, rows = _read_csv(tmp_path / "mr.csv")
+    assert rows[0]["jira_tickets"] == "PROJ-10|PROJ-9"
+
+
+def test_ticket_extraction_with_project_key():
+    """Test that a project key keeps only that project's tickets, in any case."""
+    linker = JIRALinker("https://jira.example.com", project_key="mon")
+    text = "mon-1 XMON-2 MON-3 ABC-4 MON-5x MON-6-7"
+
+    assert linker.extract_tickets_from_text(text) == {"MON-1", "MON-3", "MON-6"}
+    assert JIRALinker("https://jira.example.com").extract_tickets_from_text(text) == {
+        "MON-1", "XMON-2", "MON-3", "ABC-4", "MON-6"
+    }
+
+
+def test_mr_tickets_not_shared_between_mrs_without_id():
+    """Test that MRs missing an ID don't reuse each other's cached tickets."""
+    linker = JIRALinker("https://jira.example.com")
+    first, second = (
+        MergeRequest.from_api_response({"iid": iid, "title": title})
+        for iid, title in ((1, "PROJ-1 First"), (2, "PROJ-2 Second"))
+    )
+
+    assert first.mr_id == second.mr_id == 0
+    assert linker.get_mr_tickets(first) == ("PROJ-1",)
+    assert linker.get_mr_tickets(second) == ("PROJ-2",)
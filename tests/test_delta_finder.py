@@ -16,6 +16,10 @@ from gitdoctor.api_client import GitLabNotFound, GitLabAPIError
 def mock_client():
     """Create a mock GitLab client."""
     client = Mock()
+    # Base SHAs are streamed from the same (mocked) commit listing
+    client.iter_commit_shas.side_effect = lambda project_id, ref_name: (
+        commit["id"] for commit in client.list_commits_from_ref(project_id, ref_name)
+    )
     return client
 
 
@@ -282,6 +286,35 @@ def test_delta_finder_with_date_filter(mock_client, sample_projects):
     assert delta.total_commits == 2  # Total before date filtering
 
 
+
+def test_delta_finder_with_date_range(mock_client, sample_projects):
+    """Test that both date bounds are inclusive and undated commits are kept."""
+    mock_client.get_tag.return_value = {"name": "v1.0.0"}
+    dates = {
+        "aaa111": "2025-08-31T23:59:59Z",
+        "bbb222": "2025-09-01T00:00:00Z",
+        "ccc333": "2025-09-30T00:00:00Z",
+        "ddd444": "2025-09-30T00:00:01Z",
+        "eee555": "",
+    }
+    
+    def mock_list_commits(project_id, ref_name):
+        if ref_name == "v2.0.0":
+            return [{"id": sha, "committed_date": date} for sha, date in dates.items()]
+        return []
+    
+    mock_client.list_commits_from_ref.side_effect = mock_list_commits
+    
+    finder = DeltaFinder(mock_client, [sample_projects[0]])
+    deltas = finder.find_deltas(
+        "v1.0.0",
+        "v2.0.0",
+        after_date="2025-09-01T00:00:00Z",
+        before_date="2025-09-30T00:00:00Z"
+    )
+    
+    assert [c.commit_sha for c in deltas[0].commits] == ["ccc333", "bbb222", "eee555"]
+
 def test_delta_finder_multiple_projects(mock_client, sample_projects):
     """Test finding deltas across multiple projects using set difference."""
     # Mock responses for both projects
@@ -339,6 +372,49 @@ def test_delta_finder_multiple_projects(mock_client, sample_projects):
     assert deltas[1].commits[0].commit_sha == "def456"
 
 
+
+def test_deltas_keep_project_order_when_parallel(mock_client):
+    """Test that concurrent comparisons return deltas in project order."""
+    projects = [
+        ProjectInfo(
+            id=i,
+            name=f"project{i}",
+            path_with_namespace=f"group/project{i}",
+            web_url=f"https://gitlab.example.com/group/project{i}"
+        )
+        for i in range(1, 21)
+    ]
+    
+    mock_client.get_tag.return_value = {"name": "v1.0.0"}
+    
+    def mock_list_commits(project_id, ref_name):
+        if ref_name == "v2.0.0":
+            return [{"id": f"sha{project_id}", "committed_date": "2025-09-01T10:00:00Z"}]
+        return []
+    
+    mock_client.list_commits_from_ref.side_effect = mock_list_commits
+    
+    finder = DeltaFinder(mock_client, projects, max_workers=4)
+    deltas = finder.find_deltas("v1.0.0", "v2.0.0")
+    
+    assert [d.project_id for d in deltas] == list(range(1, 21))
+    assert [d.commits[0].commit_sha for d in deltas] == [f"sha{i}" for i in range(1, 21)]
+
+
+def test_ref_kind_probed_first_in_later_projects(mock_client, sample_projects):
+    """Test that a ref found as a branch skips the tag probe in later projects."""
+    mock_client.get_tag.side_effect = GitLabNotFound("Tag not found")
+    mock_client.get_branch.return_value = {"name": "main"}
+    mock_client.list_commits_from_ref.return_value = []
+    
+    finder = DeltaFinder(mock_client, sample_projects, max_workers=1)
+    deltas = finder.find_deltas("main", "develop")
+    
+    assert all(d.base_exists and d.target_exists for d in deltas)
+    assert mock_client.get_tag.call_count == 2
+    assert mock_client.get_branch.call_count == 4
+    mock_client.get_commit.assert_not_called()
+
 def test_generate_summary(mock_client, sample_projects):
     """Test summary generation from delta results."""
     # Create mock deltas